@@ -1,4 +1,4 @@
-from typing import AsyncIterator
+from typing import AsyncIterator, Callable
 
 from aio_pika.abc import AbstractRobustConnection
 from fastapi import Depends, HTTPException, Request, Security, status
@@ -7,8 +7,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import AuthenticatedUser
 from app.core.security.keycloak import KeycloakAuthenticator
+from app.services.assignment_acks import AssignmentAckRegistry
 from app.services.db.postgres import PostgresManager
+from app.services.db.query_stats import set_query_budget
 from app.services.events import SSEManager
+from app.services.fleet_snapshot import FleetSnapshot
+from app.services.incident_situation import IncidentSituationProjection
 from app.services.messaging.rabbitmq import RabbitMQManager
 
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -20,6 +24,27 @@ async def get_postgres_session(request: Request) -> AsyncIterator[AsyncSession]:
         yield session
 
 
+async def get_postgres_read_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Session for read-only routes, served by the read replica when available."""
+    manager: PostgresManager = request.app.state.postgres
+    async for session in manager.get_read_session():
+        yield session
+
+
+def query_budget(max_queries: int) -> Callable[[], None]:
+    """
+    Route dependency declaring how many SQL statements a request may run.
+
+    Exceeding it logs `db.query_budget.exceeded`, or fails the request when
+    POSTGRES_QUERY_BUDGET_STRICT is enabled (as in the test suite).
+    """
+
+    def _declare_budget() -> None:
+        set_query_budget(max_queries)
+
+    return _declare_budget
+
+
 async def get_rabbitmq_connection(request: Request) -> AbstractRobustConnection:
     manager: RabbitMQManager = request.app.state.rabbitmq
     return await manager.get_connection()
@@ -35,6 +60,21 @@ def get_sse_manager(request: Request) -> SSEManager:
     return request.app.state.sse
 
 
+def get_assignment_acks(request: Request) -> AssignmentAckRegistry:
+    """Get the registry of vehicles awaited to acknowledge an assignment."""
+    return request.app.state.assignment_acks
+
+
+def get_situation_projection(request: Request) -> IncidentSituationProjection:
+    """Get the in-memory incident situation projection."""
+    return request.app.state.situations
+
+
+def get_fleet_snapshot(request: Request) -> FleetSnapshot:
+    """Get the in-memory QG fleet view."""
+    return request.app.state.fleet
+
+
 async def get_authenticator(request: Request) -> KeycloakAuthenticator:
     return request.app.state.authenticator
 
@@ -117,3 +157,16 @@ async def authorize_events(
         status_code=status.HTTP_403_FORBIDDEN,
         detail="Insufficient permissions",
     )
+
+
+async def authorize_diagnostics(
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> AuthenticatedUser:
+    """Restrict /health diagnostics (pool, SQL plans) to operators only."""
+    if _has_role(user, "qg-operator"):
+        return user
+
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Insufficient permissions",
+    )
@@ -0,0 +1,82 @@
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import get_logger
+from app.services.db.query_stats import QueryStats, track_queries
+
+log = get_logger(__name__)
+
+
+def _route_path(scope: Scope) -> str | None:
+    # Starlette stores the matched route in the scope once routing is done
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope.get("path")
+
+
+class QueryStatsMiddleware:
+    """
+    Count SQL statements and database time per HTTP request.
+
+    The `Server-Timing` header carries the totals known when the response
+    starts. Budget and N+1 checks run once the last body chunk is sent, so
+    statements executed while a `StreamingResponse` is iterated are counted
+    too; totals are then bound to the structlog context.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 5) -> None:
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            stats.route_resolver = lambda: _route_path(scope)
+            reported = False
+
+            async def send_with_stats(message: Message) -> None:
+                nonlocal reported
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries"',
+                    )
+                elif message["type"] == "http.response.body" and not message.get(
+                    "more_body", False
+                ):
+                    self._report(scope, stats)
+                    reported = True
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                # Response aborted (exception, client gone): still check budgets
+                if not reported:
+                    self._report(scope, stats)
+                structlog.contextvars.unbind_contextvars("db_queries", "db_ms", "route")
+
+    def _report(self, scope: Scope, stats: QueryStats) -> None:
+        structlog.contextvars.bind_contextvars(
+            db_queries=stats.count,
+            db_ms=round(stats.duration_ms, 1),
+            route=stats.route,
+        )
+
+        if stats.over_budget:
+            log.warning(
+                "db.query_budget.exceeded",
+                method=scope.get("method"),
+                budget=stats.budget,
+            )
+        for statement, count in stats.repeated_statements(self.n_plus_one_threshold):
+            log.warning(
+                "db.n_plus_one.suspected",
+                method=scope.get("method"),
+                executions=count,
+                statement=statement[:200],
+            )
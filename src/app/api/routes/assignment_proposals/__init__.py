@@ -2,15 +2,15 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.dependencies import get_postgres_session
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
 from app.api.routes.assignment_proposals.items import router as items_router
 from app.api.routes.assignment_proposals.missing import router as missing_router
-from app.api.routes.utils import fetch_one_or_404
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import (
     Incident,
     VehicleAssignmentProposal,
@@ -83,10 +83,11 @@ async def create_vehicle_assignment_proposal(
 
 @router.get("", response_model=list[VehicleAssignmentProposalRead])
 async def list_vehicle_assignment_proposals(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     incident_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleAssignmentProposal]:
     stmt = select(VehicleAssignmentProposal).options(
         selectinload(VehicleAssignmentProposal.items),
@@ -94,15 +95,20 @@ async def list_vehicle_assignment_proposals(
     )
     if incident_id:
         stmt = stmt.where(VehicleAssignmentProposal.incident_id == incident_id)
-    stmt = stmt.order_by(VehicleAssignmentProposal.generated_at.desc())
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (VehicleAssignmentProposal.generated_at, VehicleAssignmentProposal.proposal_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
+    )
 
 
 @router.get("/{proposal_id}", response_model=VehicleAssignmentProposalRead)
 async def get_vehicle_assignment_proposal(
-    proposal_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    proposal_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> VehicleAssignmentProposal:
     return await _fetch_proposal_or_404(session, proposal_id)
 
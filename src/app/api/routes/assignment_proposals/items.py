@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import (
     IncidentPhase,
     VehicleAssignmentProposal,
@@ -73,11 +73,12 @@ async def create_vehicle_assignment_proposal_item(
     response_model=list[VehicleAssignmentProposalItemRead],
 )
 async def list_vehicle_assignment_proposal_items(
+    response: Response,
     proposal_id: UUID,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     incident_phase_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleAssignmentProposalItem]:
     await fetch_one_or_404(
         session,
@@ -94,10 +95,18 @@ async def list_vehicle_assignment_proposal_items(
         stmt = stmt.where(
             VehicleAssignmentProposalItem.incident_phase_id == incident_phase_id
         )
-    stmt = stmt.order_by(VehicleAssignmentProposalItem.proposal_rank)
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (
+            VehicleAssignmentProposalItem.proposal_rank,
+            VehicleAssignmentProposalItem.incident_phase_id,
+            VehicleAssignmentProposalItem.vehicle_id,
+        ),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get(
@@ -108,7 +117,7 @@ async def get_vehicle_assignment_proposal_item(
     proposal_id: UUID,
     incident_phase_id: UUID,
     vehicle_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> VehicleAssignmentProposalItem:
     return await fetch_one_or_404(
         session,
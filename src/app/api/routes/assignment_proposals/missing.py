@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import (
     IncidentPhase,
     VehicleAssignmentProposal,
@@ -93,11 +93,12 @@ async def create_vehicle_assignment_proposal_missing(
     response_model=list[VehicleAssignmentProposalMissingRead],
 )
 async def list_vehicle_assignment_proposal_missing(
+    response: Response,
     proposal_id: UUID,
     incident_phase_id: UUID | None = Query(None),
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleAssignmentProposalMissing]:
     await fetch_one_or_404(
         session,
@@ -110,19 +111,21 @@ async def list_vehicle_assignment_proposal_missing(
     stmt = select(VehicleAssignmentProposalMissing).where(
         VehicleAssignmentProposalMissing.proposal_id == proposal_id
     )
-    if incident_phase_id is None:
-        stmt = stmt.order_by(
-            VehicleAssignmentProposalMissing.incident_phase_id,
-            VehicleAssignmentProposalMissing.vehicle_type_id,
-        )
-    else:
+    if incident_phase_id:
         stmt = stmt.where(
             VehicleAssignmentProposalMissing.incident_phase_id == incident_phase_id
         )
-        stmt = stmt.order_by(VehicleAssignmentProposalMissing.vehicle_type_id)
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (
+            VehicleAssignmentProposalMissing.incident_phase_id,
+            VehicleAssignmentProposalMissing.vehicle_type_id,
+        ),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get(
@@ -133,7 +136,7 @@ async def get_vehicle_assignment_proposal_missing(
     proposal_id: UUID,
     vehicle_type_id: UUID,
     incident_phase_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> VehicleAssignmentProposalMissing:
     return await fetch_one_or_404(
         session,
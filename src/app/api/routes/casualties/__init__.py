@@ -1,14 +1,14 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
 from app.api.routes.casualties.statuses import router as statuses_router
 from app.api.routes.casualties.transports import router as transports_router
 from app.api.routes.casualties.types import router as types_router
-from app.api.routes.utils import fetch_one_or_404
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import Casualty
 from app.schemas.casualties import CasualtyCreate, CasualtyRead, CasualtyUpdate
 
@@ -32,12 +32,13 @@ async def create_casualty(
 
 @router.get("", response_model=list[CasualtyRead])
 async def list_casualties(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     incident_phase_id: UUID | None = Query(None),
     casualty_type_id: UUID | None = Query(None),
     casualty_status_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[Casualty]:
     stmt = select(Casualty)
     if incident_phase_id:
@@ -46,14 +47,20 @@ async def list_casualties(
         stmt = stmt.where(Casualty.casualty_type_id == casualty_type_id)
     if casualty_status_id:
         stmt = stmt.where(Casualty.casualty_status_id == casualty_status_id)
-    stmt = stmt.order_by(Casualty.reported_at.desc()).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (Casualty.reported_at, Casualty.casualty_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
+    )
 
 
 @router.get("/{casualty_id}", response_model=CasualtyRead)
 async def get_casualty(
-    casualty_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    casualty_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> Casualty:
     return await fetch_one_or_404(
         session,
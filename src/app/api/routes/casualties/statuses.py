@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import CasualtyStatus
 from app.schemas.casualties import (
     CasualtyStatusCreate,
@@ -29,23 +29,24 @@ async def create_casualty_status(
 
 @router.get("", response_model=list[CasualtyStatusRead])
 async def list_casualty_statuses(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[CasualtyStatus]:
-    stmt = (
-        select(CasualtyStatus)
-        .order_by(CasualtyStatus.label)
-        .offset(offset)
-        .limit(limit)
+    return await paginate(
+        session,
+        select(CasualtyStatus),
+        (CasualtyStatus.label,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
     )
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 @router.get("/{casualty_status_id}", response_model=CasualtyStatusRead)
 async def get_casualty_status(
-    casualty_status_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    casualty_status_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> CasualtyStatus:
     return await fetch_one_or_404(
         session,
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import CasualtyTransport
 from app.schemas.casualties import (
     CasualtyTransportCreate,
@@ -34,11 +34,12 @@ async def create_casualty_transport(
 
 @router.get("", response_model=list[CasualtyTransportRead])
 async def list_casualty_transports(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     casualty_id: UUID | None = Query(None),
     vehicle_assignment_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[CasualtyTransport]:
     stmt = select(CasualtyTransport)
     if casualty_id:
@@ -47,15 +48,21 @@ async def list_casualty_transports(
         stmt = stmt.where(
             CasualtyTransport.vehicle_assignment_id == vehicle_assignment_id
         )
-    stmt = stmt.order_by(CasualtyTransport.picked_up_at.desc())
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (CasualtyTransport.picked_up_at, CasualtyTransport.casualty_transport_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
+    )
 
 
 @router.get("/{casualty_transport_id}", response_model=CasualtyTransportRead)
 async def get_casualty_transport(
-    casualty_transport_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    casualty_transport_id: UUID,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> CasualtyTransport:
     return await fetch_one_or_404(
         session,
@@ -1,5 +1,8 @@
-from fastapi import APIRouter
+from typing import Any
 
+from fastapi import APIRouter, Depends, Request
+
+from app.api.dependencies import authorize_diagnostics
 from app.core.config import settings
 
 router = APIRouter()
@@ -8,3 +11,28 @@ router = APIRouter()
 @router.get("/health", tags=["api"])
 async def healthcheck() -> dict[str, str]:
     return {"status": "ok", "version": settings.app.version}
+
+
+@router.get(
+    "/health/db-pool",
+    tags=["api"],
+    dependencies=[Depends(authorize_diagnostics)],
+)
+async def database_pool_status(request: Request) -> dict[str, Any]:
+    """Occupation et saturation du pool de connexions PostgreSQL."""
+    return request.app.state.postgres.pool_status()
+
+
+@router.get(
+    "/health/slow-queries",
+    tags=["api"],
+    dependencies=[Depends(authorize_diagnostics)],
+)
+async def slow_query_plans(request: Request) -> list[dict[str, Any]]:
+    """
+    Plans EXPLAIN capturés pour les requêtes lentes échantillonnées.
+
+    Le texte SQL et les plans contiennent les valeurs des paramètres :
+    réservé aux opérateurs.
+    """
+    return request.app.state.postgres.slow_query_log.plans()
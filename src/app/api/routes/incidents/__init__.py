@@ -1,10 +1,10 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
 from app.api.routes.incidents.phase import router as phase_router
 from app.api.routes.incidents.phases import router as phases_router
 from app.api.routes.incidents.reinforcement_vehicle_requests import (
@@ -17,7 +17,7 @@ from app.api.routes.incidents.vehicle_requirement_groups import (
 from app.api.routes.incidents.vehicle_requirements import (
     router as vehicle_requirements_router,
 )
-from app.api.routes.utils import fetch_one_or_404
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import Incident
 from app.schemas.incidents import IncidentCreate, IncidentRead, IncidentUpdate
 
@@ -44,12 +44,13 @@ async def create_incident(
 
 @router.get("", response_model=list[IncidentRead])
 async def list_incidents(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     created_by_operator_id: UUID | None = Query(None),
     city: str | None = Query(None),
     zipcode: str | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[Incident]:
     stmt = select(Incident)
     if created_by_operator_id:
@@ -58,14 +59,20 @@ async def list_incidents(
         stmt = stmt.where(Incident.city == city)
     if zipcode:
         stmt = stmt.where(Incident.zipcode == str(zipcode))
-    stmt = stmt.order_by(Incident.created_at.desc()).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (Incident.created_at, Incident.incident_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
+    )
 
 
 @router.get("/{incident_id}", response_model=IncidentRead)
 async def get_incident(
-    incident_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    incident_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> Incident:
     return await fetch_one_or_404(
         session,
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import PhaseCategory
 from app.schemas.incidents import (
     PhaseCategoryCreate,
@@ -34,20 +34,24 @@ async def create_phase_category(
 
 @router.get("", response_model=list[PhaseCategoryRead])
 async def list_phase_categories(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[PhaseCategory]:
-    stmt = (
-        select(PhaseCategory).order_by(PhaseCategory.code).offset(offset).limit(limit)
+    return await paginate(
+        session,
+        select(PhaseCategory),
+        (PhaseCategory.code,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
     )
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 @router.get("/{phase_category_id}", response_model=PhaseCategoryRead)
 async def get_phase_category(
-    phase_category_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    phase_category_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> PhaseCategory:
     return await fetch_one_or_404(
         session,
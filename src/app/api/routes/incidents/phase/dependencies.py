@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import IncidentPhaseDependency
 from app.models.enums import IncidentPhaseDependencyKind
 from app.schemas.incidents import (
@@ -35,12 +35,13 @@ async def create_incident_phase_dependency(
 
 @router.get("", response_model=list[IncidentPhaseDependencyRead])
 async def list_incident_phase_dependencies(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     incident_phase_id: UUID | None = Query(None),
     depends_on_incident_phase_id: UUID | None = Query(None),
     kind: IncidentPhaseDependencyKind | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[IncidentPhaseDependency]:
     stmt = select(IncidentPhaseDependency)
     if incident_phase_id:
@@ -54,15 +55,24 @@ async def list_incident_phase_dependencies(
         )
     if kind:
         stmt = stmt.where(IncidentPhaseDependency.kind == kind)
-    stmt = stmt.order_by(IncidentPhaseDependency.created_at.desc())
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (
+            IncidentPhaseDependency.created_at,
+            IncidentPhaseDependency.incident_phase_id,
+            IncidentPhaseDependency.depends_on_incident_phase_id,
+        ),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
+    )
 
 
 @router.get("/{dependency_id}", response_model=IncidentPhaseDependencyRead)
 async def get_incident_phase_dependency(
-    dependency_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    dependency_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> IncidentPhaseDependency:
     return await fetch_one_or_404(
         session,
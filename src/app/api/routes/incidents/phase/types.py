@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import PhaseType
 from app.schemas.incidents import PhaseTypeCreate, PhaseTypeRead, PhaseTypeUpdate
 
@@ -25,22 +25,23 @@ async def create_phase_type(
 
 @router.get("", response_model=list[PhaseTypeRead])
 async def list_phase_types(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     phase_category_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[PhaseType]:
     stmt = select(PhaseType)
     if phase_category_id:
         stmt = stmt.where(PhaseType.phase_category_id == phase_category_id)
-    stmt = stmt.order_by(PhaseType.code).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session, stmt, (PhaseType.code,), limit=limit, cursor=cursor, response=response
+    )
 
 
 @router.get("/{phase_type_id}", response_model=PhaseTypeRead)
 async def get_phase_type(
-    phase_type_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    phase_type_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> PhaseType:
     return await fetch_one_or_404(
         session,
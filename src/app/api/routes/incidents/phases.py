@@ -1,12 +1,12 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import IncidentPhase
 from app.schemas.incidents import (
     IncidentPhaseCreate,
@@ -31,11 +31,12 @@ async def create_incident_phase(
 
 @router.get("", response_model=list[IncidentPhaseRead])
 async def list_incident_phases(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     incident_id: UUID | None = Query(None),
     phase_type_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[IncidentPhase]:
     stmt = select(IncidentPhase).options(
         selectinload(IncidentPhase.phase_type), selectinload(IncidentPhase.incident)
@@ -44,14 +45,19 @@ async def list_incident_phases(
         stmt = stmt.where(IncidentPhase.incident_id == incident_id)
     if phase_type_id:
         stmt = stmt.where(IncidentPhase.phase_type_id == phase_type_id)
-    stmt = stmt.order_by(IncidentPhase.priority).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (IncidentPhase.priority, IncidentPhase.incident_phase_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get("/{incident_phase_id}", response_model=IncidentPhaseRead)
 async def get_incident_phase(
-    incident_phase_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    incident_phase_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> IncidentPhase:
     return await fetch_one_or_404(
         session,
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import ReinforcementVehicleRequest
 from app.schemas.incidents import (
     ReinforcementVehicleRequestCreate,
@@ -34,11 +34,12 @@ async def create_reinforcement_vehicle_request(
 
 @router.get("", response_model=list[ReinforcementVehicleRequestRead])
 async def list_reinforcement_vehicle_requests(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     reinforcement_id: UUID | None = Query(None),
     vehicle_type_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[ReinforcementVehicleRequest]:
     stmt = select(ReinforcementVehicleRequest)
     if reinforcement_id:
@@ -49,13 +50,17 @@ async def list_reinforcement_vehicle_requests(
         stmt = stmt.where(
             ReinforcementVehicleRequest.vehicle_type_id == vehicle_type_id
         )
-    stmt = stmt.order_by(
-        ReinforcementVehicleRequest.reinforcement_id,
-        ReinforcementVehicleRequest.vehicle_type_id,
+    return await paginate(
+        session,
+        stmt,
+        (
+            ReinforcementVehicleRequest.reinforcement_id,
+            ReinforcementVehicleRequest.vehicle_type_id,
+        ),
+        limit=limit,
+        cursor=cursor,
+        response=response,
     )
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 @router.get(
@@ -65,7 +70,7 @@ async def list_reinforcement_vehicle_requests(
 async def get_reinforcement_vehicle_request(
     reinforcement_id: UUID,
     vehicle_type_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> ReinforcementVehicleRequest:
     return await fetch_one_or_404(
         session,
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import Reinforcement
 from app.schemas.incidents import (
     ReinforcementCreate,
@@ -30,23 +30,30 @@ async def create_reinforcement(
 
 @router.get("", response_model=list[ReinforcementRead])
 async def list_reinforcements(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     incident_phase_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[Reinforcement]:
     stmt = select(Reinforcement)
     if incident_phase_id:
         stmt = stmt.where(Reinforcement.incident_phase_id == incident_phase_id)
-    stmt = stmt.order_by(Reinforcement.created_at.desc()).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (Reinforcement.created_at, Reinforcement.reinforcement_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
+    )
 
 
 @router.get("/{reinforcement_id}", response_model=ReinforcementRead)
 async def get_reinforcement(
     reinforcement_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> Reinforcement:
     return await fetch_one_or_404(
         session,
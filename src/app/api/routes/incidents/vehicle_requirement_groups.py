@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import PhaseTypeVehicleRequirementGroup
 from app.schemas.incidents import (
     PhaseTypeVehicleRequirementGroupCreate,
@@ -34,25 +34,33 @@ async def create_vehicle_requirement_group(
 
 @router.get("", response_model=list[PhaseTypeVehicleRequirementGroupRead])
 async def list_vehicle_requirement_groups(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     phase_type_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[PhaseTypeVehicleRequirementGroup]:
     stmt = select(PhaseTypeVehicleRequirementGroup)
     if phase_type_id:
         stmt = stmt.where(
             PhaseTypeVehicleRequirementGroup.phase_type_id == phase_type_id
         )
-    stmt = stmt.order_by(PhaseTypeVehicleRequirementGroup.priority)
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (
+            PhaseTypeVehicleRequirementGroup.priority,
+            PhaseTypeVehicleRequirementGroup.group_id,
+        ),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get("/{group_id}", response_model=PhaseTypeVehicleRequirementGroupRead)
 async def get_vehicle_requirement_group(
-    group_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    group_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> PhaseTypeVehicleRequirementGroup:
     return await fetch_one_or_404(
         session,
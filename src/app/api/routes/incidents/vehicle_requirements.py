@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import PhaseTypeVehicleRequirement
 from app.schemas.incidents import (
     PhaseTypeVehicleRequirementCreate,
@@ -34,11 +34,12 @@ async def create_vehicle_requirement(
 
 @router.get("", response_model=list[PhaseTypeVehicleRequirementRead])
 async def list_vehicle_requirements(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     group_id: UUID | None = Query(None),
     vehicle_type_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[PhaseTypeVehicleRequirement]:
     stmt = select(PhaseTypeVehicleRequirement)
     if group_id:
@@ -47,13 +48,17 @@ async def list_vehicle_requirements(
         stmt = stmt.where(
             PhaseTypeVehicleRequirement.vehicle_type_id == vehicle_type_id
         )
-    stmt = stmt.order_by(
-        PhaseTypeVehicleRequirement.group_id,
-        PhaseTypeVehicleRequirement.vehicle_type_id,
+    return await paginate(
+        session,
+        stmt,
+        (
+            PhaseTypeVehicleRequirement.group_id,
+            PhaseTypeVehicleRequirement.vehicle_type_id,
+        ),
+        limit=limit,
+        cursor=cursor,
+        response=response,
     )
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 @router.get(
@@ -63,7 +68,7 @@ async def list_vehicle_requirements(
 async def get_vehicle_requirement(
     group_id: UUID,
     vehicle_type_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> PhaseTypeVehicleRequirement:
     return await fetch_one_or_404(
         session,
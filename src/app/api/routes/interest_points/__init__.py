@@ -1,16 +1,16 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
 from app.api.routes.interest_points.consumable_types import (
     router as consumable_types_router,
 )
 from app.api.routes.interest_points.consumables import router as consumables_router
 from app.api.routes.interest_points.kinds import router as kinds_router
-from app.api.routes.utils import fetch_one_or_404
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import InterestPoint
 from app.schemas.interest_points import (
     InterestPointCreate,
@@ -41,12 +41,13 @@ async def create_interest_point(
 
 @router.get("", response_model=list[InterestPointRead])
 async def list_interest_points(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     city: str | None = Query(None),
     zipcode: str | None = Query(None),
     interest_point_kind_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[InterestPoint]:
     stmt = select(InterestPoint)
     if city:
@@ -57,14 +58,19 @@ async def list_interest_points(
         stmt = stmt.where(
             InterestPoint.interest_point_kind_id == interest_point_kind_id
         )
-    stmt = stmt.order_by(InterestPoint.name).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (InterestPoint.name, InterestPoint.interest_point_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get("/{interest_point_id}", response_model=InterestPointRead)
 async def get_interest_point(
-    interest_point_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    interest_point_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> InterestPoint:
     return await fetch_one_or_404(
         session,
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import InterestPointConsumableType
 from app.schemas.interest_points import (
     InterestPointConsumableTypeCreate,
@@ -36,16 +36,19 @@ async def create_interest_point_consumable_type(
 
 @router.get("/consumable-types", response_model=list[InterestPointConsumableTypeRead])
 async def list_interest_point_consumable_types(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[InterestPointConsumableType]:
-    stmt = select(InterestPointConsumableType).order_by(
-        InterestPointConsumableType.label
+    return await paginate(
+        session,
+        select(InterestPointConsumableType),
+        (InterestPointConsumableType.label,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
     )
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 @router.get(
@@ -53,7 +56,7 @@ async def list_interest_point_consumable_types(
     response_model=InterestPointConsumableTypeRead,
 )
 async def get_interest_point_consumable_type(
-    consumable_type_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    consumable_type_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> InterestPointConsumableType:
     return await fetch_one_or_404(
         session,
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import InterestPointConsumable
 from app.schemas.interest_points import (
     InterestPointConsumableCreate,
@@ -34,11 +34,12 @@ async def create_interest_point_consumable(
 
 @router.get("/consumables", response_model=list[InterestPointConsumableRead])
 async def list_interest_point_consumables(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     interest_point_id: UUID | None = Query(None),
     consumable_type_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[InterestPointConsumable]:
     stmt = select(InterestPointConsumable)
     if interest_point_id:
@@ -50,10 +51,19 @@ async def list_interest_point_consumables(
             InterestPointConsumable.interest_point_consumable_type_id
             == consumable_type_id
         )
-    stmt = stmt.order_by(InterestPointConsumable.last_update.desc())
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (
+            InterestPointConsumable.last_update,
+            InterestPointConsumable.interest_point_id,
+            InterestPointConsumable.interest_point_consumable_type_id,
+        ),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
+    )
 
 
 @router.get(
@@ -63,7 +73,7 @@ async def list_interest_point_consumables(
 async def get_interest_point_consumable(
     interest_point_id: UUID,
     consumable_type_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> InterestPointConsumable:
     return await fetch_one_or_404(
         session,
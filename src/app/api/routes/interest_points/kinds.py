@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import InterestPointKind
 from app.schemas.interest_points import (
     InterestPointKindCreate,
@@ -32,19 +32,25 @@ async def create_interest_point_kind(
 
 @router.get("", response_model=list[InterestPointKindRead])
 async def list_interest_point_kinds(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[InterestPointKind]:
-    stmt = select(InterestPointKind).order_by(InterestPointKind.label)
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        select(InterestPointKind),
+        (InterestPointKind.label,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get("/{interest_point_kind_id}", response_model=InterestPointKindRead)
 async def get_interest_point_kind(
-    interest_point_kind_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    interest_point_kind_id: UUID,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> InterestPointKind:
     return await fetch_one_or_404(
         session,
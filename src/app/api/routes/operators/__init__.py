@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import Operator
 from app.schemas.operators import OperatorCreate, OperatorRead, OperatorUpdate
 
@@ -25,22 +25,28 @@ async def create_operator(
 
 @router.get("", response_model=list[OperatorRead])
 async def list_operators(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     email: str | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[Operator]:
     stmt = select(Operator)
     if email:
         stmt = stmt.where(Operator.email == email)
-    stmt = stmt.order_by(Operator.email).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (Operator.email, Operator.operator_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get("/{operator_id}", response_model=OperatorRead)
 async def get_operator(
-    operator_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    operator_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> Operator:
     return await fetch_one_or_404(
         session,
@@ -11,7 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.dependencies import (
+    get_assignment_acks,
     get_current_user,
+    get_postgres_read_session,
     get_postgres_session,
     get_rabbitmq_manager,
     get_sse_manager,
@@ -32,6 +34,7 @@ from app.schemas.qg.assignment_proposals import (
     QGRejectProposalResponse,
     QGValidateProposalResponse,
 )
+from app.services.assignment_acks import AssignmentAckRegistry
 from app.services.assignment_proposals import (
     reject_assignment_proposal as reject_assignment_proposal_service,
 )
@@ -55,7 +58,7 @@ router = APIRouter(prefix="/assignment-proposals")
     response_model=QGAssignmentProposalsListRead,
 )
 async def list_assignment_proposals(
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> QGAssignmentProposalsListRead:
     """
     Liste toutes les propositions d'affectation de véhicules.
@@ -208,7 +211,7 @@ async def request_assignment_proposal(
 )
 async def get_assignment_proposal(
     proposal_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> QGAssignmentProposalRead:
     """
     Récupère le détail d'une proposition d'affectation.
@@ -261,17 +264,19 @@ async def validate_assignment_proposal(
     user: AuthenticatedUser = Depends(get_current_user),
     sse_manager: SSEManager = Depends(get_sse_manager),
     rabbitmq: RabbitMQManager = Depends(get_rabbitmq_manager),
+    acks: AssignmentAckRegistry = Depends(get_assignment_acks),
 ) -> QGValidateProposalResponse:
     """
     Valide une proposition d'affectation en créant les affectations pour tous les véhicules proposés.
 
     Envoie les événements d'affectation aux véhicules et attend que leur statut passe à "Engagé".
-    Réessaie jusqu'à 5 fois avec 1 seconde d'intervalle. Si un véhicule ne passe pas en "Engagé",
+    Réessaie jusqu'à 5 fois, après 1 seconde sans accusé. Si un véhicule ne passe pas en "Engagé",
     l'affectation est annulée et une erreur est retournée.
     """
     result = await validate_assignment_proposal_service(
         session=session,
         rabbitmq=rabbitmq,
+        acks=acks,
         sse_manager=sse_manager,
         proposal_id=proposal_id,
         operator_email=user.email,
@@ -0,0 +1,36 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_postgres_read_session, query_budget
+from app.schemas.qg.dashboard import QGDashboardRead
+from app.services.incident_dashboard import load_dashboard
+
+router = APIRouter(prefix="/dashboard")
+
+DASHBOARD_MAX_INCIDENTS = 500
+
+
+@router.get(
+    "",
+    response_model=QGDashboardRead,
+    dependencies=[Depends(query_budget(9))],
+)
+async def get_dashboard(
+    incident_ids: list[UUID] | None = Query(
+        None,
+        max_length=DASHBOARD_MAX_INCIDENTS,
+        description="Incidents to include (repeat the parameter); "
+        "all ongoing incidents when omitted",
+    ),
+    session: AsyncSession = Depends(get_postgres_read_session),
+) -> QGDashboardRead:
+    """
+    Tableau de bord : situation, engagements et victimes de plusieurs incidents.
+
+    Remplace les appels `/situation`, `/engagements` et `/casualties` par
+    incident : le nombre de requêtes SQL est constant, quel que soit le
+    nombre d'incidents.
+    """
+    return await load_dashboard(session, incident_ids)
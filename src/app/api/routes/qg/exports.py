@@ -0,0 +1,87 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_postgres_read_session, query_budget
+from app.services.exports import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    assignment_export,
+    incident_export,
+    position_log_export,
+    stream_export,
+)
+from app.services.incident_listing import IncidentListStatus
+
+router = APIRouter(prefix="/exports", dependencies=[Depends(query_budget(1))])
+
+FormatQuery = Query("ndjson", alias="format", description="`ndjson` or `csv`")
+SinceQuery = Query(None, description="Inclusive lower bound")
+UntilQuery = Query(None, description="Exclusive upper bound")
+
+
+def _export_response(
+    session: AsyncSession, stmt: Select, export_format: ExportFormat, name: str
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_export(session, stmt, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format}"'
+        },
+    )
+
+
+@router.get("/position-logs")
+async def export_position_logs(
+    vehicle_id: UUID | None = Query(None),
+    since: datetime | None = SinceQuery,
+    until: datetime | None = UntilQuery,
+    export_format: ExportFormat = FormatQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
+) -> StreamingResponse:
+    """Positions brutes des véhicules, par ordre chronologique, sans limite."""
+    return _export_response(
+        session,
+        position_log_export(vehicle_id, since, until),
+        export_format,
+        "position-logs",
+    )
+
+
+@router.get("/assignments")
+async def export_assignments(
+    vehicle_id: UUID | None = Query(None),
+    since: datetime | None = SinceQuery,
+    until: datetime | None = UntilQuery,
+    export_format: ExportFormat = FormatQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
+) -> StreamingResponse:
+    """Historique des affectations (bornes sur `assigned_at`), sans limite."""
+    return _export_response(
+        session,
+        assignment_export(vehicle_id, since, until),
+        export_format,
+        "assignments",
+    )
+
+
+@router.get("/incidents")
+async def export_incidents(
+    incident_status: IncidentListStatus | None = Query(None, alias="status"),
+    since: datetime | None = SinceQuery,
+    until: datetime | None = UntilQuery,
+    export_format: ExportFormat = FormatQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
+) -> StreamingResponse:
+    """Incidents (bornes sur `created_at`) ; `status=ENDED` pour les archives."""
+    return _export_response(
+        session,
+        incident_export(incident_status, since, until),
+        export_format,
+        "incidents",
+    )
@@ -5,69 +5,75 @@ import json
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import func, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.dependencies import (
     get_current_user,
+    get_postgres_read_session,
     get_postgres_session,
     get_rabbitmq_manager,
+    get_situation_projection,
     get_sse_manager,
+    query_budget,
+)
+from app.api.routes.utils import (
+    NEXT_CURSOR_HEADER,
+    CursorQuery,
+    decode_cursor,
+    encode_cursor,
+    etag_matches,
+    fetch_one_or_404,
+    keyset_predicate,
+    not_modified,
+    version_etag,
 )
-from app.api.routes.utils import fetch_one_or_404
 from app.core.security import AuthenticatedUser
 from app.models import (
-    Casualty,
-    CasualtyStatus,
     Incident,
     IncidentPhase,
     Operator,
     PhaseType,
     Reinforcement,
-    Vehicle,
-    VehicleAssignment,
 )
 from app.schemas.incidents import (
     IncidentDeclarationCreate,
-    IncidentRead,
     ReinforcementRead,
 )
 from app.schemas.qg.casualties import (
     QGCasualtiesRead,
-    QGCasualtyDetail,
-    QGCasualtyStats,
-    QGCasualtyStatusCount,
-    QGCasualtyStatusRef,
-    QGCasualtyTransportRead,
-    QGCasualtyTypeRef,
 )
-from app.schemas.qg.common import QGPhaseTypeRef, QGVehicleSummary, QGVehicleTypeRef
 from app.schemas.qg.engagements import (
     QGIncidentEngagementsRead,
-    QGVehicleAssignmentDetail,
-)
-from app.schemas.qg.incidents import QGIncidentPhaseCreate, QGIncidentRead
-from app.schemas.qg.situation import (
-    QGActivePhase,
-    QGCasualtiesSummary,
-    QGIncidentSituationRead,
-    QGIncidentSnapshot,
-    QGPhaseDependency,
-    QGResourcesByType,
-    QGResourcesSummary,
 )
-from app.schemas.qg.situation import (
-    QGCasualtyStatusCount as QGSituationCasualtyStatusCount,
+from app.schemas.qg.incidents import (
+    QGIncidentPhaseCreate,
+    QGIncidentRead,
+    QGIncidentSummaryRead,
 )
+from app.schemas.qg.situation import QGIncidentSituationRead
 from app.services.assignment_requests import (
     ASSIGNMENT_REQUEST_IN_PROGRESS_DETAIL,
     acquire_assignment_request_lock,
     release_assignment_request_lock_safely,
 )
 from app.services.events import Event, SSEManager
+from app.services.incident_dashboard import (
+    load_incident_casualties,
+    load_incident_engagements,
+)
+from app.services.incident_listing import (
+    INCIDENT_LIST_KEYS,
+    IncidentListStatus,
+    IncidentListView,
+    incident_page_statement,
+    stream_incidents_json,
+)
+from app.services.incident_situation import IncidentSituationProjection
 from app.services.messaging.queues import Queue
 from app.services.messaging.rabbitmq import RabbitMQManager
 from app.services.qg import QGService
@@ -385,139 +391,38 @@ async def request_assignment_for_incident(
 @router.get(
     "/{incident_id}/situation",
     response_model=QGIncidentSituationRead,
+    dependencies=[Depends(query_budget(5))],
 )
 async def get_incident_situation(
-    incident_id: UUID, session: AsyncSession = Depends(get_postgres_session)
-) -> QGIncidentSituationRead:
-    incident = await fetch_one_or_404(
-        session,
-        select(Incident).where(Incident.incident_id == incident_id),
-        "Incident not found",
-    )
-
-    phases_result = await session.execute(
-        select(IncidentPhase)
-        .options(
-            selectinload(IncidentPhase.phase_type),
-            selectinload(IncidentPhase.dependencies),
-        )
-        .where(
-            IncidentPhase.incident_id == incident_id,
-            IncidentPhase.ended_at.is_(None),
-        )
-        .order_by(IncidentPhase.priority.desc())
-    )
-    phases = phases_result.scalars().all()
-
-    phases_active: list[QGActivePhase] = []
-    for phase in phases:
-        phase_type = phase.phase_type
-        dependencies = [
-            QGPhaseDependency(
-                depends_on_incident_phase_id=dependency.depends_on_incident_phase_id,
-                kind=dependency.kind.value,
-            )
-            for dependency in phase.dependencies
-        ]
-        phases_active.append(
-            QGActivePhase(
-                incident_phase_id=phase.incident_phase_id,
-                incident_id=phase.incident_id,
-                phase_type_id=phase.phase_type_id,
-                phase_code=phase_type.code,
-                phase_label=phase_type.label,
-                priority=phase.priority,
-                started_at=phase.started_at,
-                ended_at=phase.ended_at,
-                dependencies=dependencies,
-            )
-        )
-
-    assignments_result = await session.execute(
-        select(VehicleAssignment)
-        .join(
-            IncidentPhase,
-            VehicleAssignment.incident_phase_id == IncidentPhase.incident_phase_id,
-        )
-        .options(
-            selectinload(VehicleAssignment.vehicle).selectinload(Vehicle.vehicle_type)
-        )
-        .where(IncidentPhase.incident_id == incident_id)
-    )
-    assignments = assignments_result.scalars().all()
-
-    vehicles_assigned = len(assignments)
-    vehicles_active = sum(
-        1 for assignment in assignments if assignment.unassigned_at is None
-    )
-
-    by_type_map: dict[UUID, QGResourcesByType] = {}
-    for assignment in assignments:
-        vehicle = assignment.vehicle
-        if not vehicle or not vehicle.vehicle_type:
-            continue
-        if assignment.unassigned_at is not None:
-            continue
-        vehicle_type = vehicle.vehicle_type
-        entry = by_type_map.get(vehicle_type.vehicle_type_id)
-        if entry is None:
-            entry = QGResourcesByType(
-                vehicle_type=QGVehicleTypeRef(
-                    vehicle_type_id=vehicle_type.vehicle_type_id,
-                    code=vehicle_type.code,
-                    label=vehicle_type.label,
-                ),
-                count=0,
-            )
-            by_type_map[vehicle_type.vehicle_type_id] = entry
-        entry.count += 1
+    incident_id: UUID,
+    request: Request,
+    response: Response,
+    situations: IncidentSituationProjection = Depends(get_situation_projection),
+) -> QGIncidentSituationRead | Response:
+    """
+    Situation d'un incident, servie par la projection en mémoire.
 
-    resources = QGResourcesSummary(
-        vehicles_assigned=vehicles_assigned,
-        vehicles_active=vehicles_active,
-        by_type=sorted(by_type_map.values(), key=lambda item: item.vehicle_type.code),
-    )
+    Une entrée absente est chargée sur le primaire, pas sur le réplica.
 
-    casualty_rows = await session.execute(
-        select(
-            Casualty.casualty_status_id,
-            CasualtyStatus.label,
-            func.count(Casualty.casualty_id),
-        )
-        .join(
-            CasualtyStatus,
-            Casualty.casualty_status_id == CasualtyStatus.casualty_status_id,
-        )
-        .join(
-            IncidentPhase,
-            Casualty.incident_phase_id == IncidentPhase.incident_phase_id,
-        )
-        .where(IncidentPhase.incident_id == incident_id)
-        .group_by(Casualty.casualty_status_id, CasualtyStatus.label)
-    )
+    Les changements sont poussés sur `/qg/live` en `incident_situation_update`.
+    L'ETag est la révision de l'entrée en mémoire (`If-None-Match` -> 304).
+    """
+    etag = situations.etag(incident_id)
+    if etag is not None and etag_matches(request, etag):
+        return not_modified(etag)
 
-    by_status = [
-        QGSituationCasualtyStatusCount(
-            casualty_status_id=row[0],
-            label=row[1],
-            count=row[2],
+    situation = await situations.get(incident_id)
+    if situation is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Incident not found"
         )
-        for row in casualty_rows
-    ]
-    casualties = QGCasualtiesSummary(
-        total=sum(status.count for status in by_status),
-        by_status=sorted(by_status, key=lambda item: item.label),
-    )
-
-    incident_data = IncidentRead.model_validate(incident).model_dump()
-    incident_data["status"] = QGService.get_incident_status(incident)
-
-    return QGIncidentSituationRead(
-        incident=QGIncidentSnapshot(**incident_data),
-        phases_active=phases_active,
-        resources=resources,
-        casualties=casualties,
-    )
+    etag = situations.etag(incident_id)
+    if etag is not None:
+        # Entrée rechargée mais inchangée : même révision
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+    return situation
 
 
 @router.get(
@@ -525,74 +430,15 @@ async def get_incident_situation(
     response_model=QGIncidentEngagementsRead,
 )
 async def list_incident_engagements(
-    incident_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    incident_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> QGIncidentEngagementsRead:
     await fetch_one_or_404(
         session,
         select(Incident).where(Incident.incident_id == incident_id),
         "Incident not found",
     )
-
-    assignments_result = await session.execute(
-        select(VehicleAssignment)
-        .join(
-            IncidentPhase,
-            VehicleAssignment.incident_phase_id == IncidentPhase.incident_phase_id,
-        )
-        .options(
-            selectinload(VehicleAssignment.vehicle).selectinload(Vehicle.vehicle_type),
-            selectinload(VehicleAssignment.incident_phase).selectinload(
-                IncidentPhase.phase_type
-            ),
-        )
-        .where(IncidentPhase.incident_id == incident_id)
-        .order_by(VehicleAssignment.assigned_at.desc())
-    )
-    assignments = assignments_result.scalars().all()
-
-    assignment_details: list[QGVehicleAssignmentDetail] = []
-    for assignment in assignments:
-        vehicle = assignment.vehicle
-        if not vehicle or not vehicle.vehicle_type:
-            continue
-        vehicle_type = vehicle.vehicle_type
-        phase_type = (
-            assignment.incident_phase.phase_type if assignment.incident_phase else None
-        )
-        assignment_details.append(
-            QGVehicleAssignmentDetail(
-                vehicle_assignment_id=assignment.vehicle_assignment_id,
-                vehicle_id=assignment.vehicle_id,
-                incident_phase_id=assignment.incident_phase_id,
-                assigned_at=assignment.assigned_at,
-                arrived_at=assignment.arrived_at,
-                validated_at=assignment.validated_at,
-                validated_by_operator_id=assignment.validated_by_operator_id,
-                unassigned_at=assignment.unassigned_at,
-                assigned_by_operator_id=assignment.assigned_by_operator_id,
-                vehicle=QGVehicleSummary(
-                    vehicle_id=vehicle.vehicle_id,
-                    immatriculation=vehicle.immatriculation,
-                    vehicle_type=QGVehicleTypeRef(
-                        vehicle_type_id=vehicle_type.vehicle_type_id,
-                        code=vehicle_type.code,
-                        label=vehicle_type.label,
-                    ),
-                ),
-                phase_type=QGPhaseTypeRef(
-                    phase_type_id=phase_type.phase_type_id,
-                    code=phase_type.code,
-                    label=phase_type.label,
-                )
-                if phase_type
-                else None,
-            )
-        )
-
-    return QGIncidentEngagementsRead(
-        incident_id=incident_id,
-        vehicle_assignments=assignment_details,
-    )
+    engagements = await load_incident_engagements(session, [incident_id])
+    return engagements[incident_id]
 
 
 @router.get(
@@ -600,96 +446,15 @@ async def list_incident_engagements(
     response_model=QGCasualtiesRead,
 )
 async def list_incident_casualties(
-    incident_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    incident_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> QGCasualtiesRead:
     await fetch_one_or_404(
         session,
         select(Incident).where(Incident.incident_id == incident_id),
         "Incident not found",
     )
-
-    casualties_result = await session.execute(
-        select(Casualty)
-        .join(
-            IncidentPhase,
-            Casualty.incident_phase_id == IncidentPhase.incident_phase_id,
-        )
-        .options(
-            selectinload(Casualty.casualty_type),
-            selectinload(Casualty.status),
-            selectinload(Casualty.transports),
-        )
-        .where(IncidentPhase.incident_id == incident_id)
-        .order_by(Casualty.reported_at.desc())
-    )
-    casualties = casualties_result.scalars().all()
-
-    casualty_details: list[QGCasualtyDetail] = []
-    status_counts: dict[UUID, QGCasualtyStatusCount] = {}
-
-    for casualty in casualties:
-        casualty_type = casualty.casualty_type
-        status = casualty.status
-
-        transports = sorted(
-            casualty.transports,
-            key=lambda transport: transport.picked_up_at
-            or datetime.min.replace(tzinfo=timezone.utc),
-        )
-        transport_payload = [
-            QGCasualtyTransportRead(
-                casualty_transport_id=transport.casualty_transport_id,
-                vehicle_assignment_id=transport.vehicle_assignment_id,
-                picked_up_at=transport.picked_up_at,
-                dropped_off_at=transport.dropped_off_at,
-                picked_up_latitude=transport.picked_up_latitude,
-                picked_up_longitude=transport.picked_up_longitude,
-                dropped_off_latitude=transport.dropped_off_latitude,
-                dropped_off_longitude=transport.dropped_off_longitude,
-                notes=transport.notes,
-            )
-            for transport in transports
-        ]
-
-        casualty_details.append(
-            QGCasualtyDetail(
-                casualty_id=casualty.casualty_id,
-                incident_phase_id=casualty.incident_phase_id,
-                casualty_type=QGCasualtyTypeRef(
-                    casualty_type_id=casualty_type.casualty_type_id,
-                    code=casualty_type.code,
-                    label=casualty_type.label,
-                ),
-                casualty_status=QGCasualtyStatusRef(
-                    casualty_status_id=status.casualty_status_id,
-                    label=status.label,
-                ),
-                reported_at=casualty.reported_at,
-                notes=casualty.notes,
-                transports=transport_payload,
-            )
-        )
-
-        status_entry = status_counts.get(status.casualty_status_id)
-        if status_entry is None:
-            status_entry = QGCasualtyStatusCount(
-                casualty_status_id=status.casualty_status_id,
-                label=status.label,
-                count=0,
-            )
-            status_counts[status.casualty_status_id] = status_entry
-        status_entry.count += 1
-
-    stats = QGCasualtyStats(
-        total=len(casualties),
-        by_status=sorted(status_counts.values(), key=lambda item: item.label),
-    )
-
-    return QGCasualtiesRead(
-        incident_id=incident_id,
-        casualties=casualty_details,
-        stats=stats,
-    )
+    casualties = await load_incident_casualties(session, [incident_id])
+    return casualties[incident_id]
 
 
 @router.post(
@@ -776,7 +541,7 @@ async def request_assignment_for_incident_phase(
 async def list_incident_phase_reinforcements(
     incident_id: UUID,
     phase_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[Reinforcement]:
     await fetch_one_or_404(
         session,
@@ -801,8 +566,23 @@ async def list_incident_phase_reinforcements(
 )
 async def get_incident_details(
     incident_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
-) -> QGIncidentRead:
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_postgres_read_session),
+) -> QGIncidentRead | Response:
+    # Requête conditionnelle : la version seule, avant de charger les phases
+    if request.headers.get("if-none-match"):
+        version = await session.scalar(
+            select(Incident.change_version).where(Incident.incident_id == incident_id)
+        )
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Incident not found"
+            )
+        etag = version_etag(version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
     incident = await fetch_one_or_404(
         session,
         select(Incident)
@@ -821,32 +601,52 @@ async def get_incident_details(
         incident.phases, key=lambda phase: phase.priority or 0, reverse=True
     )
 
+    response.headers["ETag"] = version_etag(incident.change_version)
     return QGIncidentRead.model_validate(incident)
 
 
 @router.get(
     "",
-    response_model=list[QGIncidentRead],
+    response_model=list[QGIncidentRead] | list[QGIncidentSummaryRead],
+    dependencies=[Depends(query_budget(2))],
 )
 async def list_incidents(
-    session: AsyncSession = Depends(get_postgres_session),
-) -> list[QGIncidentRead]:
-    incidents_result = await session.execute(
-        select(Incident)
-        .options(
-            selectinload(Incident.phases).options(
-                selectinload(IncidentPhase.phase_type),
-                selectinload(IncidentPhase.vehicle_assignments),
+    incident_status: IncidentListStatus | None = Query(None, alias="status"),
+    since: datetime | None = Query(
+        None, description="Only incidents created at or after this instant"
+    ),
+    limit: int = Query(500, ge=1, le=500),
+    cursor: str | None = CursorQuery,
+    view: IncidentListView = Query(
+        "full", description="`summary`: incident columns only, without phases"
+    ),
+    session: AsyncSession = Depends(get_postgres_read_session),
+) -> StreamingResponse:
+    """
+    Liste les incidents (plus récents d'abord) avec leurs phases et affectations.
+
+    Les lignes JSON sont construites par PostgreSQL puis diffusées telles
+    quelles ; la page suivante est indiquée par l'en-tête `X-Next-Cursor`.
+    `view=summary` omet les phases et affectations, qui ne sont alors pas lues.
+    """
+    page_stmt = incident_page_statement(incident_status, since, limit)
+    if cursor:
+        page_stmt = page_stmt.where(
+            keyset_predicate(
+                INCIDENT_LIST_KEYS,
+                decode_cursor(cursor, INCIDENT_LIST_KEYS),
+                descending=True,
             )
         )
-        .order_by(Incident.created_at.desc())
-    )
-    incidents = incidents_result.scalars().all()
+    page_keys = (await session.execute(page_stmt)).all()
 
-    # Sort phases by priority for each incident before serialization
-    for incident in incidents:
-        incident.phases = sorted(
-            incident.phases, key=lambda phase: phase.priority or 0, reverse=True
-        )
+    headers: dict[str, str] = {}
+    if len(page_keys) > limit:
+        page_keys = page_keys[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(list(page_keys[-1]))
 
-    return [QGIncidentRead.model_validate(incident) for incident in incidents]
+    return StreamingResponse(
+        stream_incidents_json(session, [row.incident_id for row in page_keys], view),
+        media_type="application/json",
+        headers=headers,
+    )
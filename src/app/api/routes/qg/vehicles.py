@@ -1,17 +1,21 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.dependencies import (
+    get_assignment_acks,
     get_current_user,
+    get_fleet_snapshot,
+    get_postgres_read_session,
     get_postgres_session,
     get_rabbitmq_manager,
     get_sse_manager,
+    query_budget,
 )
-from app.api.routes.utils import fetch_one_or_404
+from app.api.routes.utils import etag_matches, fetch_one_or_404, not_modified
 from app.core.logging import get_logger
 from app.core.security import AuthenticatedUser
 from app.models import (
@@ -19,20 +23,26 @@ from app.models import (
     Operator,
     Vehicle,
     VehicleAssignment,
-    VehicleAssignmentProposal,
-    VehicleAssignmentProposalItem,
 )
 from app.schemas.qg.common import QGPhaseTypeRef, QGVehicleSummary, QGVehicleTypeRef
 from app.schemas.qg.engagements import QGVehicleAssignmentDetail
-from app.schemas.qg.vehicles import QGVehicleAssignRequest, QGVehiclesListRead
+from app.schemas.qg.vehicles import (
+    QGVehicleAssignRequest,
+    QGVehicleNearbyRead,
+    QGVehiclesListRead,
+    QGVehiclesSummaryListRead,
+)
+from app.services.assignment_acks import AssignmentAckRegistry
 from app.services.events import Event, SSEManager
+from app.services.fleet_snapshot import FleetSnapshot
 from app.services.messaging.rabbitmq import RabbitMQManager
+from app.services.spatial import SpatialService
 from app.services.vehicle_assignments import (
     VehicleAssignmentTarget,
     build_assignment_event_payload,
     create_assignments_and_wait_for_ack,
 )
-from app.services.vehicles import VehicleService
+from app.services.vehicles import FleetView, VehicleService
 
 router = APIRouter(prefix="/vehicles")
 log = get_logger(__name__)
@@ -40,11 +50,25 @@ log = get_logger(__name__)
 
 @router.get(
     "",
-    response_model=QGVehiclesListRead,
+    response_model=QGVehiclesListRead | QGVehiclesSummaryListRead,
+    dependencies=[Depends(query_budget(7))],
 )
 async def list_all_vehicles(
-    session: AsyncSession = Depends(get_postgres_session),
-) -> QGVehiclesListRead:
+    request: Request,
+    since: int | None = Query(
+        None,
+        ge=0,
+        description="`version` of a previous response: only vehicles changed "
+        "since then, plus deleted vehicle ids",
+    ),
+    view: FleetView = Query(
+        "full",
+        description="`summary`: id, immatriculation, type, status and position "
+        "only, read without the other relations",
+    ),
+    session: AsyncSession = Depends(get_postgres_read_session),
+    fleet: FleetSnapshot = Depends(get_fleet_snapshot),
+) -> QGVehiclesListRead | QGVehiclesSummaryListRead | Response:
     """
     Liste tous les véhicules avec leurs informations complètes.
 
@@ -55,48 +79,69 @@ async def list_all_vehicles(
     - Stocks de consommables
     - Affectation active (si le véhicule est en mission)
     - Référencé dans une proposition d'affectation en attente
+    - Version de la dernière modification (`change_version`)
+
+    Avec `since`, seuls les véhicules modifiés depuis cette version sont
+    renvoyés, avec `deleted_vehicle_ids` ; `version` sert au prochain appel.
+
+    `view=summary` ne garde que l'identité, le type, le statut et la
+    position (affichage carte) : en base, ni stocks, ni affectations, ni
+    base ne sont lus.
+
+    La liste complète est servie depuis la vue en mémoire, déjà sérialisée,
+    avec un ETag (`If-None-Match` -> 304) ; la base n'est lue que pour un
+    delta ou si la vue n'est pas chargée.
     """
-    vehicle_service = VehicleService(session)
-
-    vehicles = await vehicle_service.fetch_all_vehicles_with_relations()
-
-    vehicle_ids = [vehicle.vehicle_id for vehicle in vehicles]
-    positions_map = await vehicle_service.fetch_latest_positions(vehicle_ids)
-    pending_proposal_vehicle_ids: set = set()
-    if vehicle_ids:
-        pending_result = await session.execute(
-            select(VehicleAssignmentProposalItem.vehicle_id)
-            .join(
-                VehicleAssignmentProposal,
-                VehicleAssignmentProposalItem.proposal_id
-                == VehicleAssignmentProposal.proposal_id,
-            )
-            .where(
-                VehicleAssignmentProposalItem.vehicle_id.in_(vehicle_ids),
-                VehicleAssignmentProposal.validated_at.is_(None),
-                VehicleAssignmentProposal.rejected_at.is_(None),
-            )
-            .distinct()
+    etag = fleet.etag(view) if since is None else None
+    if etag is not None:
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        return Response(
+            content=fleet.body(view),
+            media_type="application/json",
+            headers={"ETag": etag},
         )
-        pending_proposal_vehicle_ids = {
-            vehicle_id for (vehicle_id,) in pending_result.all()
-        }
-
-    vehicle_details = [
-        VehicleService.build_vehicle_detail(
-            vehicle,
-            positions_map.get(vehicle.vehicle_id),
-            referenced_in_pending_proposal=(
-                vehicle.vehicle_id in pending_proposal_vehicle_ids
-            ),
-        )
-        for vehicle in vehicles
-    ]
+    service = VehicleService(session)
+    if view == "summary":
+        return await service.fetch_fleet_summary(since)
+    return await service.fetch_fleet(since)
 
-    return QGVehiclesListRead(
-        vehicles=vehicle_details,
-        total=len(vehicle_details),
+
+@router.get(
+    "/nearby",
+    response_model=list[QGVehicleNearbyRead],
+    dependencies=[Depends(query_budget(1))],
+)
+async def list_vehicles_nearby(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_m: float = Query(5000, gt=0, le=100_000),
+    max_age_minutes: int = Query(
+        30,
+        ge=1,
+        le=1440,
+        description="Ignore les positions plus anciennes (borne les partitions lues)",
+    ),
+    session: AsyncSession = Depends(get_postgres_read_session),
+) -> list[QGVehicleNearbyRead]:
+    """
+    Véhicules dont la dernière position récente est dans le rayon, du plus
+    proche au plus loin.
+    """
+    since = datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes)
+    positions = await SpatialService(session).vehicles_within_radius(
+        latitude, longitude, radius_m, since
     )
+    return [
+        QGVehicleNearbyRead(
+            vehicle_id=position.vehicle_id,
+            latitude=position.latitude,
+            longitude=position.longitude,
+            timestamp=position.timestamp,
+            distance_m=distance_m,
+        )
+        for position, distance_m in positions
+    ]
 
 
 @router.get(
@@ -105,7 +150,7 @@ async def list_all_vehicles(
 )
 async def get_vehicle_assignment(
     immatriculation: str,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> QGVehicleAssignmentDetail:
     vehicle: Vehicle = await fetch_one_or_404(
         session,
@@ -184,7 +229,7 @@ async def get_vehicle_assignment(
 )
 async def list_vehicle_assignment_history(
     immatriculation: str,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[QGVehicleAssignmentDetail]:
     vehicle: Vehicle = await fetch_one_or_404(
         session,
@@ -269,6 +314,7 @@ async def assign_vehicle_to_incident_phase(
     user: AuthenticatedUser = Depends(get_current_user),
     sse_manager: SSEManager = Depends(get_sse_manager),
     rabbitmq: RabbitMQManager = Depends(get_rabbitmq_manager),
+    acks: AssignmentAckRegistry = Depends(get_assignment_acks),
 ) -> QGVehicleAssignmentDetail:
     """
     Assigne un vehicule a une phase d'incident.
@@ -346,6 +392,7 @@ async def assign_vehicle_to_incident_phase(
     engaged_assignments, failed_targets = await create_assignments_and_wait_for_ack(
         session=session,
         rabbitmq=rabbitmq,
+        acks=acks,
         assignments=[assignment],
         targets=targets,
         incident_latitude=incident_phase.incident.latitude,
@@ -353,7 +400,7 @@ async def assign_vehicle_to_incident_phase(
         engaged_status_label="Engagé",
         validated_by_operator_id=operator_id,
         max_attempts=max_attempts,
-        retry_delay_seconds=1.0,
+        ack_timeout_seconds=1.0,
     )
 
     if failed_targets or not engaged_assignments:
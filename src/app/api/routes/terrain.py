@@ -10,19 +10,77 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.routes.utils import (
+    etag_matches,
+    fetch_one_or_404,
+    not_modified,
+    version_etag,
+)
 from app.models import InterestPoint, InterestPointKind
-from app.schemas.interest_points import InterestPointRead
+from app.schemas.interest_points import InterestPointNearbyRead, InterestPointRead
+from app.services.spatial import SpatialService
 
 router = APIRouter(prefix="/terrain", tags=["terrain"])
 
 
+@router.get(
+    "/interest-points/nearby",
+    response_model=list[InterestPointNearbyRead],
+    summary="Liste les points d'intérêt les plus proches",
+    description="""
+    Récupère les points d'intérêt les plus proches d'une position, du plus
+    proche au plus loin, avec leur distance en mètres.
+    
+    Sans `radius_m`, renvoie les `limit` plus proches quelle que soit la
+    distance ; avec `radius_m`, seulement ceux situés dans ce rayon.
+    """,
+)
+async def list_nearby_interest_points(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_m: float | None = Query(None, gt=0, le=100_000),
+    kind_id: UUID | None = Query(None),
+    limit: int = Query(10, ge=1, le=100),
+    session: AsyncSession = Depends(get_postgres_session),
+) -> list[InterestPointNearbyRead]:
+    """
+    Retourne les points d'intérêt proches d'une position.
+
+    Les deux recherches passent par l'index GiST de `interest_points.geog` :
+    tri KNN (`<->`) sans rayon, filtre `ST_DWithin` avec rayon.
+
+    Args:
+        latitude: Latitude WGS84 de la position.
+        longitude: Longitude WGS84 de la position.
+        radius_m: Rayon de recherche optionnel, en mètres.
+        kind_id: Filtre optionnel sur le type de point d'intérêt.
+        limit: Nombre maximal de points renvoyés.
+        session: Session de base de données PostgreSQL.
+    """
+    spatial = SpatialService(session)
+    if radius_m is None:
+        points = await spatial.nearest_interest_points(
+            latitude, longitude, limit=limit, kind_id=kind_id
+        )
+    else:
+        points = await spatial.interest_points_within_radius(
+            latitude, longitude, radius_m, kind_id=kind_id, limit=limit
+        )
+    return [
+        InterestPointNearbyRead(
+            **InterestPointRead.model_validate(point).model_dump(),
+            distance_m=distance_m,
+        )
+        for point, distance_m in points
+    ]
+
+
 @router.get(
     "/interest-points/{kind_id}",
     response_model=list[InterestPointRead],
@@ -36,8 +94,10 @@ router = APIRouter(prefix="/terrain", tags=["terrain"])
 )
 async def list_interest_points_by_kind(
     kind_id: UUID,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_postgres_session),
-) -> list[InterestPoint]:
+) -> list[InterestPoint] | Response:
     """
     Retourne la liste des points d'intérêt filtrés par leur type (kind_id).
 
@@ -46,19 +106,25 @@ async def list_interest_points_by_kind(
         session: Session de base de données PostgreSQL.
 
     Returns:
-        Liste des points d'intérêt correspondant au type demandé.
+        Liste des points d'intérêt correspondant au type demandé, avec un
+        ETag tiré de la version du type (304 si `If-None-Match` correspond).
 
     Raises:
         HTTPException 404: Si le type de point d'intérêt n'existe pas.
     """
     # Vérifier que le type de point d'intérêt existe
-    await fetch_one_or_404(
+    kind = await fetch_one_or_404(
         session,
         select(InterestPointKind).where(
             InterestPointKind.interest_point_kind_id == kind_id
         ),
         "Interest point kind not found",
     )
+    # La version du type change avec chacun de ses points d'intérêt
+    etag = version_etag(kind.change_version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
     # Récupérer les points d'intérêt filtrés par kind_id
     result = await session.execute(
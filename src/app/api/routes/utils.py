@@ -1,5 +1,24 @@
-from fastapi import HTTPException, status
+import base64
+import binascii
+import enum
+import json
+from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Request, Response, status
+from sqlalchemy import Select, and_, false, or_, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CursorQuery = Query(
+    None,
+    description=f"Opaque cursor returned in the `{NEXT_CURSOR_HEADER}` header",
+)
 
 
 async def fetch_one_or_404(session: AsyncSession, stmt, detail: str):
@@ -9,3 +28,134 @@ async def fetch_one_or_404(session: AsyncSession, stmt, detail: str):
     if not obj:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
     return obj
+
+
+def version_etag(version: int) -> str:
+    """Strong ETag from a `change_version` column."""
+    return f'"{version}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether `If-None-Match` lists `etag` (weak comparison, RFC 9110)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _decode_value(key: InstrumentedAttribute, raw: Any) -> Any:
+    if raw is None:
+        return None
+    python_type = key.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    if python_type is date:
+        return date.fromisoformat(raw)
+    return python_type(raw)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_encode_value(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[InstrumentedAttribute]) -> list[Any]:
+    """Decode an opaque cursor into typed sort key values (400 if invalid)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(keys):
+            raise ValueError("cursor does not match sort keys")
+        return [_decode_value(key, value) for key, value in zip(keys, raw, strict=True)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def _is_nullable(key: InstrumentedAttribute) -> bool:
+    return getattr(key.expression, "nullable", True)
+
+
+def _after(key: InstrumentedAttribute, value: Any, descending: bool):
+    """Rows strictly after `value` on one key (Postgres sorts NULLs as largest)."""
+    if value is None:
+        return key.is_not(None) if descending else false()
+    if descending:
+        return key < value
+    if _is_nullable(key):
+        return or_(key > value, key.is_(None))
+    return key > value
+
+
+def keyset_predicate(
+    keys: Sequence[InstrumentedAttribute], values: Sequence[Any], descending: bool
+):
+    """WHERE clause selecting rows that sort after `values`."""
+    if not any(_is_nullable(key) for key in keys):
+        # Row-value comparison lets Postgres seek the composite index directly
+        if descending:
+            return tuple_(*keys) < tuple_(*values)
+        return tuple_(*keys) > tuple_(*values)
+
+    clauses = []
+    for position, (key, value) in enumerate(zip(keys, values, strict=True)):
+        equal_prefix = [
+            previous.is_(None) if previous_value is None else previous == previous_value
+            for previous, previous_value in zip(
+                keys[:position], values[:position], strict=True
+            )
+        ]
+        clauses.append(and_(true(), *equal_prefix, _after(key, value, descending)))
+    return or_(*clauses)
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    keys: Sequence[InstrumentedAttribute],
+    *,
+    limit: int,
+    cursor: str | None,
+    response: Response,
+    descending: bool = False,
+) -> list[Any]:
+    """
+    Keyset pagination over `keys` (the last key must make the order unique).
+
+    Returns one page of entities and sets the `X-Next-Cursor` response header
+    when more rows follow.
+    """
+    if cursor:
+        stmt = stmt.where(
+            keyset_predicate(keys, decode_cursor(cursor, keys), descending)
+        )
+    order_by = [key.desc() if descending else key.asc() for key in keys]
+    result = await session.execute(stmt.order_by(*order_by).limit(limit + 1))
+    items = list(result.scalars().all())
+
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(last, key.key) for key in keys]
+        )
+    return items
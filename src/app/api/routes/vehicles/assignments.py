@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import VehicleAssignment
 from app.schemas.vehicles import (
     VehicleAssignmentCreate,
@@ -34,24 +34,29 @@ async def create_vehicle_assignment(
 
 @router.get("", response_model=list[VehicleAssignmentRead])
 async def list_vehicle_assignments(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     vehicle_id: UUID | None = Query(None),
     active_only: bool = Query(
         False, description="If true, only return assignments without unassigned_at"
     ),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleAssignment]:
     stmt = select(VehicleAssignment)
     if vehicle_id:
         stmt = stmt.where(VehicleAssignment.vehicle_id == vehicle_id)
     if active_only:
         stmt = stmt.where(VehicleAssignment.unassigned_at.is_(None))
-    stmt = (
-        stmt.order_by(VehicleAssignment.assigned_at.desc()).offset(offset).limit(limit)
+    return await paginate(
+        session,
+        stmt,
+        (VehicleAssignment.assigned_at, VehicleAssignment.vehicle_assignment_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
     )
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 @router.get(
@@ -59,7 +64,8 @@ async def list_vehicle_assignments(
     response_model=VehicleAssignmentRead,
 )
 async def get_vehicle_assignment(
-    vehicle_assignment_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    vehicle_assignment_id: UUID,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> VehicleAssignment:
     return await fetch_one_or_404(
         session,
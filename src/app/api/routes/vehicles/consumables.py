@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import (
     VehicleConsumableStock,
     VehicleConsumableType,
@@ -49,18 +49,19 @@ async def create_vehicle_consumable_type(
     response_model=list[VehicleConsumableTypeRead],
 )
 async def list_vehicle_consumable_types(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleConsumableType]:
-    stmt = (
-        select(VehicleConsumableType)
-        .order_by(VehicleConsumableType.label)
-        .offset(offset)
-        .limit(limit)
+    return await paginate(
+        session,
+        select(VehicleConsumableType),
+        (VehicleConsumableType.label,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
     )
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 @types_router.get(
@@ -68,7 +69,7 @@ async def list_vehicle_consumable_types(
     response_model=VehicleConsumableTypeRead,
 )
 async def get_vehicle_consumable_type(
-    consumable_type_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    consumable_type_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> VehicleConsumableType:
     return await fetch_one_or_404(
         session,
@@ -142,11 +143,12 @@ async def create_vehicle_consumable_stock(
     response_model=list[VehicleConsumableStockRead],
 )
 async def list_vehicle_consumable_stock(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     vehicle_id: UUID | None = Query(None),
     consumable_type_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleConsumableStock]:
     stmt = select(VehicleConsumableStock)
     if vehicle_id:
@@ -155,9 +157,14 @@ async def list_vehicle_consumable_stock(
         stmt = stmt.where(
             VehicleConsumableStock.consumable_type_id == consumable_type_id
         )
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (VehicleConsumableStock.vehicle_id, VehicleConsumableStock.consumable_type_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @stock_router.get(
@@ -167,7 +174,7 @@ async def list_vehicle_consumable_stock(
 async def get_vehicle_consumable_stock(
     vehicle_id: UUID,
     consumable_type_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> VehicleConsumableStock:
     return await fetch_one_or_404(
         session,
@@ -247,11 +254,12 @@ async def create_vehicle_type_consumable_spec(
     response_model=list[VehicleTypeConsumableSpecRead],
 )
 async def list_vehicle_type_consumable_specs(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     vehicle_type_id: UUID | None = Query(None),
     consumable_type_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleTypeConsumableSpec]:
     stmt = select(VehicleTypeConsumableSpec)
     if vehicle_type_id:
@@ -260,9 +268,17 @@ async def list_vehicle_type_consumable_specs(
         stmt = stmt.where(
             VehicleTypeConsumableSpec.consumable_type_id == consumable_type_id
         )
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (
+            VehicleTypeConsumableSpec.vehicle_type_id,
+            VehicleTypeConsumableSpec.consumable_type_id,
+        ),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @specs_router.get(
@@ -272,7 +288,7 @@ async def list_vehicle_type_consumable_specs(
 async def get_vehicle_type_consumable_spec(
     vehicle_type_id: UUID,
     consumable_type_id: UUID,
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> VehicleTypeConsumableSpec:
     return await fetch_one_or_404(
         session,
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import Energy
 from app.schemas.vehicles import EnergyCreate, EnergyRead, EnergyUpdate
 
@@ -25,18 +25,24 @@ async def create_energy(
 
 @router.get("", response_model=list[EnergyRead])
 async def list_energies(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[Energy]:
-    stmt = select(Energy).order_by(Energy.label).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        select(Energy),
+        (Energy.label,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get("/{energy_id}", response_model=EnergyRead)
 async def get_energy(
-    energy_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    energy_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> Energy:
     return await fetch_one_or_404(
         session, select(Energy).where(Energy.energy_id == energy_id), "Energy not found"
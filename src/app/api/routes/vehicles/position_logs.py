@@ -1,10 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, paginate
 from app.models import VehiclePositionLog
 from app.schemas.vehicles import VehiclePositionLogCreate, VehiclePositionLogRead
 
@@ -29,16 +30,21 @@ async def create_vehicle_position_log(
 
 @router.get("", response_model=list[VehiclePositionLogRead])
 async def list_vehicle_position_logs(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     vehicle_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehiclePositionLog]:
     stmt = select(VehiclePositionLog)
     if vehicle_id:
         stmt = stmt.where(VehiclePositionLog.vehicle_id == vehicle_id)
-    stmt = (
-        stmt.order_by(VehiclePositionLog.timestamp.desc()).offset(offset).limit(limit)
+    return await paginate(
+        session,
+        stmt,
+        (VehiclePositionLog.timestamp, VehiclePositionLog.vehicle_position_id),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+        descending=True,
     )
-    result = await session.execute(stmt)
-    return result.scalars().all()
@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import VehicleType
 from app.schemas.vehicles import VehicleTypeCreate, VehicleTypeRead, VehicleTypeUpdate
 
@@ -29,18 +29,24 @@ async def create_vehicle_type(
 
 @router.get("", response_model=list[VehicleTypeRead])
 async def list_vehicle_types(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleType]:
-    stmt = select(VehicleType).order_by(VehicleType.label).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        select(VehicleType),
+        (VehicleType.label,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get("/{vehicle_type_id}", response_model=VehicleTypeRead)
 async def get_vehicle_type(
-    vehicle_type_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    vehicle_type_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> VehicleType:
     return await fetch_one_or_404(
         session,
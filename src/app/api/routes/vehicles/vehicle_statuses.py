@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
-from app.api.routes.utils import fetch_one_or_404
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, fetch_one_or_404, paginate
 from app.models import VehicleStatus
 from app.schemas.vehicles import (
     VehicleStatusCreate,
@@ -33,20 +33,24 @@ async def create_vehicle_status(
 
 @router.get("", response_model=list[VehicleStatusRead])
 async def list_vehicle_statuses(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    session: AsyncSession = Depends(get_postgres_session),
+    cursor: str | None = CursorQuery,
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[VehicleStatus]:
-    stmt = (
-        select(VehicleStatus).order_by(VehicleStatus.label).offset(offset).limit(limit)
+    return await paginate(
+        session,
+        select(VehicleStatus),
+        (VehicleStatus.label,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
     )
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 @router.get("/{vehicle_status_id}", response_model=VehicleStatusRead)
 async def get_vehicle_status(
-    vehicle_status_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    vehicle_status_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> VehicleStatus:
     return await fetch_one_or_404(
         session,
@@ -1,10 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_postgres_session
+from app.api.dependencies import get_postgres_read_session, get_postgres_session
+from app.api.routes.utils import CursorQuery, paginate
 from app.api.routes.vehicles.utils import fetch_one_or_404
 from app.models import Vehicle
 from app.schemas.vehicles import VehicleCreate, VehicleRead, VehicleUpdate
@@ -25,25 +26,31 @@ async def create_vehicle(
 
 @router.get("/", response_model=list[VehicleRead])
 async def list_vehicles(
+    response: Response,
     limit: int = Query(500, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = CursorQuery,
     vehicle_type_id: UUID | None = Query(None),
     status_id: UUID | None = Query(None),
-    session: AsyncSession = Depends(get_postgres_session),
+    session: AsyncSession = Depends(get_postgres_read_session),
 ) -> list[Vehicle]:
     stmt = select(Vehicle)
     if vehicle_type_id:
         stmt = stmt.where(Vehicle.vehicle_type_id == vehicle_type_id)
     if status_id:
         stmt = stmt.where(Vehicle.status_id == status_id)
-    stmt = stmt.order_by(Vehicle.immatriculation).offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    return await paginate(
+        session,
+        stmt,
+        (Vehicle.immatriculation,),
+        limit=limit,
+        cursor=cursor,
+        response=response,
+    )
 
 
 @router.get("/{vehicle_id}", response_model=VehicleRead)
 async def get_vehicle(
-    vehicle_id: UUID, session: AsyncSession = Depends(get_postgres_session)
+    vehicle_id: UUID, session: AsyncSession = Depends(get_postgres_read_session)
 ) -> Vehicle:
     return await fetch_one_or_404(
         session,
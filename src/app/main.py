@@ -4,15 +4,22 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
+from app.api.middleware import QueryStatsMiddleware
 from app.api.routes import router as api_router
+from app.api.routes.utils import NEXT_CURSOR_HEADER
 from app.core.config import settings
 from app.core.exceptions import register_exception_handlers
 from app.core.logging import configure_logging, get_logger
 from app.core.security import KeycloakAuthenticator, KeycloakConfig
+from app.services.assignment_acks import AssignmentAckRegistry
 from app.services.db.postgres import PostgresManager
 from app.services.events import SSEManager
+from app.services.fleet_snapshot import FleetSnapshot
+from app.services.incident_situation import IncidentSituationProjection
 from app.services.messaging.rabbitmq import RabbitMQManager
 from app.services.messaging.subscriptions import ApplicationSubscriptions
+from app.services.position_logs import PositionLogMaintenance
+from app.services.scheduler import JobScheduler
 
 configure_logging()
 log = get_logger(__name__).bind(app=settings.app.name)
@@ -30,24 +37,59 @@ async def lifespan(app: FastAPI):
         queue_size=settings.app.events_queue_size,
         queue_overflow_strategy=settings.app.events_queue_overflow_strategy,
     )
+    app.state.assignment_acks = AssignmentAckRegistry(app.state.sse)
+    app.state.scheduler = JobScheduler(
+        app.state.postgres,
+        poll_interval_seconds=settings.app.scheduler_poll_interval_seconds,
+    )
     app.state.subscriptions = ApplicationSubscriptions(
         app.state.rabbitmq,
         app.state.postgres,
         app.state.sse,
+        app.state.assignment_acks,
+        app.state.scheduler,
+    )
+    app.state.situations = IncidentSituationProjection(
+        app.state.postgres,
+        app.state.sse,
+        max_age_seconds=settings.app.situation_max_age_seconds,
+    )
+    app.state.fleet = FleetSnapshot(
+        app.state.postgres,
+        app.state.sse,
+        refresh_interval_seconds=settings.app.fleet_snapshot_refresh_seconds,
+        reconcile_interval_seconds=settings.app.fleet_snapshot_reconcile_seconds,
+    )
+    app.state.position_logs_maintenance = PositionLogMaintenance(
+        app.state.postgres, settings.database
     )
 
     await app.state.postgres.connect()
     log.info("postgres.connected")
+    if settings.database.apply_migrations:
+        applied = await app.state.postgres.migrate()
+        log.info("postgres.migrations.ready", applied=applied)
+    await app.state.position_logs_maintenance.start()
+    log.info("postgres.position_logs.maintenance.ready")
     await app.state.rabbitmq.connect()
     log.info("rabbitmq.connected")
+    await app.state.assignment_acks.start()
     await app.state.subscriptions.start()
     log.info("rabbitmq.subscriptions.ready")
+    await app.state.scheduler.start()
+    await app.state.situations.start()
+    await app.state.fleet.start()
 
     log.info("startup.complete", env=settings.app.environment)
     try:
         yield
     finally:
+        await app.state.scheduler.stop()
         await app.state.subscriptions.stop()
+        await app.state.assignment_acks.stop()
+        await app.state.situations.stop()
+        await app.state.fleet.stop()
+        await app.state.position_logs_maintenance.stop()
         await app.state.sse.disconnect_all()
         await app.state.rabbitmq.close()
         await app.state.postgres.close()
@@ -73,6 +115,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "Server-Timing"],
+)
+app.add_middleware(
+    QueryStatsMiddleware,
+    n_plus_one_threshold=settings.database.n_plus_one_threshold,
 )
 
 app.include_router(api_router)
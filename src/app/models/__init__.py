@@ -35,12 +35,15 @@ from app.models.interest_points import (
     InterestPointKind,
 )
 from app.models.operators import Operator
+from app.models.scheduled_jobs import ScheduledJob
 from app.models.vehicles import (
     Energy,
     Vehicle,
     VehicleAssignment,
     VehiclePositionLog,
+    VehiclePositionRollup,
     VehicleStatus,
+    VehicleTombstone,
     VehicleType,
 )
 
@@ -72,13 +75,19 @@ __all__ = [
     "PhaseTypeVehicleRequirementGroup",
     "Reinforcement",
     "ReinforcementVehicleRequest",
+    "ScheduledJob",
     "Vehicle",
     "VehicleAssignment",
     "VehicleConsumableStock",
     "VehicleConsumableType",
     "VehiclePositionLog",
+    "VehiclePositionRollup",
     "VehicleRequirementRule",
     "VehicleStatus",
+    "VehicleTombstone",
     "VehicleType",
     "VehicleTypeConsumableSpec",
 ]
+
+# Registers the change version triggers on Base.metadata
+from app.models import change_versions  # noqa: E402, F401
@@ -1,8 +1,19 @@
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, func
+from geoalchemy2 import Geography
+from sqlalchemy import BigInteger, Computed, DateTime, FetchedValue, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# WGS84 point built from the plain latitude/longitude columns of the table
+GEOGRAPHY_POINT_EXPRESSION = (
+    "(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326))::geography"
+)
+
+# 64-bit id of the current transaction, used as a change version: it only
+# grows, and every transaction below the snapshot xmin has finished
+CURRENT_CHANGE_VERSION = "(pg_current_xact_id()::text)::bigint"
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -28,3 +39,34 @@ class CreatedAtMixin:
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+
+
+def geography_point_column() -> Mapped[Any]:
+    """
+    Generated `geography(Point, 4326)` column mirroring latitude/longitude.
+
+    Deferred so regular ORM loads do not fetch it; spatial queries use it
+    through `app.services.spatial`. The GiST index is declared by each model.
+    """
+    return mapped_column(
+        Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+        Computed(GEOGRAPHY_POINT_EXPRESSION, persisted=True),
+        nullable=True,
+        deferred=True,
+    )
+
+
+def change_version_column() -> Mapped[int]:
+    """
+    Id of the last transaction that changed the row or what it aggregates.
+
+    Kept current by triggers (see `app.models.change_versions`); models using
+    it set `eager_defaults` so the trigger-set value comes back by RETURNING
+    instead of being expired after each flush.
+    """
+    return mapped_column(
+        BigInteger,
+        server_default=text(CURRENT_CHANGE_VERSION),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
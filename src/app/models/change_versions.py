@@ -0,0 +1,293 @@
+"""
+Triggers maintaining the `change_version` columns.
+
+A version is the id of the last transaction that changed the row or anything
+it aggregates:
+
+- `vehicles`: what the QG fleet view shows for the vehicle (stocks,
+  assignments, pending proposals, referenced labels). Positions are left
+  out: touching the vehicle row for every position would rewrite it (never
+  a HOT update, `change_version` is indexed) and serialize telemetry batches
+  on its row lock. Fleet deltas bound positions by timestamp instead. Deleted
+  vehicles leave a row in `vehicle_tombstones`. Transaction ids only grow and
+  every transaction below the snapshot xmin has finished, so "versions >= xmin
+  of the previous read" never misses a change committed out of order.
+- `incidents`: the incident, its phases, their types and assignments.
+- `interest_point_kinds`: the kind and the interest points listed under it.
+
+Versions are cheap to read before loading a resource, hence used as ETags.
+
+Created after the tables by `Base.metadata.create_all`, and on existing
+databases by the startup migrations (`app.services.db.migrations`);
+statements are idempotent so running them again is safe.
+"""
+
+from sqlalchemy import DDL, event
+
+from app.models.base import CURRENT_CHANGE_VERSION, Base
+
+# Tables whose rows carry a vehicle_id shown in the fleet view
+_VEHICLE_CHILD_TABLES = (
+    "vehicle_consumables_stock",
+    "vehicle_assignments",
+    "vehicle_assignment_proposal_items",
+)
+# Reference tables whose labels are embedded in the fleet view
+_VEHICLE_REFERENCE_TABLES = (
+    "vehicle_types",
+    "energies",
+    "vehicle_status",
+    "interest_points",
+    "vehicle_consumable_types",
+)
+
+_FUNCTIONS = (
+    f"""
+    CREATE OR REPLACE FUNCTION set_change_version() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.change_version := {CURRENT_CHANGE_VERSION};
+        RETURN NEW;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION vehicles_set_change_version() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.change_version := {CURRENT_CHANGE_VERSION};
+        IF TG_OP = 'INSERT' THEN
+            DELETE FROM vehicle_tombstones WHERE vehicle_id = NEW.vehicle_id;
+        END IF;
+        RETURN NEW;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION vehicles_record_tombstone() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO vehicle_tombstones (vehicle_id, change_version)
+        VALUES (OLD.vehicle_id, {CURRENT_CHANGE_VERSION})
+        ON CONFLICT (vehicle_id) DO UPDATE
+        SET change_version = EXCLUDED.change_version, deleted_at = now();
+        RETURN NULL;
+    END
+    $$
+    """,
+    # The `<>` guard skips vehicles already touched by the same transaction
+    # (e.g. several positions of one vehicle in a telemetry batch)
+    f"""
+    CREATE OR REPLACE FUNCTION touch_vehicle_change_version() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        xact_version bigint := {CURRENT_CHANGE_VERSION};
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            UPDATE vehicles SET change_version = xact_version
+            WHERE vehicle_id = OLD.vehicle_id AND change_version <> xact_version;
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            UPDATE vehicles SET change_version = xact_version
+            WHERE vehicle_id = NEW.vehicle_id AND change_version <> xact_version;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION touch_proposal_vehicles_change_version()
+    RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        xact_version bigint := {CURRENT_CHANGE_VERSION};
+    BEGIN
+        UPDATE vehicles SET change_version = xact_version
+        WHERE change_version <> xact_version
+          AND vehicle_id IN (
+              SELECT vehicle_id FROM vehicle_assignment_proposal_items
+              WHERE proposal_id = NEW.proposal_id
+          );
+        RETURN NULL;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION touch_referencing_vehicles_change_version()
+    RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        xact_version bigint := {CURRENT_CHANGE_VERSION};
+    BEGIN
+        IF TG_TABLE_NAME = 'vehicle_types' THEN
+            UPDATE vehicles SET change_version = xact_version
+            WHERE vehicle_type_id = NEW.vehicle_type_id
+              AND change_version <> xact_version;
+        ELSIF TG_TABLE_NAME = 'energies' THEN
+            UPDATE vehicles SET change_version = xact_version
+            WHERE energy_id = NEW.energy_id AND change_version <> xact_version;
+        ELSIF TG_TABLE_NAME = 'vehicle_status' THEN
+            UPDATE vehicles SET change_version = xact_version
+            WHERE status_id = NEW.vehicle_status_id
+              AND change_version <> xact_version;
+        ELSIF TG_TABLE_NAME = 'interest_points' THEN
+            UPDATE vehicles SET change_version = xact_version
+            WHERE base_interest_point_id = NEW.interest_point_id
+              AND change_version <> xact_version;
+        ELSIF TG_TABLE_NAME = 'vehicle_consumable_types' THEN
+            UPDATE vehicles SET change_version = xact_version
+            WHERE change_version <> xact_version
+              AND vehicle_id IN (
+                  SELECT vehicle_id FROM vehicle_consumables_stock
+                  WHERE consumable_type_id = NEW.vehicle_consumable_type_id
+              );
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION touch_incident_change_version() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        xact_version bigint := {CURRENT_CHANGE_VERSION};
+    BEGIN
+        IF TG_TABLE_NAME = 'incident_phases' THEN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE incidents SET change_version = xact_version
+                WHERE incident_id = OLD.incident_id
+                  AND change_version <> xact_version;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                UPDATE incidents SET change_version = xact_version
+                WHERE incident_id = NEW.incident_id
+                  AND change_version <> xact_version;
+            END IF;
+        ELSIF TG_TABLE_NAME = 'vehicle_assignments' THEN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE incidents SET change_version = xact_version
+                WHERE change_version <> xact_version
+                  AND incident_id = (
+                      SELECT incident_id FROM incident_phases
+                      WHERE incident_phase_id = OLD.incident_phase_id
+                  );
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                UPDATE incidents SET change_version = xact_version
+                WHERE change_version <> xact_version
+                  AND incident_id = (
+                      SELECT incident_id FROM incident_phases
+                      WHERE incident_phase_id = NEW.incident_phase_id
+                  );
+            END IF;
+        ELSIF TG_TABLE_NAME = 'phase_types' THEN
+            UPDATE incidents SET change_version = xact_version
+            WHERE change_version <> xact_version
+              AND incident_id IN (
+                  SELECT incident_id FROM incident_phases
+                  WHERE phase_type_id = NEW.phase_type_id
+              );
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION touch_interest_point_kind_change_version()
+    RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        xact_version bigint := {CURRENT_CHANGE_VERSION};
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            UPDATE interest_point_kinds SET change_version = xact_version
+            WHERE interest_point_kind_id = OLD.interest_point_kind_id
+              AND change_version <> xact_version;
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            UPDATE interest_point_kinds SET change_version = xact_version
+            WHERE interest_point_kind_id = NEW.interest_point_kind_id
+              AND change_version <> xact_version;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+)
+
+_TRIGGERS = (
+    # Positions used to touch their vehicle (see the module docstring)
+    """
+    DROP TRIGGER IF EXISTS vehicle_position_logs_touch_vehicle
+    ON vehicle_position_logs
+    """,
+    """
+    CREATE OR REPLACE TRIGGER vehicles_set_change_version
+    BEFORE INSERT OR UPDATE ON vehicles
+    FOR EACH ROW EXECUTE FUNCTION vehicles_set_change_version()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER vehicles_record_tombstone
+    AFTER DELETE ON vehicles
+    FOR EACH ROW EXECUTE FUNCTION vehicles_record_tombstone()
+    """,
+    *(
+        f"""
+        CREATE OR REPLACE TRIGGER {table}_touch_vehicle
+        AFTER INSERT OR UPDATE OR DELETE ON {table}
+        FOR EACH ROW EXECUTE FUNCTION touch_vehicle_change_version()
+        """
+        for table in _VEHICLE_CHILD_TABLES
+    ),
+    """
+    CREATE OR REPLACE TRIGGER vehicle_assignment_proposals_touch_vehicles
+    AFTER UPDATE OF validated_at, rejected_at ON vehicle_assignment_proposals
+    FOR EACH ROW
+    WHEN (
+        OLD.validated_at IS DISTINCT FROM NEW.validated_at
+        OR OLD.rejected_at IS DISTINCT FROM NEW.rejected_at
+    )
+    EXECUTE FUNCTION touch_proposal_vehicles_change_version()
+    """,
+    *(
+        f"""
+        CREATE OR REPLACE TRIGGER {table}_touch_vehicles
+        AFTER UPDATE ON {table}
+        FOR EACH ROW EXECUTE FUNCTION touch_referencing_vehicles_change_version()
+        """
+        for table in _VEHICLE_REFERENCE_TABLES
+    ),
+    *(
+        f"""
+        CREATE OR REPLACE TRIGGER {table}_set_change_version
+        BEFORE INSERT OR UPDATE ON {table}
+        FOR EACH ROW EXECUTE FUNCTION set_change_version()
+        """
+        for table in ("incidents", "interest_point_kinds")
+    ),
+    *(
+        f"""
+        CREATE OR REPLACE TRIGGER {table}_touch_incident
+        AFTER INSERT OR UPDATE OR DELETE ON {table}
+        FOR EACH ROW EXECUTE FUNCTION touch_incident_change_version()
+        """
+        for table in ("incident_phases", "vehicle_assignments")
+    ),
+    """
+    CREATE OR REPLACE TRIGGER phase_types_touch_incidents
+    AFTER UPDATE ON phase_types
+    FOR EACH ROW EXECUTE FUNCTION touch_incident_change_version()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER interest_points_touch_kind
+    AFTER INSERT OR UPDATE OR DELETE ON interest_points
+    FOR EACH ROW EXECUTE FUNCTION touch_interest_point_kind_change_version()
+    """,
+)
+
+CHANGE_VERSION_DDL = tuple(DDL(statement) for statement in _FUNCTIONS + _TRIGGERS)
+
+# One DDL per statement: asyncpg prepares what it runs, which rejects
+# several commands in one string
+for _ddl in CHANGE_VERSION_DDL:
+    event.listen(Base.metadata, "after_create", _ddl)
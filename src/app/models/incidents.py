@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import (
     DOUBLE_PRECISION,
@@ -19,7 +19,13 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, CreatedAtMixin, TimestampMixin
+from app.models.base import (
+    Base,
+    CreatedAtMixin,
+    TimestampMixin,
+    change_version_column,
+    geography_point_column,
+)
 from app.models.enums import IncidentPhaseDependencyKind, VehicleRequirementRule
 
 if TYPE_CHECKING:
@@ -39,7 +45,9 @@ class Incident(Base, TimestampMixin):
         Index("ix_incidents_created_by", "created_by_operator_id"),
         Index("ix_incidents_city_zipcode", "city", "zipcode"),
         Index("ix_incidents_created_at", "created_at"),
+        Index("ix_incidents_geog", "geog", postgresql_using="gist"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     incident_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -54,10 +62,13 @@ class Incident(Base, TimestampMixin):
     city: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
     latitude: Mapped[Optional[float]] = mapped_column(DOUBLE_PRECISION, nullable=True)
     longitude: Mapped[Optional[float]] = mapped_column(DOUBLE_PRECISION, nullable=True)
+    geog: Mapped[Optional[Any]] = geography_point_column()
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     ended_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # The incident, its phases (and their types) and their assignments
+    change_version: Mapped[int] = change_version_column()
 
     created_by: Mapped[Optional["Operator"]] = relationship(
         "Operator", back_populates="incidents_created"
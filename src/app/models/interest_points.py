@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import (
     DOUBLE_PRECISION,
@@ -16,7 +16,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, change_version_column, geography_point_column
 
 if TYPE_CHECKING:
     from .vehicles import Vehicle
@@ -24,7 +24,10 @@ if TYPE_CHECKING:
 
 class InterestPoint(Base):
     __tablename__ = "interest_points"
-    __table_args__ = (Index("ix_interest_points_city_zipcode", "city", "zipcode"),)
+    __table_args__ = (
+        Index("ix_interest_points_city_zipcode", "city", "zipcode"),
+        Index("ix_interest_points_geog", "geog", postgresql_using="gist"),
+    )
 
     interest_point_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -35,6 +38,7 @@ class InterestPoint(Base):
     city: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     latitude: Mapped[Optional[float]] = mapped_column(DOUBLE_PRECISION, nullable=True)
     longitude: Mapped[Optional[float]] = mapped_column(DOUBLE_PRECISION, nullable=True)
+    geog: Mapped[Optional[Any]] = geography_point_column()
     interest_point_kind_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("interest_point_kinds.interest_point_kind_id", ondelete="SET NULL"),
@@ -59,11 +63,14 @@ class InterestPoint(Base):
 
 class InterestPointKind(Base):
     __tablename__ = "interest_point_kinds"
+    __mapper_args__ = {"eager_defaults": True}
 
     interest_point_kind_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     label: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    # The kind and the interest points listed under it
+    change_version: Mapped[int] = change_version_column()
 
     interest_points: Mapped[list[InterestPoint]] = relationship(
         "InterestPoint", back_populates="kind", passive_deletes=True
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, CreatedAtMixin
+
+
+class ScheduledJob(CreatedAtMixin, Base):
+    """
+    Durable delayed job, run once `run_at` is reached (`app.services.scheduler`).
+
+    One row per (kind, subject): scheduling the same job twice is a no-op.
+    While a worker runs a job, `run_at` is pushed forward by the lease so
+    other workers skip it; the row is deleted once the job is done.
+    """
+
+    __tablename__ = "scheduled_jobs"
+    __table_args__ = (Index("ix_scheduled_jobs_run_at", "run_at"),)
+
+    kind: Mapped[str] = mapped_column(String(64), primary_key=True)
+    subject_id: Mapped[uuid.UUID] = mapped_column(
+        PG_UUID(as_uuid=True), primary_key=True
+    )
+    run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import (
     DOUBLE_PRECISION,
+    BigInteger,
     DateTime,
     ForeignKey,
     Index,
+    Integer,
     String,
     func,
     text,
@@ -16,7 +18,12 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import (
+    CURRENT_CHANGE_VERSION,
+    Base,
+    change_version_column,
+    geography_point_column,
+)
 
 if TYPE_CHECKING:
     from .assignment_proposals import (
@@ -42,7 +49,9 @@ class Vehicle(Base):
         Index("ix_vehicles_vehicle_type", "vehicle_type_id"),
         Index("ix_vehicles_status", "status_id"),
         Index("ix_vehicles_base_interest_point", "base_interest_point_id"),
+        Index("ix_vehicles_change_version", "change_version"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     vehicle_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -73,6 +82,8 @@ class Vehicle(Base):
         ForeignKey("vehicle_status.vehicle_status_id", ondelete="SET NULL"),
         nullable=True,
     )
+    # Anything shown for the vehicle in the QG fleet view
+    change_version: Mapped[int] = change_version_column()
 
     vehicle_type: Mapped["VehicleType"] = relationship(
         "VehicleType", back_populates="vehicles"
@@ -92,6 +103,14 @@ class Vehicle(Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+    # At most one row thanks to uq_vehicle_active_assignment (same predicate)
+    active_assignment: Mapped[Optional["VehicleAssignment"]] = relationship(
+        "VehicleAssignment",
+        primaryjoin="and_(Vehicle.vehicle_id == VehicleAssignment.vehicle_id, "
+        "VehicleAssignment.unassigned_at.is_(None))",
+        uselist=False,
+        viewonly=True,
+    )
     position_logs: Mapped[list["VehiclePositionLog"]] = relationship(
         "VehiclePositionLog",
         back_populates="vehicle",
@@ -113,6 +132,21 @@ class Vehicle(Base):
     )
 
 
+class VehicleTombstone(Base):
+    """Deleted vehicle, kept so delta fleet syncs can report the deletion."""
+
+    __tablename__ = "vehicle_tombstones"
+    __table_args__ = (Index("ix_vehicle_tombstones_change_version", "change_version"),)
+
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(
+        PG_UUID(as_uuid=True), primary_key=True
+    )
+    change_version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
 class Energy(Base):
     __tablename__ = "energies"
 
@@ -182,6 +216,7 @@ class VehicleAssignment(Base):
         Index("ix_vehicle_assignments_vehicle", "vehicle_id"),
         Index("ix_vehicle_assignments_incident_phase", "incident_phase_id"),
         Index("ix_vehicle_assignments_reinforcement", "reinforcement_id"),
+        Index("ix_vehicle_assignments_assigned_at", "assigned_at"),
         Index(
             "uq_vehicle_active_assignment",
             "vehicle_id",
@@ -257,9 +292,34 @@ class VehicleAssignment(Base):
 
 
 class VehiclePositionLog(Base):
+    """
+    Raw telemetry positions, range-partitioned by `timestamp`.
+
+    Partitions are created ahead of time and dropped after the retention
+    period by `PositionLogMaintenance`; the primary key includes the
+    partition key as required by PostgreSQL.
+    """
+
     __tablename__ = "vehicle_position_logs"
     __table_args__ = (
         Index("ix_vehicle_position_logs_vehicle_timestamp", "vehicle_id", "timestamp"),
+        Index(
+            "ix_vehicle_position_logs_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+        ),
+        Index(
+            "ix_vehicle_position_logs_geog",
+            "geog",
+            postgresql_using="gist",
+        ),
+        # Inserted in transaction order, so BRIN ranges stay narrow
+        Index(
+            "ix_vehicle_position_logs_received_version_brin",
+            "received_version",
+            postgresql_using="brin",
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
 
     vehicle_position_id: Mapped[uuid.UUID] = mapped_column(
@@ -272,10 +332,46 @@ class VehiclePositionLog(Base):
     )
     latitude: Mapped[Optional[float]] = mapped_column(DOUBLE_PRECISION, nullable=True)
     longitude: Mapped[Optional[float]] = mapped_column(DOUBLE_PRECISION, nullable=True)
+    geog: Mapped[Optional[Any]] = geography_point_column()
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
+    # Id of the inserting transaction: the fleet delta watermark for
+    # positions, whatever the device timestamp. Null for rows logged before
+    # the column was added.
+    received_version: Mapped[Optional[int]] = mapped_column(
+        BigInteger, server_default=text(CURRENT_CHANGE_VERSION), nullable=True
     )
 
     vehicle: Mapped[Vehicle] = relationship(
         "Vehicle", back_populates="position_logs", passive_deletes=True
     )
+
+
+class VehiclePositionRollup(Base):
+    """Per-minute position summary kept longer than raw logs for history."""
+
+    __tablename__ = "vehicle_position_rollups"
+    __table_args__ = (
+        Index(
+            "ix_vehicle_position_rollups_bucket_brin",
+            "bucket",
+            postgresql_using="brin",
+        ),
+    )
+
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("vehicles.vehicle_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    bucket: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    latitude: Mapped[Optional[float]] = mapped_column(DOUBLE_PRECISION, nullable=True)
+    longitude: Mapped[Optional[float]] = mapped_column(DOUBLE_PRECISION, nullable=True)
+    last_timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1,5 +1,6 @@
 from app.schemas.interest_points.interest_point import (
     InterestPointCreate,
+    InterestPointNearbyRead,
     InterestPointRead,
     InterestPointUpdate,
 )
@@ -21,6 +22,7 @@ from app.schemas.interest_points.interest_point_kind import (
 
 __all__ = [
     "InterestPointCreate",
+    "InterestPointNearbyRead",
     "InterestPointRead",
     "InterestPointUpdate",
     "InterestPointConsumableCreate",
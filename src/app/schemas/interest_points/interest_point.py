@@ -29,3 +29,7 @@ class InterestPointUpdate(UpdateSchema):
 
 class InterestPointRead(InterestPointBase, ReadSchema):
     interest_point_id: UUID
+
+
+class InterestPointNearbyRead(InterestPointRead):
+    distance_m: float
@@ -17,18 +17,26 @@ from app.schemas.qg.common import (
     QGVehicleSummary,
     QGVehicleTypeRef,
 )
+from app.schemas.qg.dashboard import QGDashboardIncident, QGDashboardRead
 from app.schemas.qg.engagements import (
     QGIncidentEngagementsRead,
     QGVehicleAssignmentDetail,
 )
-from app.schemas.qg.incidents import QGIncidentPhaseCreate, QGIncidentRead
+from app.schemas.qg.incidents import (
+    QGIncidentPhaseCreate,
+    QGIncidentRead,
+    QGIncidentSummaryRead,
+)
 from app.schemas.qg.situation import QGIncidentSituationRead
 from app.schemas.qg.vehicles import (
     QGVehicleAssignRequest,
     QGVehicleDetail,
+    QGVehicleNearbyRead,
     QGVehiclePosition,
     QGVehiclePositionRead,
     QGVehiclesListRead,
+    QGVehiclesSummaryListRead,
+    QGVehicleSummaryItem,
 )
 
 __all__ = [
@@ -45,14 +53,20 @@ __all__ = [
     "QGPhaseTypeRef",
     "QGVehicleSummary",
     "QGVehicleTypeRef",
+    "QGDashboardIncident",
+    "QGDashboardRead",
     "QGIncidentEngagementsRead",
     "QGVehicleAssignmentDetail",
     "QGIncidentSituationRead",
     "QGVehicleDetail",
     "QGVehiclesListRead",
+    "QGVehiclesSummaryListRead",
+    "QGVehicleSummaryItem",
+    "QGVehicleNearbyRead",
     "QGVehiclePosition",
     "QGVehiclePositionRead",
     "QGVehicleAssignRequest",
     "QGIncidentPhaseCreate",
     "QGIncidentRead",
+    "QGIncidentSummaryRead",
 ]
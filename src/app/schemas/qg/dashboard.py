@@ -0,0 +1,20 @@
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.qg.casualties import QGCasualtiesRead
+from app.schemas.qg.engagements import QGIncidentEngagementsRead
+from app.schemas.qg.situation import QGIncidentSituationRead
+
+
+class QGDashboardIncident(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    situation: QGIncidentSituationRead
+    engagements: QGIncidentEngagementsRead
+    casualties: QGCasualtiesRead
+
+
+class QGDashboardRead(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    incidents: list[QGDashboardIncident]
+    total: int
@@ -19,3 +19,7 @@ class QGIncidentPhaseCreate(BaseModel):
 
 class QGIncidentRead(IncidentRead, ReadSchema):
     phases: list[QGIncidentPhaseRef] = []
+
+
+class QGIncidentSummaryRead(IncidentRead, ReadSchema):
+    """Incident sans ses phases (`view=summary`)."""
@@ -90,6 +90,18 @@ class QGVehiclePositionRead(BaseModel):
     timestamp: datetime
 
 
+class QGVehicleNearbyRead(BaseModel):
+    """Dernière position d'un véhicule relevée dans un rayon donné."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    vehicle_id: UUID
+    latitude: float | None = None
+    longitude: float | None = None
+    timestamp: datetime
+    distance_m: float
+
+
 class QGVehicleStatusUpdate(BaseModel):
     """Mise à jour du statut d'un véhicule."""
 
@@ -137,15 +149,51 @@ class QGVehicleDetail(BaseModel):
     consumable_stocks: list[QGVehicleConsumableStock]
     active_assignment: QGActiveAssignment | None = None
     referenced_in_pending_proposal: bool = False
+    change_version: int
 
 
 class QGVehiclesListRead(BaseModel):
-    """Réponse de la liste des véhicules pour le QG."""
+    """
+    Réponse de la liste des véhicules pour le QG.
+
+    `version` se repasse en `since` au prochain appel pour ne recevoir que
+    les véhicules modifiés et les ids des véhicules supprimés.
+    """
 
     model_config = ConfigDict(extra="forbid")
 
     vehicles: list[QGVehicleDetail]
     total: int
+    version: int
+    deleted_vehicle_ids: list[UUID] = []
+
+
+class QGVehicleSummaryItem(BaseModel):
+    """
+    Projection légère d'un véhicule (`view=summary`) pour l'affichage carte.
+
+    Sous-ensemble de `QGVehicleDetail`, champs dans le même ordre.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    vehicle_id: UUID
+    immatriculation: str
+    vehicle_type: QGVehicleTypeDetail
+    status: QGVehicleStatusRef | None = None
+    current_position: QGVehiclePosition | None = None
+    change_version: int
+
+
+class QGVehiclesSummaryListRead(BaseModel):
+    """Liste des véhicules en projection légère, même contrat de delta."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    vehicles: list[QGVehicleSummaryItem]
+    total: int
+    version: int
+    deleted_vehicle_ids: list[UUID] = []
 
 
 class QGVehicleAssignRequest(BaseModel):
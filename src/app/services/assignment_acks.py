@@ -0,0 +1,77 @@
+"""Attente des accusés d'affectation, résolue par les événements de statut."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+from app.services.events import Event, SSEManager
+
+
+class AssignmentAckRegistry:
+    """
+    Futures en attente d'un statut de véhicule, indexées par `vehicle_id`.
+
+    Résolues par les événements `vehicle_status_update` émis par le
+    `TelemetryHandler` dès que la passerelle rapporte le statut attendu :
+    aucune requête de scrutation tant que les événements arrivent. Un
+    événement peut manquer (reçu par un autre worker, file d'écoute pleine,
+    statut déjà atteint avant l'envoi) : l'appelant vérifie alors en base à
+    l'expiration de son délai.
+    """
+
+    def __init__(self, sse_manager: SSEManager):
+        self._sse_manager = sse_manager
+        self._waiters: dict[UUID, dict[asyncio.Future[None], str]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def expect(self, vehicle_id: UUID, status_label: str) -> asyncio.Future[None]:
+        """Future résolue au prochain passage du véhicule à `status_label`."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(vehicle_id, {})[future] = status_label
+        return future
+
+    def discard(self, vehicle_id: UUID, future: asyncio.Future[None]) -> None:
+        waiters = self._waiters.get(vehicle_id)
+        if waiters is None:
+            return
+        waiters.pop(future, None)
+        if not waiters:
+            del self._waiters[vehicle_id]
+        future.cancel()
+
+    def apply(self, message: dict[str, Any]) -> None:
+        """Applique un événement interne (`SSEManager.listen`)."""
+        data = message.get("data")
+        if not isinstance(data, dict):
+            return
+        try:
+            vehicle_id = UUID(str(data["vehicle_id"]))
+        except (KeyError, ValueError):
+            return
+        status_label = data.get("status_label")
+        for future, expected in self._waiters.get(vehicle_id, {}).items():
+            if expected == status_label and not future.done():
+                future.set_result(None)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen_events())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        for waiters in self._waiters.values():
+            for future in waiters:
+                future.cancel()
+        self._waiters.clear()
+
+    async def _listen_events(self) -> None:
+        async for message in self._sse_manager.listen(
+            [Event.VEHICLE_STATUS_UPDATE.value]
+        ):
+            self.apply(message)
@@ -15,6 +15,7 @@ from app.models import (
     VehicleAssignmentProposal,
     VehicleAssignmentProposalItem,
 )
+from app.services.assignment_acks import AssignmentAckRegistry
 from app.services.events import Event, SSEManager
 from app.services.messaging.rabbitmq import RabbitMQManager
 from app.services.vehicle_assignments import (
@@ -40,10 +41,13 @@ class AssignmentProposalRejectionResult:
 async def validate_assignment_proposal(
     session: AsyncSession,
     rabbitmq: RabbitMQManager,
+    acks: AssignmentAckRegistry,
     sse_manager: SSEManager,
     proposal_id: UUID,
     operator_email: str | None,
 ) -> AssignmentProposalValidationResult:
+    # Verrou sur la proposition : une validation concurrente (opérateur ou
+    # acceptation automatique rejouée) attend, puis la relit validée
     proposal = await session.scalar(
         select(VehicleAssignmentProposal)
         .options(
@@ -53,6 +57,8 @@ async def validate_assignment_proposal(
             selectinload(VehicleAssignmentProposal.incident),
         )
         .where(VehicleAssignmentProposal.proposal_id == proposal_id)
+        .with_for_update(of=VehicleAssignmentProposal)
+        .execution_options(populate_existing=True)
     )
 
     if not proposal:
@@ -114,12 +120,16 @@ async def validate_assignment_proposal(
         )
         for item in proposal.items
     ]
+    # La proposition est marquée validée dans la transaction qui crée les
+    # affectations, avant que le verrou ne soit relâché
+    proposal.validated_at = now
     (
         engaged_assignments,
         failed_targets,
     ) = await create_assignments_and_wait_for_ack(
         session=session,
         rabbitmq=rabbitmq,
+        acks=acks,
         assignments=assignments,
         targets=targets,
         incident_latitude=incident.latitude,
@@ -127,7 +137,7 @@ async def validate_assignment_proposal(
         engaged_status_label="Engagé",
         validated_by_operator_id=operator_id,
         max_attempts=max_attempts,
-        retry_delay_seconds=1.0,
+        ack_timeout_seconds=1.0,
     )
 
     engaged_vehicle_ids = {assignment.vehicle_id for assignment in engaged_assignments}
@@ -136,8 +146,9 @@ async def validate_assignment_proposal(
     ]
     failed_vehicles = [target.immatriculation for target in failed_targets]
 
-    if engaged_items:
-        proposal.validated_at = now
+    if not engaged_items:
+        # Aucun véhicule engagé : la proposition redevient en attente
+        proposal.validated_at = None
         await session.commit()
 
     if failed_vehicles and not engaged_items:
@@ -189,9 +200,10 @@ async def reject_assignment_proposal(
     sse_manager: SSEManager,
 ) -> AssignmentProposalRejectionResult:
     proposal = await session.scalar(
-        select(VehicleAssignmentProposal).where(
-            VehicleAssignmentProposal.proposal_id == proposal_id
-        )
+        select(VehicleAssignmentProposal)
+        .where(VehicleAssignmentProposal.proposal_id == proposal_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
     )
 
     if not proposal:
@@ -0,0 +1,176 @@
+"""
+Schema migrations applied at startup.
+
+The base schema predates this module and is managed outside the app; these
+steps add what later features need to an existing database. Each step runs
+once, in order, and is recorded in `schema_migrations`. All pending steps
+run in one transaction under an advisory lock, so workers starting together
+apply them once and a failed step leaves the schema untouched.
+
+Steps are also idempotent (`IF NOT EXISTS`, `CREATE OR REPLACE`) so they are
+safe on a database created by `PostgresManager.create_tables`, which already
+has everything.
+"""
+
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.logging import get_logger
+from app.models import ScheduledJob, VehiclePositionRollup, VehicleTombstone
+from app.models.base import CURRENT_CHANGE_VERSION, GEOGRAPHY_POINT_EXPRESSION
+from app.models.change_versions import CHANGE_VERSION_DDL
+
+log = get_logger(__name__)
+
+# Arbitrary constant shared by every worker (pg_advisory_xact_lock key)
+_MIGRATION_LOCK_KEY = 7_402_318_551
+
+_CREATE_MIGRATIONS_TABLE = text(
+    """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        name text PRIMARY KEY,
+        applied_at timestamptz NOT NULL DEFAULT now()
+    )
+    """
+)
+_APPLIED_MIGRATIONS = text("SELECT name FROM schema_migrations")
+_RECORD_MIGRATION = text("INSERT INTO schema_migrations (name) VALUES (:name)")
+
+
+@dataclass(frozen=True)
+class Migration:
+    name: str
+    apply: Callable[[AsyncConnection], Awaitable[None]]
+
+
+async def _add_change_versions(conn: AsyncConnection) -> None:
+    # Existing rows get the version of this transaction: every delta or ETag
+    # computed before the migration is stale anyway
+    for table in ("vehicles", "incidents", "interest_point_kinds"):
+        await conn.execute(
+            text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS change_version "
+                f"bigint NOT NULL DEFAULT {CURRENT_CHANGE_VERSION}"
+            )
+        )
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_vehicles_change_version "
+            "ON vehicles (change_version)"
+        )
+    )
+    await conn.run_sync(
+        lambda sync_conn: VehicleTombstone.__table__.create(sync_conn, checkfirst=True)
+    )
+    # Functions before triggers; one statement per execute for asyncpg
+    for ddl in CHANGE_VERSION_DDL:
+        await conn.execute(ddl)
+
+
+async def _add_scheduled_jobs(conn: AsyncConnection) -> None:
+    await conn.run_sync(
+        lambda sync_conn: ScheduledJob.__table__.create(sync_conn, checkfirst=True)
+    )
+
+
+async def _add_geography_columns(conn: AsyncConnection) -> None:
+    # Generated columns are stored: adding one rewrites the table (and every
+    # partition of vehicle_position_logs) under an ACCESS EXCLUSIVE lock
+    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+    for table in ("incidents", "interest_points", "vehicle_position_logs"):
+        await conn.execute(
+            text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS geog "
+                f"geography(Point, 4326) "
+                f"GENERATED ALWAYS AS ({GEOGRAPHY_POINT_EXPRESSION}) STORED"
+            )
+        )
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_geog "
+                f"ON {table} USING gist (geog)"
+            )
+        )
+
+
+async def _add_position_received_versions(conn: AsyncConnection) -> None:
+    # Added without a default, then given one: a volatile default in ADD
+    # COLUMN would rewrite every position. Older rows keep a null version;
+    # fleet delta clients resync from the snapshot after a deploy anyway.
+    await conn.execute(
+        text(
+            "ALTER TABLE vehicle_position_logs "
+            "ADD COLUMN IF NOT EXISTS received_version bigint"
+        )
+    )
+    await conn.execute(
+        text(
+            "ALTER TABLE vehicle_position_logs ALTER COLUMN received_version "
+            f"SET DEFAULT {CURRENT_CHANGE_VERSION}"
+        )
+    )
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_vehicle_position_logs_received_version_brin "
+            "ON vehicle_position_logs USING brin (received_version)"
+        )
+    )
+
+
+async def _add_position_rollups(conn: AsyncConnection) -> None:
+    # Partitioning an existing heap table is a manual step (see the README):
+    # it needs an exclusive lock and a copy of the history
+    await conn.run_sync(
+        lambda sync_conn: VehiclePositionRollup.__table__.create(
+            sync_conn, checkfirst=True
+        )
+    )
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_vehicle_position_logs_timestamp_brin "
+            "ON vehicle_position_logs USING brin (timestamp)"
+        )
+    )
+
+
+async def _add_assignment_assigned_at_index(conn: AsyncConnection) -> None:
+    # Time bounds of /qg/exports/assignments
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_vehicle_assignments_assigned_at "
+            "ON vehicle_assignments (assigned_at)"
+        )
+    )
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration("0001_change_versions", _add_change_versions),
+    Migration("0002_scheduled_jobs", _add_scheduled_jobs),
+    Migration("0003_geography_columns", _add_geography_columns),
+    Migration("0004_position_received_versions", _add_position_received_versions),
+    Migration("0005_position_rollups", _add_position_rollups),
+    Migration("0006_assignment_assigned_at_index", _add_assignment_assigned_at_index),
+)
+
+
+async def apply_migrations(
+    engine: AsyncEngine, migrations: Sequence[Migration] = MIGRATIONS
+) -> list[str]:
+    """Apply the migrations missing from `schema_migrations`; return their names."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY}
+        )
+        await conn.execute(_CREATE_MIGRATIONS_TABLE)
+        applied = set((await conn.scalars(_APPLIED_MIGRATIONS)).all())
+        pending = [
+            migration for migration in migrations if migration.name not in applied
+        ]
+        for migration in pending:
+            await migration.apply(conn)
+            await conn.execute(_RECORD_MIGRATION, {"name": migration.name})
+            log.info("postgres.migration.applied", migration=migration.name)
+    return [migration.name for migration in pending]
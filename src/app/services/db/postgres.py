@@ -1,15 +1,200 @@
-from typing import AsyncIterator, Optional
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+from uuid import uuid4
 
-from sqlalchemy import text
+from sqlalchemy import Select, exc, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import DatabaseSettings
+from app.core.logging import get_logger
 from app.models import Base
+from app.services.db.migrations import apply_migrations
+from app.services.db.query_stats import instrument_engine, untracked_queries
+from app.services.db.slow_queries import SlowQueryLog
+
+log = get_logger(__name__)
+
+# Replay lag on a hot standby; 0 when all received WAL has been replayed so an
+# idle primary does not look like a lagging replica.
+_REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+
+def _pgbouncer_statement_name() -> str:
+    # Unique names: PgBouncer may hand the next transaction another server
+    # connection, where a reused "__asyncpg_stmt_N__" name would collide
+    return f"__asyncpg_{uuid4()}__"
+
+
+def asyncpg_connect_args(settings: DatabaseSettings) -> dict[str, Any]:
+    """asyncpg connection options for prepared statement caching."""
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": settings.prepared_statement_cache_size,
+    }
+    if settings.pgbouncer:
+        connect_args["prepared_statement_name_func"] = _pgbouncer_statement_name
+        # asyncpg's own cache for unprepared queries relies on stable names too
+        connect_args["statement_cache_size"] = 0
+    return connect_args
+
+
+@dataclass
+class PoolMetrics:
+    """Connection pool saturation counters (checkouts, wait time, overflow)."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    overflow_checkouts: int = 0
+    peak_overflow: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record_checkout(self, wait_seconds: float, overflow: int) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        if overflow > 0:
+            self.overflow_checkouts += 1
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "overflow_checkouts": self.overflow_checkouts,
+            "peak_overflow": self.peak_overflow,
+            "wait_ms_avg": (self.wait_seconds_total / self.checkouts * 1000)
+            if self.checkouts
+            else 0.0,
+            "wait_ms_max": self.wait_seconds_max * 1000,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool recording checkout wait time, overflow usage and timeouts."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            log.warning(
+                "postgres.pool.checkout_timeout",
+                pool_size=self.size(),
+                overflow=self.overflow(),
+                checked_out=self.checkedout(),
+            )
+            raise
+        if self.metrics is not None:
+            self.metrics.record_checkout(time.perf_counter() - started, self.overflow())
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class ReplicaRoutingSession(Session):
+    """
+    Session sending SELECTs to the read replica until the first write.
+
+    Any flush or non-SELECT statement goes to the primary and makes the
+    session sticky to it, so a request reads its own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        if self.info.get("wrote"):
+            return primary
+        if self._flushing or not isinstance(clause, Select):
+            self.info["wrote"] = True
+            return primary
+        return self.info["replica_bind"]
+
+
+ReadQuery = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def _sibling_sessionmaker(
+    session: AsyncSession, count: int
+) -> Optional[async_sessionmaker[AsyncSession]]:
+    """
+    Sessionmaker for `count` extra sessions routed like `session`, or None.
+
+    None when `session` is not bound to a pooled engine (a connection inside
+    a test or benchmark transaction, whose data other connections cannot
+    see) or when the base pool lacks spare slots: overflow is kept for
+    concurrent requests.
+    """
+    engine = session.bind
+    if count < 1 or not isinstance(engine, AsyncEngine):
+        return None
+    replica = session.info.get("replica_bind")
+    routed = replica is not None and not session.info.get("wrote")
+    pool = replica.pool if routed else engine.pool
+    if not isinstance(pool, QueuePool) or pool.size() - pool.checkedout() < count:
+        return None
+    if routed:
+        return async_sessionmaker(
+            engine,
+            expire_on_commit=False,
+            sync_session_class=ReplicaRoutingSession,
+            info={"replica_bind": replica},
+        )
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def gather_reads(session: AsyncSession, *queries: ReadQuery) -> list[Any]:
+    """
+    Run independent read queries concurrently; results come back in order.
+
+    The first query runs on `session`, each other one on its own pooled
+    connection, so a composite endpoint waits for its slowest query rather
+    than for the sum. Sibling connections only see committed data and each
+    has its own snapshot: queries must not depend on each other nor on
+    writes pending in `session`. Without spare pool slots they run one
+    after another on `session`.
+    """
+    siblings = _sibling_sessionmaker(session, len(queries) - 1)
+    if siblings is None:
+        return [await query(session) for query in queries]
+
+    async def run_on_sibling(query: ReadQuery) -> Any:
+        async with siblings() as sibling:
+            return await query(sibling)
+
+    tasks = [
+        asyncio.ensure_future(queries[0](session)),
+        *(asyncio.ensure_future(run_on_sibling(query)) for query in queries[1:]),
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 class PostgresManager:
@@ -17,32 +202,179 @@ class PostgresManager:
 
     def __init__(self, settings: DatabaseSettings):
         self._dsn = settings.dsn
+        self._pool_size = settings.pool_size
+        self._max_overflow = settings.max_overflow
+        self._pool_timeout = settings.pool_timeout_seconds
+        self._pool_pre_ping = settings.pool_pre_ping
+        self._pool_recycle = settings.pool_recycle_seconds
+        self._replica_dsn = settings.replica_dsn
+        self._replica_max_lag = settings.replica_max_lag_seconds
+        self._replica_check_interval = settings.replica_lag_check_interval_seconds
+        self._query_budget_strict = settings.query_budget_strict
+        self._query_cache_size = settings.query_cache_size
+        self._connect_args = asyncpg_connect_args(settings)
         self._engine: Optional[AsyncEngine] = None
         self._sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+        self._replica_engine: Optional[AsyncEngine] = None
+        self._read_sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+        self._replica_fresh = False
+        self._replica_checked_at: float | None = None
+        self.pool_metrics = PoolMetrics()
+        self.replica_pool_metrics = PoolMetrics()
+        self.slow_query_log = SlowQueryLog(
+            threshold_ms=settings.slow_query_threshold_ms,
+            explain_sample_rate=settings.slow_query_explain_sample_rate,
+            plans_kept=settings.slow_query_plans_kept,
+        )
+
+    @property
+    def has_replica(self) -> bool:
+        return self._replica_dsn is not None
+
+    def _create_engine(self, dsn: str, metrics: PoolMetrics) -> AsyncEngine:
+        engine = create_async_engine(
+            dsn,
+            echo=False,
+            future=True,
+            poolclass=InstrumentedQueuePool,
+            pool_size=self._pool_size,
+            max_overflow=self._max_overflow,
+            pool_timeout=self._pool_timeout,
+            pool_pre_ping=self._pool_pre_ping,
+            pool_recycle=self._pool_recycle,
+            query_cache_size=self._query_cache_size,
+            connect_args=self._connect_args,
+        )
+        engine.pool.metrics = metrics
+        instrument_engine(engine.sync_engine, strict_budget=self._query_budget_strict)
+        self.slow_query_log.instrument(engine)
+        return engine
 
     def engine(self) -> AsyncEngine:
         if not self._engine:
-            self._engine = create_async_engine(self._dsn, echo=False, future=True)
+            self._engine = self._create_engine(self._dsn, self.pool_metrics)
             self._sessionmaker = async_sessionmaker(
                 self._engine, expire_on_commit=False
             )
         return self._engine
 
+    def replica_engine(self) -> AsyncEngine:
+        if self._replica_dsn is None:
+            raise RuntimeError("No read replica configured")
+        if not self._replica_engine:
+            self._replica_engine = self._create_engine(
+                self._replica_dsn, self.replica_pool_metrics
+            )
+            self._read_sessionmaker = async_sessionmaker(
+                self.engine(),
+                expire_on_commit=False,
+                sync_session_class=ReplicaRoutingSession,
+                info={"replica_bind": self._replica_engine.sync_engine},
+            )
+        return self._replica_engine
+
     def sessionmaker(self) -> async_sessionmaker[AsyncSession]:
         if not self._sessionmaker:
             self.engine()
         assert self._sessionmaker is not None
         return self._sessionmaker
 
+    def read_sessionmaker(self) -> async_sessionmaker[AsyncSession]:
+        """Sessionmaker routing SELECTs to the replica (primary if none)."""
+        if self._replica_dsn is None:
+            return self.sessionmaker()
+        if not self._read_sessionmaker:
+            self.replica_engine()
+        assert self._read_sessionmaker is not None
+        return self._read_sessionmaker
+
+    def pool_status(self) -> dict[str, Any]:
+        """Return live pool occupancy along with the recorded saturation metrics."""
+        status = self._pool_status(self._engine, self.pool_metrics)
+        if self._replica_dsn is not None:
+            status["replica"] = self._pool_status(
+                self._replica_engine, self.replica_pool_metrics
+            )
+            status["replica"]["fresh"] = self._replica_fresh
+        return status
+
+    def _pool_status(
+        self, engine: Optional[AsyncEngine], metrics: PoolMetrics
+    ) -> dict[str, Any]:
+        status: dict[str, Any] = {
+            "pool_size": self._pool_size,
+            "max_overflow": self._max_overflow,
+            "checked_out": 0,
+            "overflow": 0,
+        }
+        if engine is not None:
+            pool = engine.pool
+            status["checked_out"] = pool.checkedout()
+            status["overflow"] = max(pool.overflow(), 0)
+        status.update(metrics.snapshot())
+        return status
+
     async def get_session(self) -> AsyncIterator[AsyncSession]:
         async with self.sessionmaker()() as session:
             yield session
 
+    async def get_read_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Yield a session for read-mostly requests.
+
+        SELECTs go to the replica when it is configured and within the allowed
+        lag; otherwise, or after the first write, everything uses the primary.
+        """
+        if self._replica_dsn is None or not await self.replica_is_fresh():
+            async for session in self.get_session():
+                yield session
+            return
+
+        async with self.read_sessionmaker()() as session:
+            yield session
+
+    async def replica_is_fresh(self) -> bool:
+        """Return whether the replica lag is acceptable (cached between checks)."""
+        now = time.monotonic()
+        if (
+            self._replica_checked_at is not None
+            and now - self._replica_checked_at < self._replica_check_interval
+        ):
+            return self._replica_fresh
+
+        self._replica_checked_at = now
+        try:
+            with untracked_queries():
+                async with self.replica_engine().connect() as conn:
+                    lag = await conn.scalar(text(_REPLICA_LAG_SQL))
+        except (exc.SQLAlchemyError, OSError) as error:
+            log.warning("postgres.replica.unavailable", error=str(error))
+            self._replica_fresh = False
+            return False
+
+        lag_seconds = float(lag) if lag is not None else 0.0
+        fresh = lag_seconds <= self._replica_max_lag
+        if fresh != self._replica_fresh:
+            log.info(
+                "postgres.replica.freshness_changed",
+                fresh=fresh,
+                lag_seconds=lag_seconds,
+                max_lag_seconds=self._replica_max_lag,
+            )
+        self._replica_fresh = fresh
+        return fresh
+
     async def create_tables(self) -> None:
         """Create all tables defined in models."""
         async with self.engine().begin() as conn:
+            # Generated geography columns and GiST indexes need PostGIS
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
             await conn.run_sync(Base.metadata.create_all)
 
+    async def migrate(self) -> list[str]:
+        """Apply pending schema migrations (see `app.services.db.migrations`)."""
+        return await apply_migrations(self.engine())
+
     async def drop_tables(self) -> None:
         """Drop all tables defined in models."""
         async with self.engine().begin() as conn:
@@ -54,6 +386,12 @@ class PostgresManager:
             await conn.execute(text("SELECT 1"))
 
     async def close(self) -> None:
+        await self.slow_query_log.close()
+        if self._replica_engine:
+            await self._replica_engine.dispose()
+            self._replica_engine = None
+            self._read_sessionmaker = None
+            self._replica_checked_at = None
         if self._engine:
             await self._engine.dispose()
             self._engine = None
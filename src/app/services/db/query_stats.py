@@ -0,0 +1,125 @@
+"""Per-request SQL statement counting, timing and query budgets."""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode when a request runs more statements than allowed."""
+
+
+@dataclass
+class QueryStats:
+    """Statements executed (and time spent in the database) for one unit of work."""
+
+    count: int = 0
+    duration_seconds: float = 0.0
+    budget: Optional[int] = None
+    statements: Counter[str] = field(default_factory=Counter)
+    route_resolver: Optional[Callable[[], Optional[str]]] = None
+
+    @property
+    def route(self) -> Optional[str]:
+        """Route template of the request being tracked, once it is resolved."""
+        return self.route_resolver() if self.route_resolver else None
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_seconds * 1000
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed at least `threshold` times (likely N+1 loads)."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statistics for statements executed in the current context."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def untracked_queries() -> Iterator[None]:
+    """Exclude internal statements (health checks, replica lag) from the stats."""
+    token = _current_stats.set(None)
+    try:
+        yield
+    finally:
+        _current_stats.reset(token)
+
+
+def set_query_budget(max_queries: int) -> None:
+    """Declare the statement budget of the current request, if tracked."""
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.budget = max_queries
+
+
+def instrument_engine(engine: Engine, strict_budget: bool = False) -> None:
+    """
+    Count and time statements executed through `engine` into the current stats.
+
+    With `strict_budget`, a statement that would exceed the declared budget
+    raises `QueryBudgetExceeded` instead of running.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        if stats is None:
+            return
+        if (
+            strict_budget
+            and stats.budget is not None
+            and stats.count + 1 > stats.budget
+        ):
+            raise QueryBudgetExceeded(
+                f"query budget of {stats.budget} exceeded by: {statement[:200]}"
+            )
+        conn.info.setdefault("query_stats_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        started = conn.info.get("query_stats_started")
+        if stats is None or not started:
+            return
+        stats.duration_seconds += time.perf_counter() - started.pop()
+        stats.count += 1
+        stats.statements[statement] += 1
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        started = conn.info.get("query_stats_started") if conn is not None else None
+        if started:
+            started.pop()
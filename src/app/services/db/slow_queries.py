@@ -0,0 +1,219 @@
+"""Slow statement logging with sampled EXPLAIN plan capture."""
+
+import asyncio
+import hashlib
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.logging import get_logger
+from app.services.db.query_stats import current_query_stats, untracked_queries
+
+log = get_logger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_EXPLAINABLE = ("select", "with", "insert", "update", "delete")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so executions differing only by values match."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+def _value_shape(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def parameters_shape(parameters: Any, executemany: bool = False) -> Any:
+    """Describe bound parameters by type (and size) without their values."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameters[0] if parameters else None
+        return {"rows": len(parameters), "row": parameters_shape(first)}
+    if isinstance(parameters, dict):
+        return {key: _value_shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_value_shape(value) for value in parameters]
+    return None
+
+
+@dataclass
+class CapturedPlan:
+    fingerprint_id: str
+    statement: str
+    route: Optional[str]
+    duration_ms: float
+    captured_at: datetime
+    plan: Any
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint_id": self.fingerprint_id,
+            "statement": self.statement,
+            "route": self.route,
+            "duration_ms": self.duration_ms,
+            "captured_at": self.captured_at.isoformat(),
+            "plan": self.plan,
+        }
+
+
+class SlowQueryLog:
+    """
+    Logs statements slower than a threshold and samples their query plans.
+
+    Plans come from `EXPLAIN (FORMAT JSON)` (never ANALYZE) run on a separate
+    connection in the background, and the latest ones are kept per fingerprint.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        explain_sample_rate: float = 0.0,
+        plans_kept: int = 50,
+    ) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.plans_kept = plans_kept
+        self._plans: OrderedDict[str, CapturedPlan] = OrderedDict()
+        self._pending: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        if self.threshold_ms < 0:
+            return
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info.get("slow_query_started")
+            if not started:
+                return
+            duration_ms = (time.perf_counter() - started.pop()) * 1000
+            if duration_ms >= self.threshold_ms:
+                self.record(engine, statement, parameters, executemany, duration_ms)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _error(exception_context):
+            conn = exception_context.connection
+            started = conn.info.get("slow_query_started") if conn is not None else None
+            if started:
+                started.pop()
+
+    def record(
+        self,
+        engine: Optional[AsyncEngine],
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        duration_ms: float,
+    ) -> None:
+        if statement.lstrip()[:7].lower() == "explain":
+            return
+        normalized = fingerprint(statement)
+        statement_id = fingerprint_id(normalized)
+        stats = current_query_stats()
+        route = stats.route if stats is not None else None
+        log.warning(
+            "postgres.slow_query",
+            fingerprint_id=statement_id,
+            fingerprint=normalized[:500],
+            parameters=parameters_shape(parameters, executemany),
+            duration_ms=round(duration_ms, 1),
+            threshold_ms=self.threshold_ms,
+            route=route,
+        )
+
+        if (
+            engine is None
+            or executemany
+            or statement_id in self._pending
+            or not normalized.lower().startswith(_EXPLAINABLE)
+            or random.random() >= self.explain_sample_rate
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._pending.add(statement_id)
+        with untracked_queries():
+            task = loop.create_task(
+                self._explain(
+                    engine, statement, parameters, statement_id, route, duration_ms
+                )
+            )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(
+        self,
+        engine: AsyncEngine,
+        statement: str,
+        parameters: Any,
+        statement_id: str,
+        route: Optional[str],
+        duration_ms: float,
+    ) -> None:
+        try:
+            async with engine.connect() as conn:
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters or None
+                )
+                plan = result.scalar()
+        except Exception as exc:
+            log.warning(
+                "postgres.slow_query.explain_failed",
+                fingerprint_id=statement_id,
+                error=str(exc),
+            )
+            return
+        finally:
+            self._pending.discard(statement_id)
+
+        self._plans.pop(statement_id, None)
+        self._plans[statement_id] = CapturedPlan(
+            fingerprint_id=statement_id,
+            statement=statement,
+            route=route,
+            duration_ms=round(duration_ms, 1),
+            captured_at=datetime.now(timezone.utc),
+            plan=plan,
+        )
+        while len(self._plans) > self.plans_kept:
+            self._plans.popitem(last=False)
+        log.info("postgres.slow_query.plan_captured", fingerprint_id=statement_id)
+
+    def plans(self) -> list[dict[str, Any]]:
+        """Captured plans, most recent first."""
+        return [plan.as_dict() for plan in reversed(self._plans.values())]
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._pending.clear()
@@ -7,6 +7,7 @@ class Event(StrEnum):
     NEW_INCIDENT = "new_incident"
     INCIDENT_STATUS_UPDATE = "incident_status_update"
     INCIDENT_PHASE_UPDATE = "incident_phase_update"
+    INCIDENT_SITUATION_UPDATE = "incident_situation_update"
     ASSIGNMENT_REQUEST = "assignment_request"
     ASSIGNMENT_PROPOSAL = "assignment_proposal"
     ASSIGNMENT_PROPOSAL_ACCEPTED = "assignement_proposal_accepted"
@@ -0,0 +1,163 @@
+"""Exports historiques diffusés en NDJSON ou CSV depuis un curseur serveur."""
+
+from __future__ import annotations
+
+import csv
+import enum
+import io
+from datetime import datetime
+from typing import Any, AsyncIterator, Literal, Sequence
+from uuid import UUID
+
+from pydantic_core import to_json
+from sqlalchemy import ColumnElement, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Incident,
+    IncidentPhase,
+    PhaseType,
+    Vehicle,
+    VehicleAssignment,
+    VehiclePositionLog,
+    VehicleType,
+)
+from app.services.incident_listing import IncidentListStatus
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Lignes lues par aller-retour du curseur serveur, et par bloc envoyé
+EXPORT_BATCH_ROWS = 1000
+
+
+def _time_range(
+    column: ColumnElement[datetime], since: datetime | None, until: datetime | None
+) -> list[ColumnElement[bool]]:
+    """Bornes `[since, until[` sur la colonne temporelle indexée."""
+    criteria = []
+    if since is not None:
+        criteria.append(column >= since)
+    if until is not None:
+        criteria.append(column < until)
+    return criteria
+
+
+def position_log_export(
+    vehicle_id: UUID | None, since: datetime | None, until: datetime | None
+) -> Select:
+    """Positions brutes ; les bornes élaguent les partitions de `timestamp`."""
+    stmt = select(
+        VehiclePositionLog.vehicle_position_id,
+        VehiclePositionLog.vehicle_id,
+        VehiclePositionLog.latitude,
+        VehiclePositionLog.longitude,
+        VehiclePositionLog.timestamp,
+    ).where(*_time_range(VehiclePositionLog.timestamp, since, until))
+    if vehicle_id is not None:
+        stmt = stmt.where(VehiclePositionLog.vehicle_id == vehicle_id)
+    return stmt.order_by(VehiclePositionLog.timestamp)
+
+
+def assignment_export(
+    vehicle_id: UUID | None, since: datetime | None, until: datetime | None
+) -> Select:
+    """Historique des affectations, bornées sur `assigned_at`."""
+    stmt = (
+        select(
+            VehicleAssignment.vehicle_assignment_id,
+            VehicleAssignment.vehicle_id,
+            Vehicle.immatriculation,
+            VehicleType.code.label("vehicle_type_code"),
+            IncidentPhase.incident_id,
+            VehicleAssignment.incident_phase_id,
+            PhaseType.code.label("phase_type_code"),
+            VehicleAssignment.assigned_at,
+            VehicleAssignment.arrived_at,
+            VehicleAssignment.validated_at,
+            VehicleAssignment.unassigned_at,
+            VehicleAssignment.assigned_by_operator_id,
+            VehicleAssignment.validated_by_operator_id,
+            VehicleAssignment.notes,
+        )
+        .join(Vehicle, VehicleAssignment.vehicle_id == Vehicle.vehicle_id)
+        .outerjoin(VehicleType, Vehicle.vehicle_type_id == VehicleType.vehicle_type_id)
+        .outerjoin(
+            IncidentPhase,
+            VehicleAssignment.incident_phase_id == IncidentPhase.incident_phase_id,
+        )
+        .outerjoin(PhaseType, IncidentPhase.phase_type_id == PhaseType.phase_type_id)
+        .where(*_time_range(VehicleAssignment.assigned_at, since, until))
+    )
+    if vehicle_id is not None:
+        stmt = stmt.where(VehicleAssignment.vehicle_id == vehicle_id)
+    return stmt.order_by(VehicleAssignment.assigned_at)
+
+
+def incident_export(
+    status: IncidentListStatus | None, since: datetime | None, until: datetime | None
+) -> Select:
+    """Incidents (archives avec `ENDED`), bornés sur `created_at`."""
+    stmt = select(
+        Incident.incident_id,
+        Incident.created_at,
+        Incident.updated_at,
+        Incident.ended_at,
+        Incident.created_by_operator_id,
+        Incident.address,
+        Incident.zipcode,
+        Incident.city,
+        Incident.latitude,
+        Incident.longitude,
+        Incident.description,
+    ).where(*_time_range(Incident.created_at, since, until))
+    if status == "ONGOING":
+        stmt = stmt.where(Incident.ended_at.is_(None))
+    elif status == "ENDED":
+        stmt = stmt.where(Incident.ended_at.is_not(None))
+    return stmt.order_by(Incident.created_at)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def encode_ndjson(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> bytes:
+    return b"".join(
+        to_json(dict(zip(columns, row, strict=True))) + b"\n" for row in rows
+    )
+
+
+def encode_csv(rows: Sequence[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+async def stream_export(
+    session: AsyncSession, stmt: Select, export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """
+    Diffuse `stmt` bloc par bloc depuis un curseur côté serveur.
+
+    Seul le bloc en cours (`EXPORT_BATCH_ROWS` lignes) est en mémoire, quelle
+    que soit la taille de l'export.
+    """
+    result = await session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_ROWS))
+    columns = list(result.keys())
+    if export_format == "csv":
+        yield encode_csv([columns])
+    async for rows in result.partitions():
+        if export_format == "csv":
+            yield encode_csv(rows)
+        else:
+            yield encode_ndjson(columns, rows)
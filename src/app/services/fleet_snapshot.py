@@ -0,0 +1,286 @@
+"""Vue matérialisée en mémoire de la flotte QG, tenue à jour par les événements."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from typing import Any, Awaitable, Callable
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.schemas.qg.vehicles import (
+    QGVehicleDetail,
+    QGVehiclePosition,
+    QGVehiclesListRead,
+    QGVehicleStatusRef,
+    QGVehicleSummaryItem,
+)
+from app.services.db.postgres import PostgresManager
+from app.services.events import Event, SSEManager
+from app.services.vehicles import FleetView, VehicleService
+
+log = get_logger(__name__)
+
+FleetLoader = Callable[[AsyncSession, int | None], Awaitable[QGVehiclesListRead]]
+
+# Événements qui touchent un véhicule sans porter tout son nouvel état :
+# ils déclenchent une relecture par delta (`since`)
+FLEET_REFRESH_EVENTS: tuple[Event, ...] = (
+    Event.VEHICLE_STATUS_UPDATE,  # l'arrivée sur les lieux touche l'affectation
+    Event.VEHICLE_ASSIGNMENT,
+    Event.INCIDENT_STATUS_UPDATE,  # fin de phase : véhicules désengagés
+    Event.ASSIGNMENT_PROPOSAL,
+    Event.ASSIGNMENT_PROPOSAL_ACCEPTED,
+    Event.ASSIGNMENT_PROPOSAL_REFUSED,
+)
+FLEET_EVENTS: tuple[Event, ...] = (Event.VEHICLE_POSITION_UPDATE, *FLEET_REFRESH_EVENTS)
+
+_POSITION_FIELDS = tuple(QGVehiclePosition.model_fields)
+_SUMMARY_FIELDS = set(QGVehicleSummaryItem.model_fields)
+
+
+async def load_fleet(session: AsyncSession, since: int | None) -> QGVehiclesListRead:
+    return await VehicleService(session).fetch_fleet(since)
+
+
+def _event_vehicle_id(data: dict[str, Any]) -> UUID | None:
+    try:
+        return UUID(str(data["vehicle_id"]))
+    except (KeyError, ValueError):
+        return None
+
+
+class FleetSnapshot:
+    """
+    Liste QG des véhicules matérialisée en mémoire et pré-sérialisée.
+
+    Chargée au démarrage, mise à jour en place par les positions et statuts
+    reçus, relue par delta après les autres événements et toutes les
+    `refresh_interval` secondes (écritures sans événement, événements perdus
+    sur file pleine), puis entièrement rechargée toutes les
+    `reconcile_interval` secondes en journalisant l'écart constaté.
+
+    Chaque véhicule est gardé sérialisé, en entier et en projection
+    `summary` : un changement ne ré-encode que lui, et le corps de chaque vue
+    est assemblé au plus une fois par lecture après changement.
+    """
+
+    def __init__(
+        self,
+        postgres: PostgresManager,
+        sse_manager: SSEManager,
+        refresh_interval_seconds: float = 5.0,
+        reconcile_interval_seconds: float = 300.0,
+        loader: FleetLoader = load_fleet,
+    ):
+        self._postgres = postgres
+        self._sse_manager = sse_manager
+        self._refresh_interval = refresh_interval_seconds
+        self._reconcile_interval = reconcile_interval_seconds
+        self._loader = loader
+        self._vehicles: dict[UUID, QGVehicleDetail] = {}
+        self._json: dict[UUID, bytes] = {}
+        self._summary_json: dict[UUID, bytes] = {}
+        self._statuses: dict[str, QGVehicleStatusRef] = {}
+        self._version: int | None = None
+        self._bodies: dict[FleetView, bytes] = {}
+        self._etag_prefix = uuid4().hex[:12]
+        self._revisions = itertools.count(1)
+        self._revision = 0
+        self._reconciled_at = 0.0
+        self._refresh_requested = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def loaded(self) -> bool:
+        return self._version is not None
+
+    def body(self, view: FleetView = "full") -> bytes | None:
+        """
+        Corps JSON de `QGVehiclesListRead` ou, avec `view="summary"`, de
+        `QGVehiclesSummaryListRead` (None tant que rien n'est chargé).
+        """
+        if self._version is None:
+            return None
+        body = self._bodies.get(view)
+        if body is None:
+            vehicles = self._json if view == "full" else self._summary_json
+            body = self._bodies[view] = b"".join(
+                (
+                    b'{"vehicles":[',
+                    b",".join(vehicles.values()),
+                    b'],"total":%d,"version":%d,"deleted_vehicle_ids":[]}'
+                    % (len(vehicles), self._version),
+                )
+            )
+        return body
+
+    def etag(self, view: FleetView = "full") -> str | None:
+        """ETag du corps courant, changé à chaque modification de la vue."""
+        if self._version is None:
+            return None
+        suffix = "" if view == "full" else f"-{view}"
+        return f'"{self._etag_prefix}-{self._revision}{suffix}"'
+
+    def request_refresh(self) -> None:
+        self._refresh_requested.set()
+
+    def apply(self, message: dict[str, Any]) -> None:
+        """Applique un événement interne (`SSEManager.listen`) à la vue."""
+        data = message.get("data")
+        if not isinstance(data, dict):
+            return
+        event = message.get("event")
+        if event != Event.VEHICLE_POSITION_UPDATE:
+            self.request_refresh()
+        if event not in (Event.VEHICLE_POSITION_UPDATE, Event.VEHICLE_STATUS_UPDATE):
+            return
+
+        vehicle_id = _event_vehicle_id(data)
+        vehicle = self._vehicles.get(vehicle_id) if vehicle_id else None
+        if vehicle is None:
+            # Véhicule créé depuis le dernier chargement
+            self.request_refresh()
+            return
+
+        if event == Event.VEHICLE_POSITION_UPDATE:
+            try:
+                position = QGVehiclePosition.model_validate(
+                    {field: data.get(field) for field in _POSITION_FIELDS}
+                )
+            except ValidationError:
+                return
+            current = vehicle.current_position
+            if current is not None and current.timestamp >= position.timestamp:
+                return
+            updated = vehicle.model_copy(update={"current_position": position})
+        else:
+            status = self._statuses.get(data.get("status_label"))
+            if status is None or status == vehicle.status:
+                return
+            updated = vehicle.model_copy(update={"status": status})
+        self._put(updated)
+
+    async def load(self) -> int:
+        """Recharge toute la flotte ; renvoie le nombre de véhicules qui différaient."""
+        async with self._postgres.sessionmaker()() as session:
+            fleet = await self._loader(session, None)
+
+        previous = self._json
+        self._vehicles, self._json, self._summary_json = {}, {}, {}
+        for vehicle in fleet.vehicles:
+            self._put(vehicle)
+        self._version = fleet.version
+        self._reconciled_at = time.monotonic()
+
+        return len(previous.keys() - self._json.keys()) + sum(
+            previous.get(vehicle_id) != data for vehicle_id, data in self._json.items()
+        )
+
+    async def refresh(self) -> None:
+        """Relit les véhicules modifiés depuis la version courante."""
+        if self._version is None:
+            await self.load()
+            return
+
+        # Lecture sur le primaire : le réplica peut ne pas encore voir l'écriture
+        async with self._postgres.sessionmaker()() as session:
+            delta = await self._loader(session, self._version)
+
+        reorder = False
+        for vehicle in delta.vehicles:
+            current = self._vehicles.get(vehicle.vehicle_id)
+            if current is None or current.immatriculation != vehicle.immatriculation:
+                reorder = True
+            elif (
+                current.current_position is not None
+                and vehicle.current_position is not None
+                and current.current_position.timestamp
+                > vehicle.current_position.timestamp
+            ):
+                # Position plus récente reçue par événement pendant la lecture
+                vehicle = vehicle.model_copy(
+                    update={"current_position": current.current_position}
+                )
+            self._put(vehicle)
+        for vehicle_id in delta.deleted_vehicle_ids:
+            if self._vehicles.pop(vehicle_id, None) is not None:
+                del self._json[vehicle_id]
+                del self._summary_json[vehicle_id]
+                self._changed()
+        if reorder:
+            order = sorted(
+                self._vehicles, key=lambda key: self._vehicles[key].immatriculation
+            )
+            self._json = {key: self._json[key] for key in order}
+            self._summary_json = {key: self._summary_json[key] for key in order}
+        if delta.version != self._version:
+            self._version = delta.version
+            self._changed()
+
+    async def reconcile(self) -> None:
+        drift = await self.load()
+        log.info(
+            "fleet_snapshot.reconciled",
+            vehicles=len(self._json),
+            drift=drift,
+        )
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._listen_events())]
+        try:
+            await self.load()
+            log.info("fleet_snapshot.loaded", vehicles=len(self._json))
+        except Exception as exc:
+            # La route lit la base tant que la vue n'est pas chargée
+            log.warning("fleet_snapshot.load.failed", error=str(exc))
+        self._tasks.append(asyncio.create_task(self._refresh_loop()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _put(self, vehicle: QGVehicleDetail) -> None:
+        self._vehicles[vehicle.vehicle_id] = vehicle
+        self._json[vehicle.vehicle_id] = vehicle.model_dump_json().encode()
+        self._summary_json[vehicle.vehicle_id] = vehicle.model_dump_json(
+            include=_SUMMARY_FIELDS
+        ).encode()
+        if vehicle.status is not None:
+            self._statuses[vehicle.status.label] = vehicle.status
+        self._changed()
+
+    def _changed(self) -> None:
+        self._bodies.clear()
+        self._revision = next(self._revisions)
+
+    async def _listen_events(self) -> None:
+        async for message in self._sse_manager.listen(
+            event.value for event in FLEET_EVENTS
+        ):
+            self.apply(message)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._refresh_requested.wait(), timeout=self._refresh_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._refresh_requested.clear()
+            try:
+                if time.monotonic() - self._reconciled_at >= self._reconcile_interval:
+                    await self.reconcile()
+                else:
+                    await self.refresh()
+            except Exception as exc:
+                log.warning("fleet_snapshot.refresh.failed", error=str(exc))
@@ -0,0 +1,323 @@
+"""Lectures QG groupées sur plusieurs incidents (tableau de bord opérateur)."""
+
+from __future__ import annotations
+
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import Uuid, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Casualty,
+    CasualtyStatus,
+    CasualtyTransport,
+    CasualtyType,
+    Incident,
+    IncidentPhase,
+    PhaseType,
+    Vehicle,
+    VehicleAssignment,
+    VehicleType,
+)
+from app.schemas.qg.casualties import (
+    QGCasualtiesRead,
+    QGCasualtyDetail,
+    QGCasualtyStats,
+    QGCasualtyStatusCount,
+    QGCasualtyStatusRef,
+    QGCasualtyTransportRead,
+    QGCasualtyTypeRef,
+)
+from app.schemas.qg.common import QGPhaseTypeRef, QGVehicleSummary, QGVehicleTypeRef
+from app.schemas.qg.dashboard import QGDashboardIncident, QGDashboardRead
+from app.schemas.qg.engagements import (
+    QGIncidentEngagementsRead,
+    QGVehicleAssignmentDetail,
+)
+from app.services.db.postgres import gather_reads
+from app.services.incident_situation import load_incident_situations
+
+_incident_ids = bindparam("incident_ids", type_=ARRAY(Uuid()))
+
+_ONGOING_INCIDENT_IDS = (
+    select(Incident.incident_id)
+    .where(Incident.ended_at.is_(None))
+    .order_by(Incident.created_at.desc())
+)
+_ENGAGEMENT_ROWS = (
+    select(
+        IncidentPhase.incident_id,
+        VehicleAssignment.vehicle_assignment_id,
+        VehicleAssignment.vehicle_id,
+        VehicleAssignment.incident_phase_id,
+        VehicleAssignment.assigned_at,
+        VehicleAssignment.arrived_at,
+        VehicleAssignment.validated_at,
+        VehicleAssignment.validated_by_operator_id,
+        VehicleAssignment.unassigned_at,
+        VehicleAssignment.assigned_by_operator_id,
+        Vehicle.immatriculation,
+        VehicleType.vehicle_type_id,
+        VehicleType.code,
+        VehicleType.label,
+        PhaseType.phase_type_id,
+        PhaseType.code,
+        PhaseType.label,
+    )
+    .select_from(VehicleAssignment)
+    .join(
+        IncidentPhase,
+        VehicleAssignment.incident_phase_id == IncidentPhase.incident_phase_id,
+    )
+    .join(PhaseType, IncidentPhase.phase_type_id == PhaseType.phase_type_id)
+    # Affectations sans véhicule ou type de véhicule : non listées
+    .join(Vehicle, VehicleAssignment.vehicle_id == Vehicle.vehicle_id)
+    .join(VehicleType, Vehicle.vehicle_type_id == VehicleType.vehicle_type_id)
+    .where(IncidentPhase.incident_id == any_(_incident_ids))
+    .order_by(VehicleAssignment.assigned_at.desc())
+)
+_CASUALTY_ROWS = (
+    select(
+        IncidentPhase.incident_id,
+        Casualty.casualty_id,
+        Casualty.incident_phase_id,
+        CasualtyType.casualty_type_id,
+        CasualtyType.code,
+        CasualtyType.label,
+        CasualtyStatus.casualty_status_id,
+        CasualtyStatus.label,
+        Casualty.reported_at,
+        Casualty.notes,
+    )
+    .join(IncidentPhase, Casualty.incident_phase_id == IncidentPhase.incident_phase_id)
+    .join(CasualtyType, Casualty.casualty_type_id == CasualtyType.casualty_type_id)
+    .join(
+        CasualtyStatus,
+        Casualty.casualty_status_id == CasualtyStatus.casualty_status_id,
+    )
+    .where(IncidentPhase.incident_id == any_(_incident_ids))
+    .order_by(Casualty.reported_at.desc())
+)
+_CASUALTY_TRANSPORT_ROWS = (
+    select(
+        CasualtyTransport.casualty_id,
+        CasualtyTransport.casualty_transport_id,
+        CasualtyTransport.vehicle_assignment_id,
+        CasualtyTransport.picked_up_at,
+        CasualtyTransport.dropped_off_at,
+        CasualtyTransport.picked_up_latitude,
+        CasualtyTransport.picked_up_longitude,
+        CasualtyTransport.dropped_off_latitude,
+        CasualtyTransport.dropped_off_longitude,
+        CasualtyTransport.notes,
+    )
+    .join(Casualty, CasualtyTransport.casualty_id == Casualty.casualty_id)
+    .join(IncidentPhase, Casualty.incident_phase_id == IncidentPhase.incident_phase_id)
+    .where(IncidentPhase.incident_id == any_(_incident_ids))
+    .order_by(CasualtyTransport.picked_up_at.asc().nulls_first())
+)
+
+
+async def load_incident_engagements(
+    session: AsyncSession, incident_ids: Sequence[UUID]
+) -> dict[UUID, QGIncidentEngagementsRead]:
+    """Affectations de chaque incident (plus récentes d'abord), en une requête."""
+    engagements = {
+        incident_id: QGIncidentEngagementsRead(
+            incident_id=incident_id, vehicle_assignments=[]
+        )
+        for incident_id in incident_ids
+    }
+    if not engagements:
+        return engagements
+
+    for (
+        incident_id,
+        vehicle_assignment_id,
+        vehicle_id,
+        incident_phase_id,
+        assigned_at,
+        arrived_at,
+        validated_at,
+        validated_by_operator_id,
+        unassigned_at,
+        assigned_by_operator_id,
+        immatriculation,
+        vehicle_type_id,
+        vehicle_type_code,
+        vehicle_type_label,
+        phase_type_id,
+        phase_type_code,
+        phase_type_label,
+    ) in await session.execute(_ENGAGEMENT_ROWS, {"incident_ids": list(incident_ids)}):
+        engagements[incident_id].vehicle_assignments.append(
+            QGVehicleAssignmentDetail(
+                vehicle_assignment_id=vehicle_assignment_id,
+                vehicle_id=vehicle_id,
+                incident_phase_id=incident_phase_id,
+                assigned_at=assigned_at,
+                arrived_at=arrived_at,
+                validated_at=validated_at,
+                validated_by_operator_id=validated_by_operator_id,
+                unassigned_at=unassigned_at,
+                assigned_by_operator_id=assigned_by_operator_id,
+                vehicle=QGVehicleSummary(
+                    vehicle_id=vehicle_id,
+                    immatriculation=immatriculation,
+                    vehicle_type=QGVehicleTypeRef(
+                        vehicle_type_id=vehicle_type_id,
+                        code=vehicle_type_code,
+                        label=vehicle_type_label,
+                    ),
+                ),
+                phase_type=QGPhaseTypeRef(
+                    phase_type_id=phase_type_id,
+                    code=phase_type_code,
+                    label=phase_type_label,
+                ),
+            )
+        )
+    return engagements
+
+
+async def load_incident_casualties(
+    session: AsyncSession, incident_ids: Sequence[UUID]
+) -> dict[UUID, QGCasualtiesRead]:
+    """
+    Victimes de chaque incident avec leurs transports et statistiques.
+
+    Deux requêtes (victimes, transports) lancées en parallèle.
+    """
+    if not incident_ids:
+        return {}
+    params = {"incident_ids": list(incident_ids)}
+    casualty_rows, transport_rows = await gather_reads(
+        session,
+        lambda reader: reader.execute(_CASUALTY_ROWS, params),
+        lambda reader: reader.execute(_CASUALTY_TRANSPORT_ROWS, params),
+    )
+
+    transports: dict[UUID, list[QGCasualtyTransportRead]] = {}
+    for (
+        casualty_id,
+        casualty_transport_id,
+        vehicle_assignment_id,
+        picked_up_at,
+        dropped_off_at,
+        picked_up_latitude,
+        picked_up_longitude,
+        dropped_off_latitude,
+        dropped_off_longitude,
+        notes,
+    ) in transport_rows:
+        transports.setdefault(casualty_id, []).append(
+            QGCasualtyTransportRead(
+                casualty_transport_id=casualty_transport_id,
+                vehicle_assignment_id=vehicle_assignment_id,
+                picked_up_at=picked_up_at,
+                dropped_off_at=dropped_off_at,
+                picked_up_latitude=picked_up_latitude,
+                picked_up_longitude=picked_up_longitude,
+                dropped_off_latitude=dropped_off_latitude,
+                dropped_off_longitude=dropped_off_longitude,
+                notes=notes,
+            )
+        )
+
+    casualties: dict[UUID, list[QGCasualtyDetail]] = {
+        incident_id: [] for incident_id in incident_ids
+    }
+    status_counts: dict[UUID, dict[UUID, QGCasualtyStatusCount]] = {
+        incident_id: {} for incident_id in incident_ids
+    }
+    for (
+        incident_id,
+        casualty_id,
+        incident_phase_id,
+        casualty_type_id,
+        casualty_type_code,
+        casualty_type_label,
+        casualty_status_id,
+        casualty_status_label,
+        reported_at,
+        notes,
+    ) in casualty_rows:
+        casualties[incident_id].append(
+            QGCasualtyDetail(
+                casualty_id=casualty_id,
+                incident_phase_id=incident_phase_id,
+                casualty_type=QGCasualtyTypeRef(
+                    casualty_type_id=casualty_type_id,
+                    code=casualty_type_code,
+                    label=casualty_type_label,
+                ),
+                casualty_status=QGCasualtyStatusRef(
+                    casualty_status_id=casualty_status_id,
+                    label=casualty_status_label,
+                ),
+                reported_at=reported_at,
+                notes=notes,
+                transports=transports.get(casualty_id, []),
+            )
+        )
+        status_entry = status_counts[incident_id].get(casualty_status_id)
+        if status_entry is None:
+            status_entry = QGCasualtyStatusCount(
+                casualty_status_id=casualty_status_id,
+                label=casualty_status_label,
+                count=0,
+            )
+            status_counts[incident_id][casualty_status_id] = status_entry
+        status_entry.count += 1
+
+    return {
+        incident_id: QGCasualtiesRead(
+            incident_id=incident_id,
+            casualties=details,
+            stats=QGCasualtyStats(
+                total=len(details),
+                by_status=sorted(
+                    status_counts[incident_id].values(), key=lambda item: item.label
+                ),
+            ),
+        )
+        for incident_id, details in casualties.items()
+    }
+
+
+async def load_dashboard(
+    session: AsyncSession, incident_ids: Sequence[UUID] | None = None
+) -> QGDashboardRead:
+    """
+    Situation, affectations et victimes de plusieurs incidents.
+
+    Sans `incident_ids`, tous les incidents en cours. Le nombre de requêtes
+    ne dépend pas du nombre d'incidents : chaque lecture les couvre tous.
+    Les trois blocs sont lus l'un après l'autre et seules leurs requêtes
+    internes sont parallélisées, pour ne jamais imbriquer deux
+    `gather_reads` (au plus cinq connexions pour la requête HTTP). Les
+    incidents inconnus sont ignorés ; le plus récent vient en premier.
+    """
+    if incident_ids is None:
+        incident_ids = list((await session.scalars(_ONGOING_INCIDENT_IDS)).all())
+    incident_ids = list(dict.fromkeys(incident_ids))
+
+    situations = await load_incident_situations(session, incident_ids)
+    engagements = await load_incident_engagements(session, incident_ids)
+    casualties = await load_incident_casualties(session, incident_ids)
+
+    incidents = [
+        QGDashboardIncident(
+            situation=situation,
+            engagements=engagements[incident_id],
+            casualties=casualties[incident_id],
+        )
+        for incident_id, situation in sorted(
+            situations.items(),
+            key=lambda item: item[1].incident.created_at,
+            reverse=True,
+        )
+    ]
+    return QGDashboardRead(incidents=incidents, total=len(incidents))
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import Select, Text, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Incident, IncidentPhase, PhaseType, VehicleAssignment
+from app.schemas.qg.common import (
+    QGIncidentPhaseRef,
+    QGPhaseTypeRef,
+    QGVehicleAssignmentRef,
+)
+from app.schemas.qg.incidents import QGIncidentRead, QGIncidentSummaryRead
+
+IncidentListStatus = Literal["ONGOING", "ENDED"]
+IncidentListView = Literal["full", "summary"]
+
+# Ordre de la liste (le plus récent d'abord) et clé du curseur de pagination
+INCIDENT_LIST_KEYS = (Incident.created_at, Incident.incident_id)
+
+_EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def _json_object(model: type, schema: type[BaseModel], **nested: Any):
+    """`json_build_object` avec les champs du schéma de lecture, dans l'ordre."""
+    arguments: list[Any] = []
+    for name in schema.model_fields:
+        # Clés en littéraux : pas de paramètre lié par champ
+        arguments.extend(
+            (
+                literal_column(f"'{name}'"),
+                nested[name] if name in nested else getattr(model, name),
+            )
+        )
+    return func.json_build_object(*arguments)
+
+
+def _json_array(obj, *order_by):
+    return func.coalesce(
+        func.json_agg(aggregate_order_by(obj, *order_by)), _EMPTY_JSON_ARRAY
+    )
+
+
+def incident_json_column(view: IncidentListView = "full"):
+    """
+    Objet JSON `QGIncidentRead` d'un incident, phases triées par priorité.
+
+    En vue `summary`, objet `QGIncidentSummaryRead` : colonnes de l'incident
+    seules, sans les sous-requêtes de phases et d'affectations.
+    """
+    if view == "summary":
+        return cast(_json_object(Incident, QGIncidentSummaryRead), Text)
+    assignments = (
+        select(
+            _json_array(
+                _json_object(VehicleAssignment, QGVehicleAssignmentRef),
+                VehicleAssignment.assigned_at,
+            )
+        )
+        .where(VehicleAssignment.incident_phase_id == IncidentPhase.incident_phase_id)
+        .scalar_subquery()
+    )
+    phases = (
+        select(
+            _json_array(
+                _json_object(
+                    IncidentPhase,
+                    QGIncidentPhaseRef,
+                    phase_type=_json_object(PhaseType, QGPhaseTypeRef),
+                    vehicle_assignments=assignments,
+                ),
+                IncidentPhase.priority.desc(),
+                IncidentPhase.incident_phase_id,
+            )
+        )
+        .select_from(IncidentPhase)
+        .join(PhaseType, PhaseType.phase_type_id == IncidentPhase.phase_type_id)
+        .where(IncidentPhase.incident_id == Incident.incident_id)
+        .scalar_subquery()
+    )
+    return cast(_json_object(Incident, QGIncidentRead, phases=phases), Text)
+
+
+def incident_page_statement(
+    status: IncidentListStatus | None,
+    since: datetime | None,
+    limit: int,
+) -> Select:
+    """
+    Clés de la page demandée (une ligne de plus pour détecter la suite).
+
+    Le filtre de curseur est ajouté par l'appelant (`keyset_predicate`).
+    """
+    stmt = select(*INCIDENT_LIST_KEYS)
+    if status == "ONGOING":
+        stmt = stmt.where(Incident.ended_at.is_(None))
+    elif status == "ENDED":
+        stmt = stmt.where(Incident.ended_at.is_not(None))
+    if since is not None:
+        stmt = stmt.where(Incident.created_at >= since)
+    return stmt.order_by(*(key.desc() for key in INCIDENT_LIST_KEYS)).limit(limit + 1)
+
+
+def incident_rows_statement(
+    incident_ids: list[UUID], view: IncidentListView = "full"
+) -> Select:
+    return (
+        select(incident_json_column(view))
+        .where(Incident.incident_id.in_(incident_ids))
+        .order_by(*(key.desc() for key in INCIDENT_LIST_KEYS))
+    )
+
+
+async def stream_incidents_json(
+    session: AsyncSession, incident_ids: list[UUID], view: IncidentListView = "full"
+) -> AsyncIterator[str]:
+    """Diffuse le tableau JSON ligne par ligne, sans objets ORM ni validation."""
+    yield "["
+    if incident_ids:
+        result = await session.stream(incident_rows_statement(incident_ids, view))
+        separator = ""
+        async for row in result.scalars():
+            yield separator + row
+            separator = ","
+    yield "]"
@@ -0,0 +1,466 @@
+"""Projection en mémoire de la situation des incidents, poussée en deltas SSE."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import Uuid, any_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.models import (
+    Casualty,
+    CasualtyStatus,
+    Incident,
+    IncidentPhase,
+    IncidentPhaseDependency,
+    PhaseType,
+    Vehicle,
+    VehicleAssignment,
+    VehicleType,
+)
+from app.schemas.incidents import IncidentRead
+from app.schemas.qg.common import QGVehicleTypeRef
+from app.schemas.qg.situation import (
+    QGActivePhase,
+    QGCasualtiesSummary,
+    QGCasualtyStatusCount,
+    QGIncidentSituationRead,
+    QGIncidentSnapshot,
+    QGPhaseDependency,
+    QGResourcesByType,
+    QGResourcesSummary,
+)
+from app.services.db.postgres import PostgresManager, gather_reads
+from app.services.events import Event, SSEManager
+from app.services.qg import QGService
+
+log = get_logger(__name__)
+
+SituationLoader = Callable[
+    [AsyncSession, UUID], Awaitable[QGIncidentSituationRead | None]
+]
+
+# Événements modifiant la situation d'un incident (tous portent son identifiant)
+SITUATION_EVENTS: tuple[Event, ...] = (
+    Event.NEW_INCIDENT,
+    Event.INCIDENT_STATUS_UPDATE,
+    Event.INCIDENT_PHASE_UPDATE,
+    Event.VEHICLE_ASSIGNMENT,
+    Event.ASSIGNMENT_PROPOSAL_ACCEPTED,
+)
+
+
+_incident_ids = bindparam("incident_ids", type_=ARRAY(Uuid()))
+
+# Lectures groupées : chaque requête couvre tous les incidents demandés
+_SITUATION_INCIDENTS = select(Incident).where(
+    Incident.incident_id == any_(_incident_ids)
+)
+_SITUATION_PHASE_ROWS = (
+    select(
+        IncidentPhase.incident_phase_id,
+        IncidentPhase.incident_id,
+        IncidentPhase.phase_type_id,
+        PhaseType.code,
+        PhaseType.label,
+        IncidentPhase.priority,
+        IncidentPhase.started_at,
+        IncidentPhase.ended_at,
+    )
+    .join(PhaseType, IncidentPhase.phase_type_id == PhaseType.phase_type_id)
+    .where(
+        IncidentPhase.incident_id == any_(_incident_ids),
+        IncidentPhase.ended_at.is_(None),
+    )
+    .order_by(IncidentPhase.priority.desc())
+)
+_SITUATION_DEPENDENCY_ROWS = (
+    select(
+        IncidentPhaseDependency.incident_phase_id,
+        IncidentPhaseDependency.depends_on_incident_phase_id,
+        IncidentPhaseDependency.kind,
+    )
+    .join(
+        IncidentPhase,
+        IncidentPhaseDependency.incident_phase_id == IncidentPhase.incident_phase_id,
+    )
+    .where(
+        IncidentPhase.incident_id == any_(_incident_ids),
+        IncidentPhase.ended_at.is_(None),
+    )
+)
+# Affectations comptées par incident et type de véhicule (actives à part)
+_SITUATION_RESOURCE_ROWS = (
+    select(
+        IncidentPhase.incident_id,
+        VehicleType.vehicle_type_id,
+        VehicleType.code,
+        VehicleType.label,
+        func.count(),
+        func.count().filter(VehicleAssignment.unassigned_at.is_(None)),
+    )
+    .select_from(VehicleAssignment)
+    .join(
+        IncidentPhase,
+        VehicleAssignment.incident_phase_id == IncidentPhase.incident_phase_id,
+    )
+    .outerjoin(Vehicle, VehicleAssignment.vehicle_id == Vehicle.vehicle_id)
+    .outerjoin(VehicleType, Vehicle.vehicle_type_id == VehicleType.vehicle_type_id)
+    .where(IncidentPhase.incident_id == any_(_incident_ids))
+    .group_by(
+        IncidentPhase.incident_id,
+        VehicleType.vehicle_type_id,
+        VehicleType.code,
+        VehicleType.label,
+    )
+)
+_SITUATION_CASUALTY_ROWS = (
+    select(
+        IncidentPhase.incident_id,
+        Casualty.casualty_status_id,
+        CasualtyStatus.label,
+        func.count(Casualty.casualty_id),
+    )
+    .join(
+        CasualtyStatus,
+        Casualty.casualty_status_id == CasualtyStatus.casualty_status_id,
+    )
+    .join(
+        IncidentPhase,
+        Casualty.incident_phase_id == IncidentPhase.incident_phase_id,
+    )
+    .where(IncidentPhase.incident_id == any_(_incident_ids))
+    .group_by(
+        IncidentPhase.incident_id,
+        Casualty.casualty_status_id,
+        CasualtyStatus.label,
+    )
+)
+
+
+async def load_incident_situations(
+    session: AsyncSession, incident_ids: Sequence[UUID]
+) -> dict[UUID, QGIncidentSituationRead]:
+    """
+    Situations de plusieurs incidents, en cinq requêtes quel que soit leur nombre.
+
+    Les requêtes (incidents, phases actives, dépendances, affectations par
+    type, victimes par statut) couvrent tous les incidents et sont lancées en
+    parallèle (`gather_reads`) ; leurs lignes sont regroupées par incident.
+    Les incidents inconnus sont absents du résultat.
+    """
+    if not incident_ids:
+        return {}
+    params = {"incident_ids": list(incident_ids)}
+    (
+        incidents,
+        phase_rows,
+        dependency_rows,
+        resource_rows,
+        casualty_rows,
+    ) = await gather_reads(
+        session,
+        lambda reader: reader.scalars(_SITUATION_INCIDENTS, params),
+        lambda reader: reader.execute(_SITUATION_PHASE_ROWS, params),
+        lambda reader: reader.execute(_SITUATION_DEPENDENCY_ROWS, params),
+        lambda reader: reader.execute(_SITUATION_RESOURCE_ROWS, params),
+        lambda reader: reader.execute(_SITUATION_CASUALTY_ROWS, params),
+    )
+
+    dependencies: dict[UUID, list[QGPhaseDependency]] = {}
+    for incident_phase_id, depends_on_incident_phase_id, kind in dependency_rows:
+        dependencies.setdefault(incident_phase_id, []).append(
+            QGPhaseDependency(
+                depends_on_incident_phase_id=depends_on_incident_phase_id,
+                kind=kind.value,
+            )
+        )
+
+    phases_active: dict[UUID, list[QGActivePhase]] = {}
+    for (
+        incident_phase_id,
+        incident_id,
+        phase_type_id,
+        phase_code,
+        phase_label,
+        priority,
+        started_at,
+        ended_at,
+    ) in phase_rows:
+        phases_active.setdefault(incident_id, []).append(
+            QGActivePhase(
+                incident_phase_id=incident_phase_id,
+                incident_id=incident_id,
+                phase_type_id=phase_type_id,
+                phase_code=phase_code,
+                phase_label=phase_label,
+                priority=priority,
+                started_at=started_at,
+                ended_at=ended_at,
+                dependencies=dependencies.get(incident_phase_id, []),
+            )
+        )
+
+    resources: dict[UUID, QGResourcesSummary] = {}
+    for (
+        incident_id,
+        vehicle_type_id,
+        vehicle_type_code,
+        vehicle_type_label,
+        assigned,
+        active,
+    ) in resource_rows:
+        summary = resources.setdefault(
+            incident_id,
+            QGResourcesSummary(vehicles_assigned=0, vehicles_active=0, by_type=[]),
+        )
+        summary.vehicles_assigned += assigned
+        summary.vehicles_active += active
+        # Par type : véhicules encore engagés dont le type est connu
+        if vehicle_type_id is not None and active:
+            summary.by_type.append(
+                QGResourcesByType(
+                    vehicle_type=QGVehicleTypeRef(
+                        vehicle_type_id=vehicle_type_id,
+                        code=vehicle_type_code,
+                        label=vehicle_type_label,
+                    ),
+                    count=active,
+                )
+            )
+    for summary in resources.values():
+        summary.by_type.sort(key=lambda item: item.vehicle_type.code)
+
+    by_status: dict[UUID, list[QGCasualtyStatusCount]] = {}
+    for incident_id, casualty_status_id, label, count in casualty_rows:
+        by_status.setdefault(incident_id, []).append(
+            QGCasualtyStatusCount(
+                casualty_status_id=casualty_status_id,
+                label=label,
+                count=count,
+            )
+        )
+
+    situations: dict[UUID, QGIncidentSituationRead] = {}
+    for incident in incidents:
+        incident_data = IncidentRead.model_validate(incident).model_dump()
+        incident_data["status"] = QGService.get_incident_status(incident)
+        statuses = by_status.get(incident.incident_id, [])
+        situations[incident.incident_id] = QGIncidentSituationRead(
+            incident=QGIncidentSnapshot(**incident_data),
+            phases_active=phases_active.get(incident.incident_id, []),
+            resources=resources.get(
+                incident.incident_id,
+                QGResourcesSummary(vehicles_assigned=0, vehicles_active=0, by_type=[]),
+            ),
+            casualties=QGCasualtiesSummary(
+                total=sum(status.count for status in statuses),
+                by_status=sorted(statuses, key=lambda item: item.label),
+            ),
+        )
+    return situations
+
+
+async def load_incident_situation(
+    session: AsyncSession, incident_id: UUID
+) -> QGIncidentSituationRead | None:
+    """Calcule la situation d'un incident depuis la base (None s'il n'existe pas)."""
+    return (await load_incident_situations(session, [incident_id])).get(incident_id)
+
+
+def event_incident_id(message: dict[str, Any]) -> UUID | None:
+    """Identifiant d'incident porté par un événement, quel que soit son format."""
+    data = message.get("data")
+    if not isinstance(data, dict):
+        return None
+    raw = data.get("incident_id")
+    if raw is None and isinstance(data.get("incident"), dict):
+        raw = data["incident"].get("incident_id")
+    if raw is None:
+        return None
+    try:
+        return raw if isinstance(raw, UUID) else UUID(str(raw))
+    except ValueError:
+        return None
+
+
+def situation_delta(
+    previous: dict[str, Any] | None, current: dict[str, Any]
+) -> dict[str, Any]:
+    """Sections de premier niveau qui ont changé (toutes si rien n'était connu)."""
+    if previous is None:
+        return dict(current)
+    return {
+        section: value
+        for section, value in current.items()
+        if previous.get(section) != value
+    }
+
+
+@dataclass
+class _Entry:
+    situation: QGIncidentSituationRead
+    payload: dict[str, Any]
+    loaded_at: float
+    version: int = 1
+    # Unique dans le processus, change avec le contenu : sert d'ETag
+    revision: int = 0
+
+
+class IncidentSituationProjection:
+    """
+    Situation des incidents maintenue en mémoire.
+
+    Une lecture est une recherche par clé ; l'entrée est calculée à la première
+    demande puis recalculée à chaque événement touchant l'incident, et le delta
+    est diffusé en `incident_situation_update`. Les écritures sans événement
+    (routes CRUD, autre worker) sont rattrapées au plus tard après `max_age`.
+    """
+
+    def __init__(
+        self,
+        postgres: PostgresManager,
+        sse_manager: SSEManager,
+        max_age_seconds: float = 30.0,
+        loader: SituationLoader = load_incident_situation,
+    ):
+        self._postgres = postgres
+        self._sse_manager = sse_manager
+        self._max_age = max_age_seconds
+        self._loader = loader
+        self._entries: dict[UUID, _Entry] = {}
+        self._dirty: set[UUID] = set()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+        # Les révisions repartent à 1 à chaque démarrage : le préfixe évite
+        # qu'un ETag d'un autre processus corresponde par hasard
+        self._etag_prefix = uuid4().hex[:12]
+        self._revisions = itertools.count(1)
+
+    async def get(self, incident_id: UUID) -> QGIncidentSituationRead | None:
+        entry = self._entries.get(incident_id)
+        if entry is not None and not self._expired(entry):
+            return entry.situation
+
+        situation = await self._load(incident_id)
+        if situation is None:
+            self._entries.pop(incident_id, None)
+            return None
+        self._store(incident_id, situation)
+        return situation
+
+    def etag(self, incident_id: UUID) -> str | None:
+        """ETag de la situation en mémoire (None si absente ou périmée)."""
+        entry = self._entries.get(incident_id)
+        if entry is None or self._expired(entry):
+            return None
+        return f'"{self._etag_prefix}-{entry.revision}"'
+
+    def invalidate(self, incident_id: UUID) -> None:
+        """Demande le recalcul d'un incident (et la diffusion de son delta)."""
+        self._dirty.add(incident_id)
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._listen_events()),
+            asyncio.create_task(self._refresh_loop()),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def refresh_pending(self) -> None:
+        """Recalcule les incidents invalidés et diffuse les changements."""
+        self._wakeup.clear()
+        pending, self._dirty = self._dirty, set()
+        for incident_id in pending:
+            try:
+                await self._refresh(incident_id)
+            except Exception as exc:
+                # L'entrée périmée sera recalculée à la prochaine lecture
+                self._entries.pop(incident_id, None)
+                log.warning(
+                    "situation.refresh.failed",
+                    incident_id=str(incident_id),
+                    error=str(exc),
+                )
+
+    async def _load(self, incident_id: UUID) -> QGIncidentSituationRead | None:
+        # Lecture sur le primaire : le réplica peut ne pas encore voir
+        # l'écriture, et l'entrée resterait en mémoire jusqu'à `max_age`
+        async with self._postgres.sessionmaker()() as session:
+            return await self._loader(session, incident_id)
+
+    async def _refresh(self, incident_id: UUID) -> None:
+        situation = await self._load(incident_id)
+        if situation is None:
+            self._entries.pop(incident_id, None)
+            return
+
+        previous = self._entries.get(incident_id)
+        entry = self._store(incident_id, situation, previous)
+        changes = situation_delta(
+            previous.payload if previous is not None else None, entry.payload
+        )
+        if not changes:
+            return
+        await self._sse_manager.notify(
+            Event.INCIDENT_SITUATION_UPDATE.value,
+            {
+                "incident_id": str(incident_id),
+                "version": entry.version,
+                "changes": changes,
+            },
+        )
+
+    def _store(
+        self,
+        incident_id: UUID,
+        situation: QGIncidentSituationRead,
+        previous: _Entry | None = None,
+    ) -> _Entry:
+        previous = previous or self._entries.get(incident_id)
+        payload = situation.model_dump(mode="json")
+        if previous is not None and previous.payload == payload:
+            version, revision = previous.version, previous.revision
+        else:
+            version = previous.version + 1 if previous is not None else 1
+            revision = next(self._revisions)
+        entry = _Entry(situation, payload, time.monotonic(), version, revision)
+        self._entries[incident_id] = entry
+        return entry
+
+    def _expired(self, entry: _Entry) -> bool:
+        return time.monotonic() - entry.loaded_at > self._max_age
+
+    def _prune(self) -> None:
+        expired = [key for key, entry in self._entries.items() if self._expired(entry)]
+        for incident_id in expired:
+            del self._entries[incident_id]
+
+    async def _listen_events(self) -> None:
+        async for message in self._sse_manager.listen(
+            event.value for event in SITUATION_EVENTS
+        ):
+            incident_id = event_incident_id(message)
+            if incident_id is not None:
+                self.invalidate(incident_id)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._prune()
+            await self.refresh_pending()
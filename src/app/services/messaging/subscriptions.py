@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
+from fastapi import HTTPException
 from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy import delete, select
 from sqlalchemy.exc import SQLAlchemyError
@@ -17,6 +17,7 @@ from app.models import (
     VehicleAssignmentRequest,
 )
 from app.schemas.routing.route import LineStringGeometry
+from app.services.assignment_acks import AssignmentAckRegistry
 from app.services.assignment_proposals import (
     validate_assignment_proposal as validate_assignment_proposal_service,
 )
@@ -29,6 +30,7 @@ from app.services.messaging.subscriber import (
     RabbitMQSubscriptionService,
 )
 from app.services.messaging.telemetry_handler import TelemetryHandler
+from app.services.scheduler import JobScheduler, schedule_job
 
 log = get_logger(__name__)
 
@@ -65,19 +67,23 @@ class ApplicationSubscriptions(RabbitMQSubscriptionService):
     """Application-specific event handlers wired on top of the base subscriber."""
 
     _AUTO_ACCEPT_DELAY_SECONDS = 120.0
+    _AUTO_ACCEPT_JOB = "assignment_proposal_auto_accept"
 
     def __init__(
         self,
         rabbitmq: RabbitMQManager,
         postgres: PostgresManager,
         sse_manager: SSEManager,
+        assignment_acks: AssignmentAckRegistry,
+        scheduler: JobScheduler,
         queues: list[Queue] | tuple[Queue, ...] = subscription_queues(),
     ):
         super().__init__(rabbitmq, queues)
         self._sse_manager = sse_manager
+        self._assignment_acks = assignment_acks
         self._postgres = postgres
         self._telemetry_handler = TelemetryHandler(postgres, sse_manager)
-        self._auto_accept_tasks: set[asyncio.Task[None]] = set()
+        scheduler.register(self._AUTO_ACCEPT_JOB, self._auto_accept_assignment_proposal)
 
         # Register event handlers once at init time
         self.on(
@@ -118,7 +124,7 @@ class ApplicationSubscriptions(RabbitMQSubscriptionService):
             )
             return
 
-        # Store in database
+        # Store in database (with its auto-accept job)
         await self._store_proposal(data, message.queue)
 
         # Forward to SSE without route_geometry
@@ -129,53 +135,30 @@ class ApplicationSubscriptions(RabbitMQSubscriptionService):
             queue=message.queue,
             event_name=Event.ASSIGNMENT_PROPOSAL.value,
         )
-        self._schedule_auto_accept(data.proposal_id)
-
-    def _schedule_auto_accept(self, proposal_id: UUID) -> None:
-        task = asyncio.create_task(self._auto_accept_assignment_proposal(proposal_id))
-        self._auto_accept_tasks.add(task)
-        task.add_done_callback(self._on_auto_accept_done)
-
-    def _on_auto_accept_done(self, task: asyncio.Task[None]) -> None:
-        self._auto_accept_tasks.discard(task)
-        try:
-            task.result()
-        except asyncio.CancelledError:
-            return
-        except Exception as exc:
-            log.error(
-                "subscription.assignment_proposal.auto_accept_task_failed",
-                error=str(exc),
-            )
 
     async def _auto_accept_assignment_proposal(self, proposal_id: UUID) -> None:
-        await asyncio.sleep(self._AUTO_ACCEPT_DELAY_SECONDS)
-
+        """Run by the scheduler once the auto-accept delay has elapsed."""
         async with self._postgres.sessionmaker()() as session:
             try:
                 result = await validate_assignment_proposal_service(
                     session=session,
                     rabbitmq=self._rabbitmq,
+                    acks=self._assignment_acks,
                     sse_manager=self._sse_manager,
                     proposal_id=proposal_id,
                     operator_email=None,
                 )
-            except Exception as exc:
-                status_code = getattr(exc, "status_code", None)
-                if status_code in {400, 404}:
-                    log.info(
-                        "subscription.assignment_proposal.auto_accept_skipped",
-                        proposal_id=str(proposal_id),
-                        status_code=status_code,
-                        detail=getattr(exc, "detail", str(exc)),
-                    )
-                else:
-                    log.error(
-                        "subscription.assignment_proposal.auto_accept_failed",
-                        proposal_id=str(proposal_id),
-                        status_code=status_code,
-                        error=str(exc),
-                    )
+            except HTTPException as exc:
+                # Other failures propagate so the scheduler retries the job;
+                # a proposal gone or no longer pending has nothing to retry
+                if exc.status_code not in {400, 404}:
+                    raise
+                log.info(
+                    "subscription.assignment_proposal.auto_accept_skipped",
+                    proposal_id=str(proposal_id),
+                    status_code=exc.status_code,
+                    detail=exc.detail,
+                )
                 return
 
         log.info(
@@ -245,6 +228,15 @@ class ApplicationSubscriptions(RabbitMQSubscriptionService):
                 )
 
             try:
+                # Same transaction as the proposal: the auto-accept survives
+                # restarts and runs once across workers
+                await schedule_job(
+                    session,
+                    self._AUTO_ACCEPT_JOB,
+                    data.proposal_id,
+                    datetime.now(timezone.utc)
+                    + timedelta(seconds=self._AUTO_ACCEPT_DELAY_SECONDS),
+                )
                 await session.execute(
                     delete(VehicleAssignmentRequest).where(
                         VehicleAssignmentRequest.incident_id == data.incident_id
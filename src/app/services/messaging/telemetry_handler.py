@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from uuid import UUID
 
 from pydantic import BaseModel, Field, ValidationError
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.models import (
@@ -33,6 +34,63 @@ STATUS_LABELS = {
     6: "Hors service",
 }
 
+# Hot statements are built once: only their bound parameters change between
+# messages, so SQLAlchemy reuses the memoized cache key and compiled form.
+_VEHICLE_ID_BY_IMMATRICULATION = select(Vehicle.vehicle_id).where(
+    Vehicle.immatriculation == bindparam("immatriculation")
+)
+_STATUS_ID_BY_LABEL = select(VehicleStatus.vehicle_status_id).where(
+    VehicleStatus.label == bindparam("status_label")
+)
+# Conditional status update keyed on cached ids. The UPDATE only applies while
+# the vehicle still carries the immatriculation and the status still carries
+# the label; `vehicle_known` and `status_known` tell a stale cache entry (the
+# vehicle was deleted or renamed, the status removed) apart from a heartbeat
+# repeating the current status, in the same round trip. Parameter names differ
+# from column names: the ORM would otherwise add them to the SET clause.
+_VEHICLE_MAPPING = (
+    Vehicle.vehicle_id == bindparam("cached_vehicle_id"),
+    Vehicle.immatriculation == bindparam("reported_immatriculation"),
+)
+_STATUS_STILL_MAPPED = exists().where(
+    VehicleStatus.vehicle_status_id == bindparam("cached_status_id"),
+    VehicleStatus.label == bindparam("status_label"),
+)
+_CHANGED_VEHICLE = (
+    update(Vehicle)
+    .where(
+        *_VEHICLE_MAPPING,
+        _STATUS_STILL_MAPPED,
+        Vehicle.status_id.is_distinct_from(bindparam("cached_status_id")),
+    )
+    .values(status_id=bindparam("cached_status_id"))
+    .returning(Vehicle.vehicle_id)
+    .cte("changed_vehicle")
+)
+_SET_VEHICLE_STATUS = select(
+    exists().where(*_VEHICLE_MAPPING).label("vehicle_known"),
+    _STATUS_STILL_MAPPED.label("status_known"),
+    exists(select(_CHANGED_VEHICLE.c.vehicle_id)).label("changed"),
+)
+_ACTIVE_ASSIGNMENT_BY_IMMATRICULATION = (
+    select(
+        Vehicle.vehicle_id,
+        VehicleAssignment.vehicle_assignment_id,
+        IncidentPhase.incident_phase_id,
+        IncidentPhase.incident_id,
+    )
+    .outerjoin(
+        VehicleAssignment,
+        (VehicleAssignment.vehicle_id == Vehicle.vehicle_id)
+        & VehicleAssignment.unassigned_at.is_(None),
+    )
+    .outerjoin(
+        IncidentPhase,
+        VehicleAssignment.incident_phase_id == IncidentPhase.incident_phase_id,
+    )
+    .where(Vehicle.immatriculation == bindparam("immatriculation"))
+)
+
 
 class VehiclePositionMessage(BaseModel):
     """Schema for vehicle position update from gateway."""
@@ -57,6 +115,14 @@ class TelemetryHandler:
     def __init__(self, postgres: PostgresManager, sse_manager: SSEManager):
         self._postgres = postgres
         self._sse_manager = sse_manager
+        # Immatriculations and status labels map to ids that only change when
+        # a vehicle is deleted or renamed, or a status removed, possibly on
+        # another worker: the conditional UPDATE re-checks the mapping and a
+        # stale entry is evicted and resolved again. The current status
+        # itself is never cached: it also changes through the CRUD and
+        # assignment paths, so it is compared in the database.
+        self._vehicle_ids: dict[str, UUID] = {}
+        self._status_ids: dict[str, UUID] = {}
 
     async def handle_vehicle_position_update(self, message: QueueEvent) -> None:
         """Handle vehicle position update from gateway."""
@@ -81,11 +147,12 @@ class TelemetryHandler:
         async with self._postgres.sessionmaker()() as session:
             # Find vehicle by immatriculation
             result = await session.execute(
-                select(Vehicle).where(Vehicle.immatriculation == data.immatriculation)
+                _VEHICLE_ID_BY_IMMATRICULATION,
+                {"immatriculation": data.immatriculation},
             )
-            vehicle = result.scalar_one_or_none()
+            vehicle_id = result.scalar_one_or_none()
 
-            if not vehicle:
+            if vehicle_id is None:
                 log.warning(
                     "telemetry.position.vehicle_not_found",
                     immatriculation=data.immatriculation,
@@ -95,7 +162,7 @@ class TelemetryHandler:
             # Create position log
             vehicle_service = VehicleService(session)
             await vehicle_service.create_vehicle_position(
-                vehicle.vehicle_id,
+                vehicle_id,
                 data.latitude,
                 data.longitude,
                 data.timestamp,
@@ -105,8 +172,8 @@ class TelemetryHandler:
             await self._sse_manager.notify(
                 Event.VEHICLE_POSITION_UPDATE.value,
                 {
-                    "vehicle_id": str(vehicle.vehicle_id),
-                    "vehicle_immatriculation": vehicle.immatriculation,
+                    "vehicle_id": str(vehicle_id),
+                    "vehicle_immatriculation": data.immatriculation,
                     "latitude": data.latitude,
                     "longitude": data.longitude,
                     "timestamp": data.timestamp.isoformat(),
@@ -139,63 +206,113 @@ class TelemetryHandler:
             return
 
         async with self._postgres.sessionmaker()() as session:
-            # Find vehicle by immatriculation
-            result = await session.execute(
-                select(Vehicle).where(Vehicle.immatriculation == data.immatriculation)
+            vehicle_id, changed = await self._set_vehicle_status(
+                session, data.immatriculation, data.status_label
             )
-            vehicle = result.scalar_one_or_none()
-
-            if not vehicle:
-                log.warning(
-                    "telemetry.status.vehicle_not_found",
+            if vehicle_id is None:
+                return
+            if not changed:
+                log.debug(
+                    "telemetry.status.unchanged",
                     immatriculation=data.immatriculation,
+                    status_label=data.status_label,
                 )
                 return
 
-            # Find status by label
-            status_result = await session.execute(
-                select(VehicleStatus).where(VehicleStatus.label == data.status_label)
-            )
-            status = status_result.scalar_one_or_none()
+            vehicle_service = VehicleService(session)
+            if data.status_label == STATUS_LABELS[2]:
+                await vehicle_service.mark_active_assignment_arrived(
+                    vehicle_id, datetime.now(timezone.utc)
+                )
 
-            if not status:
+            await session.commit()
+
+        # Notify SSE clients (frontends)
+        await self._sse_manager.notify(
+            Event.VEHICLE_STATUS_UPDATE.value,
+            {
+                "vehicle_id": str(vehicle_id),
+                "vehicle_immatriculation": data.immatriculation,
+                "status_label": data.status_label,
+                "timestamp": data.timestamp.isoformat(),
+            },
+        )
+
+    async def _set_vehicle_status(
+        self, session: AsyncSession, immatriculation: str, status_label: str
+    ) -> tuple[UUID | None, bool]:
+        """Apply the status if it differs; return the vehicle id and whether
+        the row changed. Does not commit."""
+        # A second attempt only follows an eviction, with freshly read ids
+        for _ in range(2):
+            vehicle_id = await self._resolve_vehicle_id(session, immatriculation)
+            if vehicle_id is None:
                 log.warning(
-                    "telemetry.status.status_not_found",
-                    status_label=data.status_label,
+                    "telemetry.status.vehicle_not_found",
+                    immatriculation=immatriculation,
                 )
-                return
-
-            # Update vehicle status
-            vehicle_service = VehicleService(session)
-            await vehicle_service.update_vehicle_status(
-                vehicle, status.vehicle_status_id
-            )
+                return None, False
 
-            if data.status_label == STATUS_LABELS[2]:
-                assignment_result = await session.execute(
-                    select(VehicleAssignment)
-                    .where(
-                        VehicleAssignment.vehicle_id == vehicle.vehicle_id,
-                        VehicleAssignment.unassigned_at.is_(None),
-                    )
-                    .order_by(VehicleAssignment.assigned_at.desc())
-                    .limit(1)
+            status_id = await self._resolve_status_id(session, status_label)
+            if status_id is None:
+                log.warning(
+                    "telemetry.status.status_not_found",
+                    status_label=status_label,
                 )
-                assignment = assignment_result.scalar_one_or_none()
-                if assignment and assignment.arrived_at is None:
-                    assignment.arrived_at = datetime.now(timezone.utc)
-                    await session.commit()
+                return None, False
 
-            # Notify SSE clients (frontends)
-            await self._sse_manager.notify(
-                Event.VEHICLE_STATUS_UPDATE.value,
+            result = await session.execute(
+                _SET_VEHICLE_STATUS,
                 {
-                    "vehicle_id": str(vehicle.vehicle_id),
-                    "vehicle_immatriculation": vehicle.immatriculation,
-                    "status_label": data.status_label,
-                    "timestamp": data.timestamp.isoformat(),
+                    "cached_vehicle_id": vehicle_id,
+                    "reported_immatriculation": immatriculation,
+                    "cached_status_id": status_id,
+                    "status_label": status_label,
                 },
             )
+            vehicle_known, status_known, changed = result.one()
+            if vehicle_known and status_known:
+                return vehicle_id, changed
+
+            if not vehicle_known:
+                self._vehicle_ids.pop(immatriculation, None)
+            if not status_known:
+                self._status_ids.pop(status_label, None)
+
+        log.warning(
+            "telemetry.status.mapping_changed",
+            immatriculation=immatriculation,
+            status_label=status_label,
+        )
+        return None, False
+
+    async def _resolve_vehicle_id(
+        self, session: AsyncSession, immatriculation: str
+    ) -> UUID | None:
+        vehicle_id = self._vehicle_ids.get(immatriculation)
+        if vehicle_id is not None:
+            return vehicle_id
+
+        vehicle_id = await session.scalar(
+            _VEHICLE_ID_BY_IMMATRICULATION, {"immatriculation": immatriculation}
+        )
+        if vehicle_id is not None:
+            self._vehicle_ids[immatriculation] = vehicle_id
+        return vehicle_id
+
+    async def _resolve_status_id(
+        self, session: AsyncSession, status_label: str
+    ) -> UUID | None:
+        status_id = self._status_ids.get(status_label)
+        if status_id is not None:
+            return status_id
+
+        status_id = await session.scalar(
+            _STATUS_ID_BY_LABEL, {"status_label": status_label}
+        )
+        if status_id is not None:
+            self._status_ids[status_label] = status_id
+        return status_id
 
     async def handle_incident_status_update(self, message: QueueEvent) -> None:
         """Handle incident status update from gateway.
@@ -222,107 +339,114 @@ class TelemetryHandler:
             )
             return
 
+        # Status 1 = incident phase ended, other statuses carry no action
+        if data.status != 1:
+            return
+
         async with self._postgres.sessionmaker()() as session:
-            # Find vehicle by immatriculation
+            # Find vehicle, its active assignment and the assigned phase at once
             result = await session.execute(
-                select(Vehicle).where(Vehicle.immatriculation == data.immatriculation)
+                _ACTIVE_ASSIGNMENT_BY_IMMATRICULATION,
+                {"immatriculation": data.immatriculation},
             )
-            vehicle = result.scalar_one_or_none()
+            row = result.one_or_none()
 
-            if not vehicle:
+            if row is None:
                 log.warning(
                     "telemetry.incident.vehicle_not_found",
                     immatriculation=data.immatriculation,
                 )
                 return
 
-            # Find active assignment for this vehicle
-            assignment_result = await session.execute(
-                select(VehicleAssignment)
-                .options(
-                    selectinload(VehicleAssignment.incident_phase)
-                    .selectinload(IncidentPhase.incident)
-                    .selectinload(Incident.phases)
-                )
-                .where(
-                    VehicleAssignment.vehicle_id == vehicle.vehicle_id,
-                    VehicleAssignment.unassigned_at.is_(None),
-                )
-            )
-            assignment = assignment_result.scalar_one_or_none()
-
-            if not assignment:
+            _, vehicle_assignment_id, incident_phase_id, incident_id = row
+            if vehicle_assignment_id is None:
                 log.warning(
                     "telemetry.incident.no_active_assignment",
                     immatriculation=data.immatriculation,
                 )
                 return
 
-            incident_phase = assignment.incident_phase
-            if not incident_phase:
+            if incident_phase_id is None:
                 log.warning(
                     "telemetry.incident.no_incident_phase",
                     immatriculation=data.immatriculation,
                 )
                 return
 
-            # Status 1 = incident phase ended
-            if data.status == 1:
-                # 1. Mark the phase as ended
-                incident_phase.ended_at = data.timestamp
-
-                # 2. Unassign all vehicles linked to this phase
-                phase_assignments_result = await session.execute(
-                    select(VehicleAssignment).where(
-                        VehicleAssignment.incident_phase_id
-                        == incident_phase.incident_phase_id,
-                        VehicleAssignment.unassigned_at.is_(None),
-                    )
-                )
-                phase_assignments = phase_assignments_result.scalars().all()
-                for phase_assignment in phase_assignments:
-                    phase_assignment.unassigned_at = data.timestamp
-
-                # 3. Check if all phases of the incident are ended
-                incident = incident_phase.incident
-                all_phases_ended = all(
-                    phase.ended_at is not None for phase in incident.phases
-                )
+            # 1. Mark the phase as ended
+            await session.execute(
+                update(IncidentPhase)
+                .where(IncidentPhase.incident_phase_id == incident_phase_id)
+                .values(ended_at=data.timestamp)
+                .execution_options(synchronize_session=False)
+            )
 
-                incident_ended = False
-                if all_phases_ended:
-                    incident.ended_at = data.timestamp
-                    incident_ended = True
-
-                await session.commit()
-
-                # Notify SSE clients (frontends)
-                await self._sse_manager.notify(
-                    Event.INCIDENT_STATUS_UPDATE.value,
-                    {
-                        "incident_id": str(incident_phase.incident_id),
-                        "incident_phase_id": str(incident_phase.incident_phase_id),
-                        "vehicle_immatriculation": vehicle.immatriculation,
-                        "phase_ended": True,
-                        "phase_ended_at": data.timestamp.isoformat(),
-                        "incident_ended": incident_ended,
-                        "incident_ended_at": data.timestamp.isoformat()
-                        if incident_ended
-                        else None,
-                    },
+            # 2. Unassign all vehicles linked to this phase
+            unassigned_result = await session.execute(
+                update(VehicleAssignment)
+                .where(
+                    VehicleAssignment.incident_phase_id == incident_phase_id,
+                    VehicleAssignment.unassigned_at.is_(None),
                 )
+                .values(unassigned_at=data.timestamp)
+                .returning(VehicleAssignment.vehicle_id)
+                .execution_options(synchronize_session=False)
+            )
+            unassigned_vehicle_ids = [
+                str(vehicle_id) for vehicle_id in unassigned_result.scalars()
+            ]
 
-                await self._sse_manager.notify(
-                    Event.INCIDENT_PHASE_UPDATE.value,
-                    {
-                        "incident_id": str(incident_phase.incident_id),
-                        "incident_phase_id": str(incident_phase.incident_phase_id),
-                        "updated_by": vehicle.immatriculation,
-                        "action": "phase_ended",
-                        "phase_ended_at": data.timestamp.isoformat(),
-                        "incident_ended": incident_ended,
-                    },
+            # 3. End the incident if none of its phases is still open
+            open_phases = (
+                select(IncidentPhase.incident_phase_id)
+                .where(
+                    IncidentPhase.incident_id == incident_id,
+                    IncidentPhase.ended_at.is_(None),
+                )
+                .exists()
+            )
+            incident_result = await session.execute(
+                update(Incident)
+                .where(
+                    Incident.incident_id == incident_id,
+                    ~open_phases,
                 )
+                .values(ended_at=data.timestamp)
+                .returning(Incident.incident_id)
+                .execution_options(synchronize_session=False)
+            )
+            incident_ended = incident_result.scalar_one_or_none() is not None
+
+            await session.commit()
+
+        # Notify SSE clients (frontends)
+        await self._sse_manager.notify(
+            Event.INCIDENT_STATUS_UPDATE.value,
+            {
+                "incident_id": str(incident_id),
+                "incident_phase_id": str(incident_phase_id),
+                "vehicle_immatriculation": data.immatriculation,
+                "phase_ended": True,
+                "phase_ended_at": data.timestamp.isoformat(),
+                "unassigned_vehicle_ids": unassigned_vehicle_ids,
+                "incident_ended": incident_ended,
+                "incident_ended_at": data.timestamp.isoformat()
+                if incident_ended
+                else None,
+            },
+        )
+
+        await self._sse_manager.notify(
+            Event.INCIDENT_PHASE_UPDATE.value,
+            {
+                "incident_id": str(incident_id),
+                "incident_phase_id": str(incident_phase_id),
+                "updated_by": data.immatriculation,
+                "action": "phase_ended",
+                "phase_ended_at": data.timestamp.isoformat(),
+                "incident_ended": incident_ended,
+            },
+        )
 
 
 class IncidentStatusMessage(BaseModel):
@@ -0,0 +1,366 @@
+"""Partition, retention and rollup maintenance for vehicle position logs."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import DatabaseSettings
+from app.core.logging import get_logger
+from app.models import VehiclePositionLog, VehiclePositionRollup
+from app.services.db.postgres import PostgresManager
+
+log = get_logger(__name__)
+
+PARENT_TABLE = VehiclePositionLog.__tablename__
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+# Partition names encode their interval so retention stays correct if the
+# configured interval changes: <parent>_d20260101 (day), <parent>_w20251229 (week)
+_INTERVAL_PREFIX = {"day": "d", "week": "w"}
+_INTERVAL_LENGTH = {"d": timedelta(days=1), "w": timedelta(weeks=1)}
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_(?P<kind>[dw])(?P<start>\d{{8}})$")
+
+# Columns copied when rows move out of the default partition (the generated
+# `geog` column is recomputed by the target)
+_STORED_COLUMNS = ", ".join(
+    column.name
+    for column in VehiclePositionLog.__table__.columns
+    if column.computed is None
+)
+
+# Re-aggregate the last minutes on every run to pick up late telemetry
+_ROLLUP_LOOKBACK = timedelta(minutes=5)
+
+
+def partition_start(day: date, interval: str) -> date:
+    """Return the first day of the partition containing `day`."""
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def partition_name(start: date, interval: str) -> str:
+    return f"{PARENT_TABLE}_{_INTERVAL_PREFIX[interval]}{start:%Y%m%d}"
+
+
+def partition_end(name: str) -> date | None:
+    """Return the exclusive upper bound encoded in a partition name."""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    start = datetime.strptime(match["start"], "%Y%m%d").date()
+    return start + _INTERVAL_LENGTH[match["kind"]]
+
+
+class PositionLogMaintenance:
+    """
+    Keeps `vehicle_position_logs` partitions, retention and rollups current.
+
+    Each run creates partitions ahead of time, rolls complete minutes into
+    `vehicle_position_rollups`, detaches and drops partitions older than the
+    retention period, then prunes expired rollups. Rows that landed in the
+    default partition are moved into their range partition when it is
+    created, and deleted once past the retention period. A failed create or
+    drop is logged and retried on the next run without stopping the others.
+    A table that is not partitioned (created before partitioning) only gets
+    its rollups; converting it is described in the README.
+    """
+
+    def __init__(self, postgres: PostgresManager, settings: DatabaseSettings):
+        self._postgres = postgres
+        self._interval = settings.position_logs_partition_interval
+        self._partitions_ahead = settings.position_logs_partitions_ahead
+        self._retention = timedelta(days=settings.position_logs_retention_days)
+        self._rollup_retention = timedelta(
+            days=settings.position_rollups_retention_days
+        )
+        self._run_interval = settings.position_logs_maintenance_interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Run maintenance once, then periodically in the background."""
+        if self._task is not None:
+            return
+        await self._run_safely()
+        self._task = asyncio.create_task(self._run_periodically())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self, now: datetime | None = None) -> None:
+        now = now or datetime.now(timezone.utc)
+        engine = self._postgres.engine()
+
+        async with engine.connect() as conn:
+            partitioned = await self._is_partitioned(conn)
+        if not partitioned:
+            # Rollups still run; partitions and retention need the conversion
+            log.warning("position_logs.maintenance.not_partitioned")
+
+        created = await self._ensure_partitions(now.date()) if partitioned else 0
+        async with engine.begin() as conn:
+            rolled_up = await self._rollup(conn, now)
+        dropped = await self._drop_expired_partitions(now.date()) if partitioned else 0
+        async with engine.begin() as conn:
+            expired_default_rows = (
+                await self._prune_default_partition(conn, now.date())
+                if partitioned
+                else 0
+            )
+            pruned = await self._prune_rollups(conn, now)
+
+        log.info(
+            "position_logs.maintenance.completed",
+            partitions_created=created,
+            partitions_dropped=dropped,
+            default_partition_rows_pruned=expired_default_rows,
+            rollup_rows=rolled_up,
+            rollup_rows_pruned=pruned,
+        )
+
+    async def _run_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._run_interval)
+            await self._run_safely()
+
+    async def _run_safely(self) -> None:
+        try:
+            await self.run_once()
+        except Exception as exc:
+            log.error("position_logs.maintenance.failed", error=str(exc))
+
+    @staticmethod
+    async def _is_partitioned(conn: AsyncConnection) -> bool:
+        relkind = await conn.scalar(
+            text("SELECT relkind::text FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": PARENT_TABLE},
+        )
+        return relkind == "p"
+
+    async def _list_partitions(self) -> list[str]:
+        async with self._postgres.engine().connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT child.relname FROM pg_inherits "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE pg_inherits.inhparent = to_regclass(:name)"
+                ),
+                {"name": PARENT_TABLE},
+            )
+            return list(result.scalars())
+
+    async def _ensure_partitions(self, today: date) -> int:
+        existing = set(await self._list_partitions())
+        created = 0
+
+        has_default = DEFAULT_PARTITION in existing
+        if not has_default:
+            has_default = await self._execute_ddl(
+                DEFAULT_PARTITION,
+                [
+                    f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+                    f"PARTITION OF {PARENT_TABLE} DEFAULT"
+                ],
+            )
+            created += has_default
+
+        start = partition_start(today, self._interval)
+        step = timedelta(weeks=1) if self._interval == "week" else timedelta(days=1)
+        for _ in range(self._partitions_ahead + 1):
+            name = partition_name(start, self._interval)
+            end = start + step
+            if name not in existing:
+                created += await self._create_range_partition(
+                    name, start, end, has_default
+                )
+            start = end
+        return created
+
+    async def _create_range_partition(
+        self, name: str, start: date, end: date, has_default: bool
+    ) -> bool:
+        lower = f"'{start.isoformat()} 00:00:00+00'"
+        upper = f"'{end.isoformat()} 00:00:00+00'"
+        in_range = f"timestamp >= {lower} AND timestamp < {upper}"
+        bounds = f"FOR VALUES FROM ({lower}) TO ({upper})"
+
+        stray_rows = 0
+        if has_default:
+            async with self._postgres.engine().connect() as conn:
+                stray_rows = await conn.scalar(
+                    text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE {in_range}")
+                )
+        if not stray_rows:
+            return await self._execute_ddl(
+                name,
+                [
+                    f"CREATE TABLE IF NOT EXISTS {name} "
+                    f"PARTITION OF {PARENT_TABLE} {bounds}"
+                ],
+            )
+
+        # PostgreSQL refuses a partition whose range already has rows in the
+        # default partition: build it detached, move the rows, then attach it.
+        # Inserts into the default partition wait for the move to finish.
+        log.warning(
+            "position_logs.partition.moving_default_rows",
+            partition=name,
+            rows=stray_rows,
+        )
+        return await self._execute_ddl(
+            name,
+            [
+                f"LOCK TABLE {DEFAULT_PARTITION} IN EXCLUSIVE MODE",
+                f"CREATE TABLE {name} (LIKE {PARENT_TABLE} "
+                "INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS)",
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {in_range} "
+                f"RETURNING {_STORED_COLUMNS}) "
+                f"INSERT INTO {name} ({_STORED_COLUMNS}) "
+                f"SELECT {_STORED_COLUMNS} FROM moved",
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} {bounds}",
+            ],
+        )
+
+    async def _execute_ddl(self, name: str, statements: list[str]) -> bool:
+        """Run `statements` in one transaction; False (logged) if it failed."""
+        try:
+            async with self._postgres.engine().begin() as conn:
+                for statement in statements:
+                    await conn.execute(text(statement))
+        except DBAPIError as exc:
+            log.error(
+                "position_logs.partition.create_failed",
+                partition=name,
+                error=str(exc.orig) if exc.orig else str(exc),
+            )
+            return False
+        return True
+
+    async def _drop_expired_partitions(self, today: date) -> int:
+        cutoff = today - self._retention
+        dropped = 0
+        for name in await self._list_partitions():
+            end = partition_end(name)
+            if end is None or end > cutoff:
+                continue
+            try:
+                async with self._postgres.engine().begin() as conn:
+                    await conn.execute(
+                        text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}")
+                    )
+                    await conn.execute(text(f"DROP TABLE {name}"))
+            except DBAPIError as exc:
+                # Typically dropped meanwhile by another worker; retried next run
+                log.error(
+                    "position_logs.partition.drop_failed",
+                    partition=name,
+                    error=str(exc.orig) if exc.orig else str(exc),
+                )
+                continue
+            log.info("position_logs.partition.dropped", partition=name)
+            dropped += 1
+        return dropped
+
+    async def _prune_default_partition(self, conn: AsyncConnection, today: date) -> int:
+        """Apply the retention to the default partition and report what is left."""
+        if not await conn.scalar(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": DEFAULT_PARTITION}
+        ):
+            return 0
+        cutoff = today - self._retention
+        result = await conn.execute(
+            text(
+                f"DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE timestamp < '{cutoff.isoformat()} 00:00:00+00'"
+            )
+        )
+        remaining = await conn.scalar(text(f"SELECT count(*) FROM {DEFAULT_PARTITION}"))
+        if remaining:
+            # Rows outside every range partition: telemetry clock skew, or a
+            # day without maintenance. Moved once their partition is created.
+            log.warning(
+                "position_logs.default_partition.not_empty",
+                rows=remaining,
+            )
+        return result.rowcount or 0
+
+    async def _rollup(self, conn: AsyncConnection, now: datetime) -> int:
+        last_bucket = await conn.scalar(select(func.max(VehiclePositionRollup.bucket)))
+        since = (
+            last_bucket - _ROLLUP_LOOKBACK
+            if last_bucket is not None
+            else now - self._retention
+        )
+        until = now.replace(second=0, microsecond=0)
+        if since >= until:
+            return 0
+
+        bucket = func.date_trunc("minute", VehiclePositionLog.timestamp)
+        latest_first = VehiclePositionLog.timestamp.desc()
+        source = (
+            select(
+                VehiclePositionLog.vehicle_id,
+                bucket.label("bucket"),
+                array_agg(
+                    aggregate_order_by(VehiclePositionLog.latitude, latest_first)
+                )[1].label("latitude"),
+                array_agg(
+                    aggregate_order_by(VehiclePositionLog.longitude, latest_first)
+                )[1].label("longitude"),
+                func.max(VehiclePositionLog.timestamp).label("last_timestamp"),
+                func.count().label("sample_count"),
+            )
+            .where(
+                VehiclePositionLog.timestamp >= since,
+                VehiclePositionLog.timestamp < until,
+            )
+            .group_by(VehiclePositionLog.vehicle_id, bucket)
+        )
+        stmt = pg_insert(VehiclePositionRollup).from_select(
+            [
+                "vehicle_id",
+                "bucket",
+                "latitude",
+                "longitude",
+                "last_timestamp",
+                "sample_count",
+            ],
+            source,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                VehiclePositionRollup.vehicle_id,
+                VehiclePositionRollup.bucket,
+            ],
+            set_={
+                "latitude": stmt.excluded.latitude,
+                "longitude": stmt.excluded.longitude,
+                "last_timestamp": stmt.excluded.last_timestamp,
+                "sample_count": stmt.excluded.sample_count,
+            },
+        )
+        result = await conn.execute(stmt)
+        return result.rowcount or 0
+
+    async def _prune_rollups(self, conn: AsyncConnection, now: datetime) -> int:
+        result = await conn.execute(
+            delete(VehiclePositionRollup).where(
+                VehiclePositionRollup.bucket < now - self._rollup_retention
+            )
+        )
+        return result.rowcount or 0
@@ -0,0 +1,187 @@
+"""
+Tâches différées persistées en base, exécutées au moins une fois par le cluster.
+
+Un worker qui tombe entre le gestionnaire et la suppression de la tâche, ou un
+gestionnaire qui dépasse son bail, fait rejouer la tâche : les gestionnaires
+doivent être idempotents.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from sqlalchemy import (
+    Interval,
+    String,
+    any_,
+    bindparam,
+    delete,
+    func,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.models import ScheduledJob
+from app.services.db.postgres import PostgresManager
+
+log = get_logger(__name__)
+
+JobHandler = Callable[[UUID], Awaitable[None]]
+
+# Tâches échues, les plus anciennes d'abord ; celles verrouillées par un
+# autre worker sont ignorées au lieu d'être attendues
+_DUE_JOBS = (
+    select(ScheduledJob.kind, ScheduledJob.subject_id)
+    .where(
+        ScheduledJob.kind == any_(bindparam("kinds", type_=ARRAY(String()))),
+        ScheduledJob.run_at <= func.now(),
+    )
+    .order_by(ScheduledJob.run_at)
+    .limit(bindparam("batch_size"))
+    .with_for_update(skip_locked=True)
+)
+# Réservation : `run_at` repoussé de la durée du bail. Si le worker tombe,
+# la tâche redevient échue à la fin du bail et un autre la reprend.
+_CLAIM_DUE_JOBS = (
+    update(ScheduledJob)
+    .where(tuple_(ScheduledJob.kind, ScheduledJob.subject_id).in_(_DUE_JOBS))
+    .values(
+        run_at=func.now() + bindparam("lease", type_=Interval()),
+        attempts=ScheduledJob.attempts + 1,
+    )
+    .returning(ScheduledJob.kind, ScheduledJob.subject_id, ScheduledJob.attempts)
+    .execution_options(synchronize_session=False)
+)
+_DELETE_JOB = delete(ScheduledJob).where(
+    ScheduledJob.kind == bindparam("kind"),
+    ScheduledJob.subject_id == bindparam("subject_id"),
+)
+
+
+async def schedule_job(
+    session: AsyncSession, kind: str, subject_id: UUID, run_at: datetime
+) -> None:
+    """
+    Planifie `kind` pour `subject_id` dans la transaction de `session`.
+
+    Sans effet si la tâche est déjà planifiée.
+    """
+    await session.execute(
+        pg_insert(ScheduledJob)
+        .values(kind=kind, subject_id=subject_id, run_at=run_at)
+        .on_conflict_do_nothing()
+    )
+
+
+class JobScheduler:
+    """
+    Exécute les tâches de `scheduled_jobs` arrivées à échéance.
+
+    Chaque worker relève les tâches échues toutes les `poll_interval`
+    secondes (`FOR UPDATE SKIP LOCKED`) : une tâche n'est réservée que par
+    un seul worker à la fois, et survit aux redémarrages. Une tâche en attente n'est
+    qu'une ligne indexée sur `run_at`, sans coroutine ni minuteur en mémoire.
+
+    Un gestionnaire qui lève une exception est relancé à la fin du bail,
+    au plus `max_attempts` fois ; il doit donc être idempotent.
+    """
+
+    def __init__(
+        self,
+        postgres: PostgresManager,
+        poll_interval_seconds: float = 1.0,
+        batch_size: int = 20,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3,
+    ):
+        self._postgres = postgres
+        self._poll_interval = poll_interval_seconds
+        self._batch_size = batch_size
+        self._lease = timedelta(seconds=lease_seconds)
+        self._max_attempts = max_attempts
+        self._handlers: dict[str, JobHandler] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_periodically())
+
+    async def stop(self) -> None:
+        # Une tâche interrompue reste réservée jusqu'à la fin de son bail
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_due(self) -> int:
+        """Réserve et exécute un lot de tâches échues ; renvoie leur nombre."""
+        if not self._handlers:
+            return 0
+        async with self._postgres.engine().begin() as conn:
+            jobs = (
+                await conn.execute(
+                    _CLAIM_DUE_JOBS,
+                    {
+                        "kinds": list(self._handlers),
+                        "batch_size": self._batch_size,
+                        "lease": self._lease,
+                    },
+                )
+            ).all()
+        await asyncio.gather(
+            *(
+                self._run_job(kind, subject_id, attempts)
+                for kind, subject_id, attempts in jobs
+            )
+        )
+        return len(jobs)
+
+    async def _run_job(self, kind: str, subject_id: UUID, attempts: int) -> None:
+        try:
+            await self._handlers[kind](subject_id)
+        except Exception as exc:
+            if attempts < self._max_attempts:
+                log.warning(
+                    "scheduler.job.failed",
+                    kind=kind,
+                    subject_id=str(subject_id),
+                    attempts=attempts,
+                    error=str(exc),
+                )
+                return
+            log.error(
+                "scheduler.job.abandoned",
+                kind=kind,
+                subject_id=str(subject_id),
+                attempts=attempts,
+                error=str(exc),
+            )
+
+        async with self._postgres.engine().begin() as conn:
+            await conn.execute(_DELETE_JOB, {"kind": kind, "subject_id": subject_id})
+
+    async def _run_periodically(self) -> None:
+        while True:
+            try:
+                claimed = await self.run_due()
+            except Exception as exc:
+                log.error("scheduler.poll.failed", error=str(exc))
+                claimed = 0
+            # Lot complet : d'autres tâches sont peut-être déjà échues
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
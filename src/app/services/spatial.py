@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from geoalchemy2 import Geography
+from sqlalchemy import ColumnElement, cast, func, select
+from sqlalchemy.dialects.postgresql import distinct_on
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models import InterestPoint, VehiclePositionLog
+
+_GEOGRAPHY = Geography(srid=4326)
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """Emprise géographique en degrés WGS84."""
+
+    min_latitude: float
+    min_longitude: float
+    max_latitude: float
+    max_longitude: float
+
+
+def geography_point(latitude: float, longitude: float) -> ColumnElement[Any]:
+    """Construit un point `geography` à partir de coordonnées WGS84."""
+    return cast(
+        func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326), _GEOGRAPHY
+    )
+
+
+def within_radius(
+    column: ColumnElement[Any], latitude: float, longitude: float, meters: float
+) -> ColumnElement[bool]:
+    """Filtre `ST_DWithin` (utilise l'index GiST) sur un rayon en mètres."""
+    return func.ST_DWithin(column, geography_point(latitude, longitude), meters)
+
+
+def distance_meters(
+    column: ColumnElement[Any], latitude: float, longitude: float
+) -> ColumnElement[float]:
+    """Distance sphéroïdale exacte en mètres."""
+    return func.ST_Distance(column, geography_point(latitude, longitude))
+
+
+def nearest_first(
+    column: ColumnElement[Any], latitude: float, longitude: float
+) -> ColumnElement[Any]:
+    """Critère de tri KNN (`<->`) parcouru directement dans l'index GiST."""
+    return column.op("<->")(geography_point(latitude, longitude))
+
+
+def within_bbox(column: ColumnElement[Any], bbox: BoundingBox) -> ColumnElement[bool]:
+    """Filtre d'intersection d'emprise (`&&`) servi par l'index GiST."""
+    envelope = func.ST_MakeEnvelope(
+        bbox.min_longitude,
+        bbox.min_latitude,
+        bbox.max_longitude,
+        bbox.max_latitude,
+        4326,
+    )
+    return column.op("&&")(cast(envelope, _GEOGRAPHY))
+
+
+class SpatialService:
+    """
+    Requêtes de proximité sur les colonnes `geog` indexées.
+
+    Sert `/terrain/interest-points/nearby` et `/qg/vehicles/nearby`.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def interest_points_within_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        meters: float,
+        kind_id: UUID | None = None,
+        limit: int = 100,
+    ) -> list[tuple[InterestPoint, float]]:
+        """Points d'intérêt dans un rayon, triés du plus proche au plus loin."""
+        distance = distance_meters(InterestPoint.geog, latitude, longitude)
+        stmt = (
+            select(InterestPoint, distance.label("distance_m"))
+            .where(within_radius(InterestPoint.geog, latitude, longitude, meters))
+            .order_by(distance)
+            .limit(limit)
+        )
+        if kind_id is not None:
+            stmt = stmt.where(InterestPoint.interest_point_kind_id == kind_id)
+        result = await self.session.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def nearest_interest_points(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int = 5,
+        kind_id: UUID | None = None,
+    ) -> list[tuple[InterestPoint, float]]:
+        """Les `limit` points d'intérêt les plus proches (recherche KNN)."""
+        stmt = (
+            select(
+                InterestPoint,
+                distance_meters(InterestPoint.geog, latitude, longitude).label(
+                    "distance_m"
+                ),
+            )
+            .where(InterestPoint.geog.is_not(None))
+            .order_by(nearest_first(InterestPoint.geog, latitude, longitude))
+            .limit(limit)
+        )
+        if kind_id is not None:
+            stmt = stmt.where(InterestPoint.interest_point_kind_id == kind_id)
+        result = await self.session.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def vehicles_within_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        meters: float,
+        since: datetime,
+    ) -> list[tuple[VehiclePositionLog, float]]:
+        """
+        Véhicules dont la dernière position depuis `since` est dans le rayon.
+
+        La dernière position de chaque véhicule est choisie avant le filtre
+        `ST_DWithin` : un véhicule sorti du rayon n'est pas rapporté à son
+        ancienne position. `since` borne la recherche dans le temps pour
+        limiter les partitions de `vehicle_position_logs` parcourues.
+        """
+        latest = (
+            select(VehiclePositionLog)
+            .where(VehiclePositionLog.timestamp >= since)
+            .ext(distinct_on(VehiclePositionLog.vehicle_id))
+            .order_by(
+                VehiclePositionLog.vehicle_id,
+                VehiclePositionLog.timestamp.desc(),
+            )
+            .subquery()
+        )
+        position = aliased(VehiclePositionLog, latest)
+        distance = distance_meters(latest.c.geog, latitude, longitude)
+        result = await self.session.execute(
+            select(position, distance.label("distance_m"))
+            .where(within_radius(latest.c.geog, latitude, longitude, meters))
+            .order_by(distance)
+        )
+        return [(row[0], row[1]) for row in result.all()]
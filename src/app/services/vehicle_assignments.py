@@ -4,17 +4,32 @@ import asyncio
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, Sequence
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Uuid, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.logging import get_logger
 from app.models import Vehicle, VehicleAssignment, VehicleStatus
+from app.services.assignment_acks import AssignmentAckRegistry
 from app.services.events import Event
 from app.services.messaging.queues import Queue
 from app.services.messaging.rabbitmq import RabbitMQManager
 
+log = get_logger(__name__)
+
+# Vérification groupée des accusés dont l'événement n'est pas arrivé
+_VEHICLE_IDS_WITH_STATUS = (
+    select(Vehicle.vehicle_id)
+    .join(VehicleStatus, Vehicle.status_id == VehicleStatus.vehicle_status_id)
+    .where(
+        Vehicle.vehicle_id == any_(bindparam("vehicle_ids", type_=ARRAY(Uuid()))),
+        VehicleStatus.label == bindparam("status_label"),
+    )
+)
+
 
 @dataclass(frozen=True)
 class VehicleAssignmentTarget:
@@ -25,62 +40,103 @@ class VehicleAssignmentTarget:
 async def send_assignment_to_vehicles_and_wait_for_ack(
     session: AsyncSession,
     rabbitmq: RabbitMQManager,
+    acks: AssignmentAckRegistry,
     targets: Sequence[VehicleAssignmentTarget],
     incident_latitude: float,
     incident_longitude: float,
     engaged_status_label: str,
     max_attempts: int = 5,
-    retry_delay_seconds: float = 1.0,
+    ack_timeout_seconds: float = 1.0,
 ) -> tuple[list[VehicleAssignmentTarget], list[VehicleAssignmentTarget]]:
+    """
+    Envoie l'affectation aux véhicules et attend qu'ils passent au statut
+    `engaged_status_label`.
+
+    Les messages sont publiés en parallèle. Chaque tentative se termine dès
+    que tous les véhicules livrés ont accusé réception (événement de statut),
+    ou après `ack_timeout_seconds` : les véhicules restants sont alors
+    vérifiés en une seule requête, puis l'affectation leur est renvoyée.
+    """
     if not targets:
         return [], []
 
-    await _send_assignments(
-        rabbitmq,
-        targets,
-        incident_latitude,
-        incident_longitude,
-    )
-
-    pending_targets = list(targets)
-    engaged_targets: list[VehicleAssignmentTarget] = []
-
-    for attempt in range(max_attempts):
-        if not pending_targets:
-            break
-
-        if retry_delay_seconds:
-            await asyncio.sleep(retry_delay_seconds)
-
-        still_pending: list[VehicleAssignmentTarget] = []
-        for target in pending_targets:
-            status_label = await session.scalar(
-                select(VehicleStatus.label)
-                .join(Vehicle, Vehicle.status_id == VehicleStatus.vehicle_status_id)
-                .where(Vehicle.vehicle_id == target.vehicle_id)
-            )
-
-            if status_label == engaged_status_label:
-                engaged_targets.append(target)
+    # Enregistrées avant l'envoi : un accusé immédiat n'est pas perdu
+    acked = {
+        target.vehicle_id: acks.expect(target.vehicle_id, engaged_status_label)
+        for target in targets
+    }
+    try:
+        undelivered = await _send_assignments(
+            rabbitmq,
+            targets,
+            incident_latitude,
+            incident_longitude,
+        )
+
+        pending_targets = list(targets)
+        engaged_targets: list[VehicleAssignmentTarget] = []
+
+        for attempt in range(max_attempts):
+            if not pending_targets:
+                break
+
+            # Un véhicule non livré ne peut pas accuser réception : seuls les
+            # autres sont attendus (délai conservé entre deux renvois)
+            awaited = [
+                acked[target.vehicle_id]
+                for target in pending_targets
+                if target not in undelivered
+            ]
+            if awaited:
+                await asyncio.wait(awaited, timeout=ack_timeout_seconds)
             else:
-                still_pending.append(target)
-
-        pending_targets = still_pending
-
-        if pending_targets and attempt < max_attempts - 1:
-            await _send_assignments(
-                rabbitmq,
-                pending_targets,
-                incident_latitude,
-                incident_longitude,
+                await asyncio.sleep(ack_timeout_seconds)
+            unconfirmed_ids = [
+                target.vehicle_id
+                for target in pending_targets
+                if not acked[target.vehicle_id].done()
+            ]
+            engaged_ids = (
+                set(
+                    await session.scalars(
+                        _VEHICLE_IDS_WITH_STATUS,
+                        {
+                            "vehicle_ids": unconfirmed_ids,
+                            "status_label": engaged_status_label,
+                        },
+                    )
+                )
+                if unconfirmed_ids
+                else set()
             )
 
+            still_pending: list[VehicleAssignmentTarget] = []
+            for target in pending_targets:
+                if acked[target.vehicle_id].done() or target.vehicle_id in engaged_ids:
+                    engaged_targets.append(target)
+                else:
+                    still_pending.append(target)
+
+            pending_targets = still_pending
+
+            if pending_targets and attempt < max_attempts - 1:
+                undelivered = await _send_assignments(
+                    rabbitmq,
+                    pending_targets,
+                    incident_latitude,
+                    incident_longitude,
+                )
+    finally:
+        for vehicle_id, future in acked.items():
+            acks.discard(vehicle_id, future)
+
     return engaged_targets, pending_targets
 
 
 async def create_assignments_and_wait_for_ack(
     session: AsyncSession,
     rabbitmq: RabbitMQManager,
+    acks: AssignmentAckRegistry,
     assignments: Sequence[VehicleAssignment],
     targets: Sequence[VehicleAssignmentTarget],
     incident_latitude: float,
@@ -88,7 +144,7 @@ async def create_assignments_and_wait_for_ack(
     engaged_status_label: str,
     validated_by_operator_id: UUID | None,
     max_attempts: int = 5,
-    retry_delay_seconds: float = 1.0,
+    ack_timeout_seconds: float = 1.0,
 ) -> tuple[list[VehicleAssignment], list[VehicleAssignmentTarget]]:
     if not assignments:
         return [], []
@@ -102,12 +158,13 @@ async def create_assignments_and_wait_for_ack(
     ) = await send_assignment_to_vehicles_and_wait_for_ack(
         session=session,
         rabbitmq=rabbitmq,
+        acks=acks,
         targets=targets,
         incident_latitude=incident_latitude,
         incident_longitude=incident_longitude,
         engaged_status_label=engaged_status_label,
         max_attempts=max_attempts,
-        retry_delay_seconds=retry_delay_seconds,
+        ack_timeout_seconds=ack_timeout_seconds,
     )
 
     engaged_vehicle_ids = {target.vehicle_id for target in engaged_targets}
@@ -156,24 +213,40 @@ def build_assignment_event_payload(
 
 async def _send_assignments(
     rabbitmq: RabbitMQManager,
-    targets: Iterable[VehicleAssignmentTarget],
+    targets: Sequence[VehicleAssignmentTarget],
     incident_latitude: float,
     incident_longitude: float,
-) -> None:
-    for target in targets:
-        assignment_message = {
-            "event": Event.VEHICLE_ASSIGNMENT.value,
-            "payload": {
-                "immatriculation": target.immatriculation,
-                "latitude": round(incident_latitude, 6),
-                "longitude": round(incident_longitude, 6),
-            },
-        }
-        try:
-            await rabbitmq.enqueue(
-                Queue.VEHICLE_ASSIGNMENTS,
-                json.dumps(assignment_message).encode(),
-                timeout=5.0,
-            )
-        except asyncio.TimeoutError:
-            pass
+) -> list[VehicleAssignmentTarget]:
+    """
+    Publie l'affectation à tous les véhicules en parallèle (confirmations
+    du broker attendues ensemble) ; renvoie les véhicules non livrés.
+    """
+    messages = [
+        json.dumps(
+            {
+                "event": Event.VEHICLE_ASSIGNMENT.value,
+                "payload": {
+                    "immatriculation": target.immatriculation,
+                    "latitude": round(incident_latitude, 6),
+                    "longitude": round(incident_longitude, 6),
+                },
+            }
+        ).encode()
+        for target in targets
+    ]
+    results = await rabbitmq.publish_many(
+        Queue.VEHICLE_ASSIGNMENTS, messages, timeout=5.0
+    )
+
+    undelivered: list[VehicleAssignmentTarget] = []
+    for target, error in zip(targets, results, strict=True):
+        if error is None:
+            continue
+        undelivered.append(target)
+        log.warning(
+            "vehicle_assignment.dispatch_failed",
+            vehicle_id=target.vehicle_id,
+            immatriculation=target.immatriculation,
+            error=str(error) or type(error).__name__,
+        )
+    return undelivered
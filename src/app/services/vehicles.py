@@ -1,17 +1,38 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any, Literal
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    BigInteger,
+    Text,
+    Uuid,
+    any_,
+    bindparam,
+    cast,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models import (
+    Energy,
+    InterestPoint,
     Vehicle,
+    VehicleAssignment,
+    VehicleAssignmentProposal,
+    VehicleAssignmentProposalItem,
     VehicleConsumableStock,
+    VehicleConsumableType,
     VehiclePositionLog,
     VehicleStatus,
+    VehicleTombstone,
+    VehicleType,
 )
 from app.schemas.qg.vehicles import (
     QGActiveAssignment,
@@ -21,9 +42,178 @@ from app.schemas.qg.vehicles import (
     QGVehicleConsumableStock,
     QGVehicleDetail,
     QGVehiclePosition,
+    QGVehiclesListRead,
+    QGVehiclesSummaryListRead,
     QGVehicleStatusRef,
     QGVehicleTypeDetail,
 )
+from app.services.db.postgres import gather_reads
+
+FleetView = Literal["full", "summary"]
+
+# Requêtes chaudes construites une seule fois : seuls les paramètres liés
+# changent, SQLAlchemy réutilise la clé de cache et la requête compilée.
+# `= ANY(tableau)` plutôt que `IN (...)` : un seul texte SQL quel que soit le
+# nombre d'ids, donc une seule requête préparée côté asyncpg.
+_vehicle_ids = bindparam("vehicle_ids", type_=ARRAY(Uuid()))
+_latest_timestamps = (
+    select(
+        VehiclePositionLog.vehicle_id,
+        func.max(VehiclePositionLog.timestamp).label("max_timestamp"),
+    )
+    .where(VehiclePositionLog.vehicle_id == any_(_vehicle_ids))
+    .group_by(VehiclePositionLog.vehicle_id)
+    .subquery()
+)
+_LATEST_POSITIONS = select(VehiclePositionLog).join(
+    _latest_timestamps,
+    (VehiclePositionLog.vehicle_id == _latest_timestamps.c.vehicle_id)
+    & (VehiclePositionLog.timestamp == _latest_timestamps.c.max_timestamp),
+)
+_MARK_ACTIVE_ASSIGNMENT_ARRIVED = (
+    update(VehicleAssignment)
+    .where(
+        VehicleAssignment.vehicle_id == bindparam("vehicle_id"),
+        VehicleAssignment.unassigned_at.is_(None),
+        VehicleAssignment.arrived_at.is_(None),
+    )
+    .values(arrived_at=bindparam("arrived_at"))
+    .returning(VehicleAssignment.vehicle_assignment_id)
+    .execution_options(synchronize_session=False)
+)
+
+# Lecture de la flotte en tuples Core : ni entités ORM ni carte d'identité,
+# une ligne par véhicule avec ses références (type, énergie, statut, base).
+_FLEET_VEHICLE_ROWS = (
+    select(
+        Vehicle.vehicle_id,
+        Vehicle.immatriculation,
+        Vehicle.energy_level,
+        VehicleType.vehicle_type_id,
+        VehicleType.code,
+        VehicleType.label,
+        Energy.energy_id,
+        Energy.label,
+        VehicleStatus.vehicle_status_id,
+        VehicleStatus.label,
+        InterestPoint.interest_point_id,
+        InterestPoint.name,
+        InterestPoint.address,
+        InterestPoint.zipcode,
+        InterestPoint.city,
+        InterestPoint.latitude,
+        InterestPoint.longitude,
+        Vehicle.change_version,
+    )
+    .join(VehicleType, Vehicle.vehicle_type_id == VehicleType.vehicle_type_id)
+    .outerjoin(Energy, Vehicle.energy_id == Energy.energy_id)
+    .outerjoin(VehicleStatus, Vehicle.status_id == VehicleStatus.vehicle_status_id)
+    .outerjoin(
+        InterestPoint,
+        Vehicle.base_interest_point_id == InterestPoint.interest_point_id,
+    )
+    .order_by(Vehicle.immatriculation)
+)
+# Projection `summary` : ni énergie, ni base, ni stocks, ni affectation
+_FLEET_SUMMARY_ROWS = (
+    select(
+        Vehicle.vehicle_id,
+        Vehicle.immatriculation,
+        VehicleType.vehicle_type_id,
+        VehicleType.code,
+        VehicleType.label,
+        VehicleStatus.vehicle_status_id,
+        VehicleStatus.label,
+        Vehicle.change_version,
+    )
+    .join(VehicleType, Vehicle.vehicle_type_id == VehicleType.vehicle_type_id)
+    .outerjoin(VehicleStatus, Vehicle.status_id == VehicleStatus.vehicle_status_id)
+    .order_by(Vehicle.immatriculation)
+)
+_FLEET_STOCK_ROWS = select(
+    VehicleConsumableStock.vehicle_id,
+    VehicleConsumableType.vehicle_consumable_type_id,
+    VehicleConsumableType.label,
+    VehicleConsumableType.unit,
+    VehicleConsumableStock.current_quantity,
+    VehicleConsumableStock.last_update,
+).join(
+    VehicleConsumableType,
+    VehicleConsumableStock.consumable_type_id
+    == VehicleConsumableType.vehicle_consumable_type_id,
+)
+# Affectations actives seulement : même prédicat que l'index partiel
+# uq_vehicle_active_assignment, le coût ne dépend pas de l'historique
+_FLEET_ASSIGNMENT_ROWS = select(
+    VehicleAssignment.vehicle_id,
+    VehicleAssignment.vehicle_assignment_id,
+    VehicleAssignment.incident_phase_id,
+    VehicleAssignment.assigned_at,
+    VehicleAssignment.arrived_at,
+    VehicleAssignment.assigned_by_operator_id,
+).where(VehicleAssignment.unassigned_at.is_(None))
+_FLEET_POSITION_ROWS = select(
+    VehiclePositionLog.vehicle_id,
+    VehiclePositionLog.latitude,
+    VehiclePositionLog.longitude,
+    VehiclePositionLog.timestamp,
+).join(
+    _latest_timestamps,
+    (VehiclePositionLog.vehicle_id == _latest_timestamps.c.vehicle_id)
+    & (VehiclePositionLog.timestamp == _latest_timestamps.c.max_timestamp),
+)
+_PENDING_PROPOSAL_VEHICLE_IDS = (
+    select(VehicleAssignmentProposalItem.vehicle_id)
+    .join(
+        VehicleAssignmentProposal,
+        VehicleAssignmentProposalItem.proposal_id
+        == VehicleAssignmentProposal.proposal_id,
+    )
+    .where(
+        VehicleAssignmentProposal.validated_at.is_(None),
+        VehicleAssignmentProposal.rejected_at.is_(None),
+    )
+    .distinct()
+)
+
+# Synchronisation par delta (voir app.models.change_versions) : le xmin du
+# snapshot est la version à renvoyer au prochain appel, qui relit tout
+# véhicule de version >= à celle-ci, y compris les transactions encore en
+# cours à la lecture précédente.
+_FLEET_VERSION = select(
+    cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger)
+)
+_changed_since = bindparam("since", type_=BigInteger)
+# Les positions ne touchent pas `vehicles.change_version` (une mise à jour
+# de `vehicles` par position) : elles portent leur propre `received_version`,
+# l'id de la transaction qui les a insérées, comparé au même xmin. Ni
+# l'horodatage de l'équipement ni l'ordre d'arrivée n'entrent en jeu.
+_MOVED_VEHICLE_IDS = select(VehiclePositionLog.vehicle_id).where(
+    VehiclePositionLog.received_version >= _changed_since
+)
+_vehicle_changed = or_(
+    Vehicle.change_version >= _changed_since,
+    Vehicle.vehicle_id.in_(_MOVED_VEHICLE_IDS),
+)
+_FLEET_CHANGED_VEHICLE_ROWS = _FLEET_VEHICLE_ROWS.where(_vehicle_changed)
+_FLEET_CHANGED_SUMMARY_ROWS = _FLEET_SUMMARY_ROWS.where(_vehicle_changed)
+_FLEET_DELETED_VEHICLE_IDS = select(VehicleTombstone.vehicle_id).where(
+    VehicleTombstone.change_version >= _changed_since
+)
+# (stocks, affectations actives, propositions en attente) de toute la flotte,
+# ou des seuls véhicules de `vehicle_ids`
+_FLEET_RELATION_ROWS = (
+    _FLEET_STOCK_ROWS,
+    _FLEET_ASSIGNMENT_ROWS,
+    _PENDING_PROPOSAL_VEHICLE_IDS,
+)
+_CHANGED_FLEET_RELATION_ROWS = (
+    _FLEET_STOCK_ROWS.where(VehicleConsumableStock.vehicle_id == any_(_vehicle_ids)),
+    _FLEET_ASSIGNMENT_ROWS.where(VehicleAssignment.vehicle_id == any_(_vehicle_ids)),
+    _PENDING_PROPOSAL_VEHICLE_IDS.where(
+        VehicleAssignmentProposalItem.vehicle_id == any_(_vehicle_ids)
+    ),
+)
 
 
 class VehicleService:
@@ -44,7 +234,7 @@ class VehicleService:
                 selectinload(Vehicle.consumable_stocks).selectinload(
                     VehicleConsumableStock.consumable_type
                 ),
-                selectinload(Vehicle.assignments),
+                selectinload(Vehicle.active_assignment),
             )
             .order_by(Vehicle.immatriculation)
         )
@@ -57,27 +247,276 @@ class VehicleService:
         if not vehicle_ids:
             return {}
 
-        # Sous-requête pour obtenir le timestamp max par véhicule
-        subquery = (
-            select(
-                VehiclePositionLog.vehicle_id,
-                func.max(VehiclePositionLog.timestamp).label("max_timestamp"),
+        # Log correspondant au timestamp max de chaque véhicule
+        result = await self.session.execute(
+            _LATEST_POSITIONS, {"vehicle_ids": vehicle_ids}
+        )
+
+        return {log.vehicle_id: log for log in result.scalars().all()}
+
+    async def fetch_fleet(self, since: int | None = None) -> QGVehiclesListRead:
+        """
+        Construit la liste QG des véhicules à partir de tuples Core.
+
+        Requêtes à plat (version, véhicules, stocks, affectations, positions,
+        propositions en attente) lancées en parallèle quand elles sont
+        indépendantes (`gather_reads`), assemblées en dictionnaires, validés
+        une seule fois par pydantic.
+
+        Avec `since` (la `version` d'une réponse précédente), seuls les
+        véhicules modifiés depuis sont renvoyés, avec les ids des véhicules
+        supprimés.
+        """
+        # Lue en premier : tout ce qui est sous ce xmin est déjà terminé et
+        # donc visible des requêtes suivantes, quelle que soit leur connexion
+        version = await self.session.scalar(_FLEET_VERSION)
+        deleted_vehicle_ids: list[UUID] = []
+        if since is None:
+            # Stocks, affectations et propositions ne dépendent pas des ids :
+            # lus en même temps que les véhicules
+            stock_rows, assignment_rows, pending_rows = _FLEET_RELATION_ROWS
+            (
+                vehicle_result,
+                stock_result,
+                assignment_result,
+                pending_result,
+            ) = await gather_reads(
+                self.session,
+                lambda reader: reader.execute(_FLEET_VEHICLE_ROWS),
+                lambda reader: reader.execute(stock_rows),
+                lambda reader: reader.execute(assignment_rows),
+                lambda reader: reader.scalars(pending_rows),
+            )
+            vehicle_rows = vehicle_result.all()
+            vehicle_ids = [row[0] for row in vehicle_rows]
+            position_result = (
+                await self.session.execute(
+                    _FLEET_POSITION_ROWS, {"vehicle_ids": vehicle_ids}
+                )
+                if vehicle_ids
+                else []
+            )
+        else:
+            params = {"since": since}
+            vehicle_result, deleted_result = await gather_reads(
+                self.session,
+                lambda reader: reader.execute(_FLEET_CHANGED_VEHICLE_ROWS, params),
+                lambda reader: reader.scalars(_FLEET_DELETED_VEHICLE_IDS, params),
+            )
+            vehicle_rows = vehicle_result.all()
+            deleted_vehicle_ids = list(deleted_result.all())
+            vehicle_ids = [row[0] for row in vehicle_rows]
+            if not vehicle_ids:
+                return QGVehiclesListRead(
+                    vehicles=[],
+                    total=0,
+                    version=version,
+                    deleted_vehicle_ids=deleted_vehicle_ids,
+                )
+
+            stock_rows, assignment_rows, pending_rows = _CHANGED_FLEET_RELATION_ROWS
+            relation_params = {"vehicle_ids": vehicle_ids}
+            (
+                stock_result,
+                assignment_result,
+                pending_result,
+                position_result,
+            ) = await gather_reads(
+                self.session,
+                lambda reader: reader.execute(stock_rows, relation_params),
+                lambda reader: reader.execute(assignment_rows, relation_params),
+                lambda reader: reader.scalars(pending_rows, relation_params),
+                lambda reader: reader.execute(_FLEET_POSITION_ROWS, relation_params),
+            )
+
+        stocks: dict[UUID, list[dict[str, Any]]] = {}
+        for (
+            vehicle_id,
+            consumable_type_id,
+            label,
+            unit,
+            current_quantity,
+            last_update,
+        ) in stock_result:
+            stocks.setdefault(vehicle_id, []).append(
+                {
+                    "consumable_type": {
+                        "vehicle_consumable_type_id": consumable_type_id,
+                        "label": label,
+                        "unit": unit,
+                    },
+                    "current_quantity": current_quantity,
+                    "last_update": last_update,
+                }
             )
-            .where(VehiclePositionLog.vehicle_id.in_(vehicle_ids))
-            .group_by(VehiclePositionLog.vehicle_id)
-            .subquery()
+
+        active_assignments = {
+            vehicle_id: {
+                "vehicle_assignment_id": assignment_id,
+                "incident_phase_id": incident_phase_id,
+                "assigned_at": assigned_at,
+                "arrived_at": arrived_at,
+                "assigned_by_operator_id": assigned_by_operator_id,
+            }
+            for (
+                vehicle_id,
+                assignment_id,
+                incident_phase_id,
+                assigned_at,
+                arrived_at,
+                assigned_by_operator_id,
+            ) in assignment_result
+        }
+
+        positions = {
+            vehicle_id: {
+                "latitude": latitude,
+                "longitude": longitude,
+                "timestamp": timestamp,
+            }
+            for vehicle_id, latitude, longitude, timestamp in position_result
+        }
+
+        pending_vehicle_ids = set(pending_result.all())
+
+        vehicles = [
+            {
+                "vehicle_id": vehicle_id,
+                "immatriculation": immatriculation,
+                "vehicle_type": {
+                    "vehicle_type_id": vehicle_type_id,
+                    "code": type_code,
+                    "label": type_label,
+                },
+                "energy": {"energy_id": energy_id, "label": energy_label}
+                if energy_id is not None
+                else None,
+                "energy_level": energy_level,
+                "status": {"vehicle_status_id": status_id, "label": status_label}
+                if status_id is not None
+                else None,
+                "base_interest_point": {
+                    "interest_point_id": base_id,
+                    "name": base_name,
+                    "address": base_address,
+                    "zipcode": base_zipcode,
+                    "city": base_city,
+                    "latitude": base_latitude,
+                    "longitude": base_longitude,
+                }
+                if base_id is not None
+                else None,
+                "current_position": positions.get(vehicle_id),
+                "consumable_stocks": stocks.get(vehicle_id, []),
+                "active_assignment": active_assignments.get(vehicle_id),
+                "referenced_in_pending_proposal": vehicle_id in pending_vehicle_ids,
+                "change_version": change_version,
+            }
+            for (
+                vehicle_id,
+                immatriculation,
+                energy_level,
+                vehicle_type_id,
+                type_code,
+                type_label,
+                energy_id,
+                energy_label,
+                status_id,
+                status_label,
+                base_id,
+                base_name,
+                base_address,
+                base_zipcode,
+                base_city,
+                base_latitude,
+                base_longitude,
+                change_version,
+            ) in vehicle_rows
+        ]
+        return QGVehiclesListRead.model_validate(
+            {
+                "vehicles": vehicles,
+                "total": len(vehicles),
+                "version": version,
+                "deleted_vehicle_ids": deleted_vehicle_ids,
+            }
         )
 
-        # Requête principale pour récupérer les logs correspondants
-        result = await self.session.execute(
-            select(VehiclePositionLog).join(
-                subquery,
-                (VehiclePositionLog.vehicle_id == subquery.c.vehicle_id)
-                & (VehiclePositionLog.timestamp == subquery.c.max_timestamp),
+    async def fetch_fleet_summary(
+        self, since: int | None = None
+    ) -> QGVehiclesSummaryListRead:
+        """
+        Liste QG en projection légère (`view=summary`).
+
+        Trois requêtes au lieu de six : version, véhicules avec type et
+        statut, dernières positions. `since` a le même sens que pour
+        `fetch_fleet`.
+        """
+        version = await self.session.scalar(_FLEET_VERSION)
+        deleted_vehicle_ids: list[UUID] = []
+        if since is None:
+            vehicle_rows = (await self.session.execute(_FLEET_SUMMARY_ROWS)).all()
+        else:
+            params = {"since": since}
+            vehicle_result, deleted_result = await gather_reads(
+                self.session,
+                lambda reader: reader.execute(_FLEET_CHANGED_SUMMARY_ROWS, params),
+                lambda reader: reader.scalars(_FLEET_DELETED_VEHICLE_IDS, params),
             )
+            vehicle_rows = vehicle_result.all()
+            deleted_vehicle_ids = list(deleted_result.all())
+
+        vehicle_ids = [row[0] for row in vehicle_rows]
+        position_result = (
+            await self.session.execute(
+                _FLEET_POSITION_ROWS, {"vehicle_ids": vehicle_ids}
+            )
+            if vehicle_ids
+            else []
         )
+        positions = {
+            vehicle_id: {
+                "latitude": latitude,
+                "longitude": longitude,
+                "timestamp": timestamp,
+            }
+            for vehicle_id, latitude, longitude, timestamp in position_result
+        }
 
-        return {log.vehicle_id: log for log in result.scalars().all()}
+        vehicles = [
+            {
+                "vehicle_id": vehicle_id,
+                "immatriculation": immatriculation,
+                "vehicle_type": {
+                    "vehicle_type_id": vehicle_type_id,
+                    "code": type_code,
+                    "label": type_label,
+                },
+                "status": {"vehicle_status_id": status_id, "label": status_label}
+                if status_id is not None
+                else None,
+                "current_position": positions.get(vehicle_id),
+                "change_version": change_version,
+            }
+            for (
+                vehicle_id,
+                immatriculation,
+                vehicle_type_id,
+                type_code,
+                type_label,
+                status_id,
+                status_label,
+                change_version,
+            ) in vehicle_rows
+        ]
+        return QGVehiclesSummaryListRead.model_validate(
+            {
+                "vehicles": vehicles,
+                "total": len(vehicles),
+                "version": version,
+                "deleted_vehicle_ids": deleted_vehicle_ids,
+            }
+        )
 
     @staticmethod
     def build_vehicle_detail(
@@ -150,16 +589,15 @@ class VehicleService:
 
         # Affectation active
         active_assignment_dto = None
-        for assignment in vehicle.assignments:
-            if assignment.unassigned_at is None:
-                active_assignment_dto = QGActiveAssignment(
-                    vehicle_assignment_id=assignment.vehicle_assignment_id,
-                    incident_phase_id=assignment.incident_phase_id,
-                    assigned_at=assignment.assigned_at,
-                    arrived_at=assignment.arrived_at,
-                    assigned_by_operator_id=assignment.assigned_by_operator_id,
-                )
-                break
+        assignment = vehicle.active_assignment
+        if assignment is not None:
+            active_assignment_dto = QGActiveAssignment(
+                vehicle_assignment_id=assignment.vehicle_assignment_id,
+                incident_phase_id=assignment.incident_phase_id,
+                assigned_at=assignment.assigned_at,
+                arrived_at=assignment.arrived_at,
+                assigned_by_operator_id=assignment.assigned_by_operator_id,
+            )
 
         return QGVehicleDetail(
             vehicle_id=vehicle.vehicle_id,
@@ -173,6 +611,7 @@ class VehicleService:
             consumable_stocks=consumable_stocks_dto,
             active_assignment=active_assignment_dto,
             referenced_in_pending_proposal=referenced_in_pending_proposal,
+            change_version=vehicle.change_version,
         )
 
     async def create_vehicle_position(
@@ -194,16 +633,19 @@ class VehicleService:
         await self.session.refresh(position)
         return position
 
-    async def update_vehicle_status(
+    async def mark_active_assignment_arrived(
         self,
-        vehicle: Vehicle,
-        vehicle_status_id: UUID,
-    ) -> VehicleStatus:
-        """Met à jour le statut d'un véhicule."""
-        status = await self.session.get(VehicleStatus, vehicle_status_id)
-        if status is None:
-            raise ValueError("Vehicle status not found")
-        vehicle.status_id = vehicle_status_id
-        await self.session.commit()
-        await self.session.refresh(vehicle)
-        return status
+        vehicle_id: UUID,
+        arrived_at: datetime,
+    ) -> UUID | None:
+        """
+        Marque l'arrivée sur l'affectation active d'un véhicule.
+
+        Requête conditionnelle unique (`arrived_at IS NULL`), sans chargement
+        ORM. Ne commit pas. Retourne l'id de l'affectation mise à jour.
+        """
+        result = await self.session.execute(
+            _MARK_ACTIVE_ASSIGNMENT_ARRIVED,
+            {"vehicle_id": vehicle_id, "arrived_at": arrived_at},
+        )
+        return result.scalar_one_or_none()
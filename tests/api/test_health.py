@@ -4,6 +4,8 @@ Tests pour l'endpoint /health.
 
 import pytest
 
+from app.main import app
+
 
 @pytest.mark.asyncio
 async def test_health_endpoint_returns_ok(async_client):
@@ -22,3 +24,39 @@ async def test_health_endpoint_response_structure(async_client):
 
     assert "status" in data
     assert isinstance(data["status"], str)
+
+
+@pytest.mark.asyncio
+async def test_db_pool_requires_operator_role(
+    async_client, auth_headers_viewer, auth_headers_operator
+):
+    """Test que /health/db-pool est réservé aux opérateurs."""
+    app.state.postgres.pool_status.return_value = {"pool_size": 5}
+
+    anonymous = await async_client.get("/health/db-pool")
+    viewer = await async_client.get("/health/db-pool", headers=auth_headers_viewer)
+    operator = await async_client.get("/health/db-pool", headers=auth_headers_operator)
+
+    assert anonymous.status_code == 401
+    assert viewer.status_code == 403
+    assert operator.status_code == 200
+    assert operator.json() == {"pool_size": 5}
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_requires_operator_role(
+    async_client, auth_headers_viewer, auth_headers_operator
+):
+    """Test que /health/slow-queries (SQL avec valeurs) est réservé aux opérateurs."""
+    app.state.postgres.slow_query_log.plans.return_value = [{"fingerprint": "abc"}]
+
+    anonymous = await async_client.get("/health/slow-queries")
+    viewer = await async_client.get("/health/slow-queries", headers=auth_headers_viewer)
+    operator = await async_client.get(
+        "/health/slow-queries", headers=auth_headers_operator
+    )
+
+    assert anonymous.status_code == 401
+    assert viewer.status_code == 403
+    assert operator.status_code == 200
+    assert operator.json() == [{"fingerprint": "abc"}]
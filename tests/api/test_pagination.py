@@ -0,0 +1,108 @@
+"""
+Tests pour la pagination par curseur (keyset) des routes de liste.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import select
+
+from app.api.routes.utils import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    keyset_predicate,
+    paginate,
+)
+from app.models import InterestPoint, VehiclePositionLog
+from tests.helpers import compiled_sql
+
+POSITION_KEYS = (VehiclePositionLog.timestamp, VehiclePositionLog.vehicle_position_id)
+
+
+def test_cursor_round_trips_typed_values():
+    values = [datetime(2026, 1, 1, 12, tzinfo=timezone.utc), uuid.uuid4()]
+
+    assert decode_cursor(encode_cursor(values), POSITION_KEYS) == values
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor(["x"]), "W10"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, POSITION_KEYS)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_non_nullable_keys_use_row_comparison():
+    values = [datetime(2026, 1, 1, tzinfo=timezone.utc), uuid.uuid4()]
+    sql = compiled_sql(keyset_predicate(POSITION_KEYS, values, descending=True))
+
+    assert sql.startswith(
+        "(vehicle_position_logs.timestamp, vehicle_position_logs.vehicle_position_id) <"
+    )
+
+
+def test_nullable_keys_keep_null_rows_reachable():
+    keys = (InterestPoint.name, InterestPoint.interest_point_id)
+    sql = compiled_sql(
+        keyset_predicate(keys, ["Caserne", uuid.uuid4()], descending=False)
+    )
+
+    assert "interest_points.name IS NULL" in sql
+    assert "interest_points.name > " in sql
+
+
+async def test_paginate_fetches_one_extra_row_and_sets_next_cursor():
+    rows = [
+        SimpleNamespace(
+            timestamp=datetime(2026, 1, 1, 12, minute, tzinfo=timezone.utc),
+            vehicle_position_id=uuid.uuid4(),
+        )
+        for minute in (3, 2, 1)
+    ]
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    response = Response()
+
+    page = await paginate(
+        session,
+        select(VehiclePositionLog),
+        POSITION_KEYS,
+        limit=2,
+        cursor=None,
+        response=response,
+        descending=True,
+    )
+
+    assert page == rows[:2]
+    assert "LIMIT" in compiled_sql(session.execute.await_args.args[0])
+    assert decode_cursor(response.headers[NEXT_CURSOR_HEADER], POSITION_KEYS) == [
+        rows[1].timestamp,
+        rows[1].vehicle_position_id,
+    ]
+
+
+async def test_paginate_last_page_has_no_next_cursor():
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    response = Response()
+
+    await paginate(
+        session,
+        select(VehiclePositionLog),
+        POSITION_KEYS,
+        limit=2,
+        cursor=encode_cursor([datetime(2026, 1, 1, tzinfo=timezone.utc), uuid.uuid4()]),
+        response=response,
+    )
+
+    assert NEXT_CURSOR_HEADER not in response.headers
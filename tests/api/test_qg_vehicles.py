@@ -0,0 +1,58 @@
+"""
+Tests pour les endpoints /qg/vehicles.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.dependencies import get_postgres_read_session
+from app.main import app
+
+
+@pytest.mark.asyncio
+async def test_list_vehicles_nearby_returns_latest_positions(
+    async_client,
+    auth_headers_operator,
+):
+    """Test que /nearby renvoie la dernière position de chaque véhicule proche."""
+    position = MagicMock()
+    position.vehicle_id = uuid.uuid4()
+    position.latitude = 45.76
+    position.longitude = 4.83
+    position.timestamp = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+    mock_session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.all.return_value = [(position, 250.0)]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    async def override_get_postgres_read_session():
+        yield mock_session
+
+    app.dependency_overrides[get_postgres_read_session] = (
+        override_get_postgres_read_session
+    )
+
+    try:
+        response = await async_client.get(
+            "/qg/vehicles/nearby",
+            params={"latitude": 45.76, "longitude": 4.83, "radius_m": 1000},
+            headers=auth_headers_operator,
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "vehicle_id": str(position.vehicle_id),
+                "latitude": 45.76,
+                "longitude": 4.83,
+                "timestamp": "2026-01-01T12:00:00Z",
+                "distance_m": 250.0,
+            }
+        ]
+        assert mock_session.execute.await_count == 1
+    finally:
+        app.dependency_overrides.clear()
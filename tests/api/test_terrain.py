@@ -16,6 +16,7 @@ def mock_interest_point_kind():
     kind = MagicMock()
     kind.interest_point_kind_id = uuid.uuid4()
     kind.label = "Caserne"
+    kind.change_version = 42
     return kind
 
 
@@ -76,6 +77,7 @@ async def test_list_interest_points_by_kind_returns_points(
         )
 
         assert response.status_code == 200
+        assert response.headers["etag"] == '"42"'
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 3
@@ -83,6 +85,40 @@ async def test_list_interest_points_by_kind_returns_points(
         app.dependency_overrides.clear()
 
 
+@pytest.mark.asyncio
+async def test_list_interest_points_by_kind_not_modified(
+    async_client,
+    auth_headers_operator,
+    mock_interest_point_kind,
+):
+    """Test qu'un If-None-Match à jour renvoie 304 sans charger les points."""
+    kind_id = mock_interest_point_kind.interest_point_kind_id
+
+    mock_session = AsyncMock()
+    mock_kind_result = MagicMock()
+    mock_kind_result.scalar_one_or_none.return_value = mock_interest_point_kind
+    mock_session.execute = AsyncMock(return_value=mock_kind_result)
+
+    async def override_get_postgres_session():
+        yield mock_session
+
+    from app.api.dependencies import get_postgres_session
+
+    app.dependency_overrides[get_postgres_session] = override_get_postgres_session
+
+    try:
+        response = await async_client.get(
+            f"/terrain/interest-points/{kind_id}",
+            headers={**auth_headers_operator, "If-None-Match": 'W/"41", "42"'},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"42"'
+        assert mock_session.execute.await_count == 1
+    finally:
+        app.dependency_overrides.clear()
+
+
 @pytest.mark.asyncio
 async def test_list_interest_points_by_kind_not_found(
     async_client,
@@ -169,3 +205,68 @@ async def test_list_interest_points_by_kind_requires_auth(async_client):
     response = await async_client.get(f"/terrain/interest-points/{kind_id}")
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_list_nearby_interest_points_returns_distances(
+    async_client,
+    auth_headers_operator,
+    mock_interest_points,
+):
+    """Test que /nearby n'est pas capturé par /{kind_id} et renvoie les distances."""
+    mock_session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.all.return_value = [(mock_interest_points[0], 120.5)]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    async def override_get_postgres_session():
+        yield mock_session
+
+    from app.api.dependencies import get_postgres_session
+
+    app.dependency_overrides[get_postgres_session] = override_get_postgres_session
+
+    try:
+        response = await async_client.get(
+            "/terrain/interest-points/nearby",
+            params={"latitude": 48.85, "longitude": 2.35, "radius_m": 500},
+            headers=auth_headers_operator,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["name"] == "Point d'intérêt 1"
+        assert data[0]["distance_m"] == 120.5
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "ST_DWithin" in sql
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_list_nearby_interest_points_validates_coordinates(
+    async_client,
+    auth_headers_operator,
+):
+    """Test qu'une latitude hors bornes est rejetée avant toute requête."""
+    mock_session = AsyncMock()
+
+    async def override_get_postgres_session():
+        yield mock_session
+
+    from app.api.dependencies import get_postgres_session
+
+    app.dependency_overrides[get_postgres_session] = override_get_postgres_session
+
+    try:
+        response = await async_client.get(
+            "/terrain/interest-points/nearby",
+            params={"latitude": 120, "longitude": 2.35},
+            headers=auth_headers_operator,
+        )
+
+        assert response.status_code == 422
+        mock_session.execute.assert_not_awaited()
+    finally:
+        app.dependency_overrides.clear()
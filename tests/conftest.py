@@ -13,6 +13,8 @@ import jwt
 import pytest
 from cryptography.hazmat.primitives.asymmetric import rsa
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
 
 TEST_ISSUER = "http://keycloak.test/realms/test"
 TEST_CLIENT_ID = "test-api"
@@ -34,6 +36,8 @@ def _bootstrap_keycloak_test_env() -> tuple[rsa.RSAPrivateKey, Path]:
     os.environ["KEYCLOAK_ISSUER"] = TEST_ISSUER
     os.environ["KEYCLOAK_CLIENT_ID"] = TEST_CLIENT_ID
     os.environ["KEYCLOAK_AUDIENCE"] = TEST_CLIENT_ID
+    # Fail requests that run more SQL statements than their declared budget
+    os.environ["POSTGRES_QUERY_BUDGET_STRICT"] = "true"
 
     return private_key, jwks_path
 
@@ -41,6 +45,8 @@ def _bootstrap_keycloak_test_env() -> tuple[rsa.RSAPrivateKey, Path]:
 PRIVATE_KEY, JWKS_PATH = _bootstrap_keycloak_test_env()
 
 from app.main import app  # noqa: E402
+from app.models import Base  # noqa: E402
+from tests.helpers import TEST_POSTGRES_DSN  # noqa: E402
 
 
 @pytest.fixture(autouse=True)
@@ -129,3 +135,27 @@ def auth_headers_operator() -> dict[str, str]:
 def auth_headers_viewer() -> dict[str, str]:
     """JWT with read-only role for protected GET endpoints."""
     return _build_auth_headers(["qg-viewer"])
+
+
+@pytest.fixture
+async def postgres_engine():
+    """Schéma complet recréé sur `TEST_POSTGRES_DSN`, avec une partition par défaut."""
+    engine = create_async_engine(TEST_POSTGRES_DSN)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+        await conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            text(
+                "CREATE TABLE vehicle_position_logs_default "
+                "PARTITION OF vehicle_position_logs DEFAULT"
+            )
+        )
+    try:
+        yield engine
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
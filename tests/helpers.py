@@ -0,0 +1,20 @@
+"""
+Utilitaires partagés par les modules de test.
+"""
+
+import os
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Base PostGIS dédiée, vidée par les tests qui l'utilisent (voir README)
+TEST_POSTGRES_DSN = os.environ.get("TEST_POSTGRES_DSN")
+
+requires_postgres = pytest.mark.skipif(
+    not TEST_POSTGRES_DSN, reason="TEST_POSTGRES_DSN not set"
+)
+
+
+def compiled_sql(clause) -> str:
+    """Texte SQL d'une requête compilée pour PostgreSQL."""
+    return str(clause.compile(dialect=postgresql.dialect()))
@@ -0,0 +1,130 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from app.services.assignment_acks import AssignmentAckRegistry
+from app.services.events import Event, SSEManager
+from app.services.vehicle_assignments import (
+    VehicleAssignmentTarget,
+    send_assignment_to_vehicles_and_wait_for_ack,
+)
+
+
+def _rabbitmq(undelivered: str | None = None):
+    """Publication confirmée, sauf pour l'immatriculation `undelivered`."""
+
+    async def publish_many(queue, messages, **kwargs):
+        return [
+            TimeoutError() if undelivered and undelivered.encode() in body else None
+            for body in messages
+        ]
+
+    rabbitmq = AsyncMock()
+    rabbitmq.publish_many = AsyncMock(side_effect=publish_many)
+    return rabbitmq
+
+
+def _target(immatriculation: str) -> VehicleAssignmentTarget:
+    return VehicleAssignmentTarget(vehicle_id=uuid4(), immatriculation=immatriculation)
+
+
+async def _wait(session, rabbitmq, acks, targets, **kwargs):
+    return await send_assignment_to_vehicles_and_wait_for_ack(
+        session=session,
+        rabbitmq=rabbitmq,
+        acks=acks,
+        targets=targets,
+        incident_latitude=45.7,
+        incident_longitude=4.8,
+        engaged_status_label="Engagé",
+        **kwargs,
+    )
+
+
+async def test_status_events_resolve_the_wait_without_polling():
+    sse_manager = SSEManager()
+    acks = AssignmentAckRegistry(sse_manager)
+    await acks.start()
+    await asyncio.sleep(0)
+    target = _target("AB-123-CD")
+    session, rabbitmq = AsyncMock(), _rabbitmq()
+
+    waiting = asyncio.create_task(
+        _wait(session, rabbitmq, acks, [target], ack_timeout_seconds=30)
+    )
+    await asyncio.sleep(0)
+    await sse_manager.notify(
+        Event.VEHICLE_STATUS_UPDATE.value,
+        {"vehicle_id": str(target.vehicle_id), "status_label": "Disponible"},
+    )
+    await sse_manager.notify(
+        Event.VEHICLE_STATUS_UPDATE.value,
+        {"vehicle_id": str(target.vehicle_id), "status_label": "Engagé"},
+    )
+    engaged, failed = await asyncio.wait_for(waiting, timeout=1)
+    await acks.stop()
+
+    assert (engaged, failed) == ([target], [])
+    session.scalars.assert_not_awaited()
+    assert rabbitmq.publish_many.await_count == 1
+    assert acks._waiters == {}
+
+
+async def test_missed_events_fall_back_to_one_batched_check_per_attempt():
+    acks = AssignmentAckRegistry(SSEManager())
+    engaged_target, silent_target = _target("AB-123-CD"), _target("EF-456-GH")
+    session, rabbitmq = AsyncMock(), _rabbitmq()
+    session.scalars = AsyncMock(side_effect=[[engaged_target.vehicle_id], []])
+
+    engaged, failed = await _wait(
+        session,
+        rabbitmq,
+        acks,
+        [engaged_target, silent_target],
+        max_attempts=2,
+        ack_timeout_seconds=0.01,
+    )
+
+    assert (engaged, failed) == ([engaged_target], [silent_target])
+    assert session.scalars.await_count == 2
+    checked = [call.args[1]["vehicle_ids"] for call in session.scalars.await_args_list]
+    assert checked == [
+        [engaged_target.vehicle_id, silent_target.vehicle_id],
+        [silent_target.vehicle_id],
+    ]
+    # Premier envoi aux deux véhicules, renvoi au seul véhicule muet
+    sent = [len(call.args[1]) for call in rabbitmq.publish_many.await_args_list]
+    assert sent == [2, 1]
+    assert acks._waiters == {}
+
+
+async def test_undelivered_targets_are_reported_and_not_awaited():
+    sse_manager = SSEManager()
+    acks = AssignmentAckRegistry(sse_manager)
+    await acks.start()
+    await asyncio.sleep(0)
+    delivered, undelivered = _target("AB-123-CD"), _target("EF-456-GH")
+    session, rabbitmq = AsyncMock(), _rabbitmq(undelivered="EF-456-GH")
+    session.scalars = AsyncMock(return_value=[])
+
+    waiting = asyncio.create_task(
+        _wait(
+            session,
+            rabbitmq,
+            acks,
+            [delivered, undelivered],
+            max_attempts=1,
+            ack_timeout_seconds=30,
+        )
+    )
+    await asyncio.sleep(0)
+    await sse_manager.notify(
+        Event.VEHICLE_STATUS_UPDATE.value,
+        {"vehicle_id": str(delivered.vehicle_id), "status_label": "Engagé"},
+    )
+    # Le véhicule non livré ne fait pas attendre les 30 s de la tentative
+    engaged, failed = await asyncio.wait_for(waiting, timeout=1)
+    await acks.stop()
+
+    assert (engaged, failed) == ([delivered], [undelivered])
+    assert session.scalars.await_args.args[1]["vehicle_ids"] == [undelivered.vehicle_id]
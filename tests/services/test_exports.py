@@ -0,0 +1,70 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.services.exports import (
+    EXPORT_BATCH_ROWS,
+    incident_export,
+    position_log_export,
+    stream_export,
+)
+from tests.helpers import compiled_sql
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _session(columns, partitions):
+    async def _partitions():
+        for rows in partitions:
+            yield rows
+
+    result = MagicMock()
+    result.keys.return_value = columns
+    result.partitions = _partitions
+    session = AsyncMock()
+    session.stream = AsyncMock(return_value=result)
+    return session
+
+
+async def _collect(session, stmt, export_format):
+    return [chunk async for chunk in stream_export(session, stmt, export_format)]
+
+
+async def test_ndjson_export_writes_one_line_per_row_and_chunk_per_batch():
+    vehicle_id = uuid4()
+    session = _session(
+        ["vehicle_id", "timestamp"],
+        [[(vehicle_id, NOW), (vehicle_id, NOW)], [(vehicle_id, NOW)]],
+    )
+
+    chunks = await _collect(session, position_log_export(None, None, None), "ndjson")
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line) for line in lines][0] == {
+        "vehicle_id": str(vehicle_id),
+        "timestamp": "2026-01-01T00:00:00Z",
+    }
+    assert len(lines) == 3
+    stmt = session.stream.await_args.args[0]
+    assert stmt.get_execution_options()["yield_per"] == EXPORT_BATCH_ROWS
+
+
+async def test_csv_export_starts_with_a_header():
+    session = _session(["incident_id", "created_at"], [[("abc", NOW)]])
+
+    chunks = await _collect(session, incident_export(None, None, None), "csv")
+
+    assert b"".join(chunks).decode().splitlines() == [
+        "incident_id,created_at",
+        "abc,2026-01-01T00:00:00+00:00",
+    ]
+
+
+def test_exports_are_bounded_on_their_time_column():
+    sql = compiled_sql(incident_export("ENDED", NOW, NOW))
+    assert "incidents.created_at >= %(created_at_1)s" in sql
+    assert "incidents.created_at < %(created_at_2)s" in sql
+    assert "incidents.ended_at IS NOT NULL" in sql
+    assert "ORDER BY incidents.created_at" in sql
@@ -0,0 +1,260 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+from app.schemas.qg.vehicles import (
+    QGVehicleDetail,
+    QGVehiclePosition,
+    QGVehiclesListRead,
+    QGVehiclesSummaryListRead,
+    QGVehicleStatusRef,
+    QGVehicleSummaryItem,
+    QGVehicleTypeDetail,
+)
+from app.services.events import Event, SSEManager
+from app.services.fleet_snapshot import FleetSnapshot
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+VEHICLE_TYPE = QGVehicleTypeDetail(vehicle_type_id=uuid4(), code="VSAV", label="VSAV")
+AVAILABLE = QGVehicleStatusRef(vehicle_status_id=uuid4(), label="Disponible")
+ENGAGED = QGVehicleStatusRef(vehicle_status_id=uuid4(), label="Engagé")
+
+
+def _vehicle(
+    immatriculation: str,
+    vehicle_id: UUID | None = None,
+    status: QGVehicleStatusRef = AVAILABLE,
+    version: int = 1,
+) -> QGVehicleDetail:
+    return QGVehicleDetail(
+        vehicle_id=vehicle_id or uuid4(),
+        immatriculation=immatriculation,
+        vehicle_type=VEHICLE_TYPE,
+        status=status,
+        current_position=QGVehiclePosition(latitude=45.7, longitude=4.8, timestamp=NOW),
+        consumable_stocks=[],
+        change_version=version,
+    )
+
+
+class _Loader:
+    def __init__(self, vehicles: list[QGVehicleDetail], version: int = 10):
+        self.full = QGVehiclesListRead(
+            vehicles=vehicles, total=len(vehicles), version=version
+        )
+        self.delta: QGVehiclesListRead | None = None
+        self.calls: list[int | None] = []
+
+    async def __call__(self, session, since):
+        self.calls.append(since)
+        return self.full if since is None else self.delta
+
+
+def _snapshot(loader, sse_manager=None) -> FleetSnapshot:
+    postgres = MagicMock()
+    postgres.sessionmaker.return_value = MagicMock()
+    return FleetSnapshot(postgres, sse_manager or SSEManager(), loader=loader)
+
+
+def _message(event: Event, **data) -> dict:
+    return {"event": event.value, "data": data}
+
+
+async def test_body_matches_the_database_response():
+    loader = _Loader([_vehicle("AA-001"), _vehicle("BB-002")])
+    snapshot = _snapshot(loader)
+    assert snapshot.body() is None
+
+    await snapshot.load()
+
+    body = snapshot.body()
+    assert json.loads(body) == json.loads(loader.full.model_dump_json())
+    assert snapshot.body() is body
+
+
+async def test_summary_body_is_the_light_projection():
+    vehicle = _vehicle("AA-001")
+    snapshot = _snapshot(_Loader([vehicle]))
+    await snapshot.load()
+
+    summary = QGVehiclesSummaryListRead.model_validate_json(snapshot.body("summary"))
+
+    assert summary.vehicles[0].model_dump() == vehicle.model_dump(
+        include=set(QGVehicleSummaryItem.model_fields)
+    )
+    assert summary.version == 10
+    assert snapshot.etag("summary") != snapshot.etag()
+
+
+async def test_position_events_update_the_vehicle_in_place():
+    vehicle = _vehicle("AA-001")
+    snapshot = _snapshot(_Loader([vehicle]))
+    await snapshot.load()
+    later = NOW + timedelta(seconds=5)
+
+    snapshot.apply(
+        _message(
+            Event.VEHICLE_POSITION_UPDATE,
+            vehicle_id=str(vehicle.vehicle_id),
+            vehicle_immatriculation="AA-001",
+            latitude=45.9,
+            longitude=4.9,
+            timestamp=later.isoformat(),
+        )
+    )
+    # Une position plus ancienne arrivée en retard est ignorée
+    snapshot.apply(
+        _message(
+            Event.VEHICLE_POSITION_UPDATE,
+            vehicle_id=str(vehicle.vehicle_id),
+            latitude=0.0,
+            longitude=0.0,
+            timestamp=NOW.isoformat(),
+        )
+    )
+
+    position = json.loads(snapshot.body())["vehicles"][0]["current_position"]
+    assert position["latitude"] == 45.9
+    assert not snapshot._refresh_requested.is_set()
+
+
+async def test_status_events_apply_known_labels_and_request_a_refresh():
+    available, engaged = _vehicle("AA-001"), _vehicle("BB-002", status=ENGAGED)
+    snapshot = _snapshot(_Loader([available, engaged]))
+    await snapshot.load()
+
+    snapshot.apply(
+        _message(
+            Event.VEHICLE_STATUS_UPDATE,
+            vehicle_id=str(available.vehicle_id),
+            status_label="Engagé",
+        )
+    )
+
+    vehicles = json.loads(snapshot.body())["vehicles"]
+    assert vehicles[0]["status"]["label"] == "Engagé"
+    assert snapshot._refresh_requested.is_set()
+
+
+async def test_refresh_applies_the_delta_since_the_loaded_version():
+    kept, renamed, deleted = _vehicle("BB-002"), _vehicle("CC-003"), _vehicle("DD-004")
+    loader = _Loader([kept, renamed, deleted], version=10)
+    snapshot = _snapshot(loader)
+    await snapshot.load()
+    added = _vehicle("AA-001", version=12)
+    loader.delta = QGVehiclesListRead(
+        vehicles=[
+            added,
+            _vehicle("ZZ-999", vehicle_id=renamed.vehicle_id, version=12),
+        ],
+        total=2,
+        version=13,
+        deleted_vehicle_ids=[deleted.vehicle_id],
+    )
+
+    await snapshot.refresh()
+
+    assert loader.calls == [None, 10]
+    body = json.loads(snapshot.body())
+    assert [vehicle["immatriculation"] for vehicle in body["vehicles"]] == [
+        "AA-001",
+        "BB-002",
+        "ZZ-999",
+    ]
+    assert body["total"] == 3
+    assert body["version"] == 13
+    summary = json.loads(snapshot.body("summary"))
+    assert [vehicle["immatriculation"] for vehicle in summary["vehicles"]] == [
+        "AA-001",
+        "BB-002",
+        "ZZ-999",
+    ]
+
+
+async def test_refresh_keeps_a_newer_position_received_by_event():
+    vehicle = _vehicle("AA-001")
+    loader = _Loader([vehicle])
+    snapshot = _snapshot(loader)
+    await snapshot.load()
+    later = NOW + timedelta(seconds=5)
+    snapshot.apply(
+        _message(
+            Event.VEHICLE_POSITION_UPDATE,
+            vehicle_id=str(vehicle.vehicle_id),
+            latitude=45.9,
+            longitude=4.9,
+            timestamp=later.isoformat(),
+        )
+    )
+    loader.delta = QGVehiclesListRead(
+        vehicles=[_vehicle("AA-001", vehicle_id=vehicle.vehicle_id, version=11)],
+        total=1,
+        version=11,
+    )
+
+    await snapshot.refresh()
+
+    position = json.loads(snapshot.body())["vehicles"][0]["current_position"]
+    assert position["latitude"] == 45.9
+
+
+async def test_etag_changes_with_the_body():
+    vehicle = _vehicle("AA-001")
+    loader = _Loader([vehicle])
+    snapshot = _snapshot(loader)
+    assert snapshot.etag() is None
+
+    await snapshot.load()
+    etag = snapshot.etag()
+    loader.delta = QGVehiclesListRead(vehicles=[], total=0, version=10)
+    await snapshot.refresh()
+    assert snapshot.etag() == etag
+
+    snapshot.apply(
+        _message(
+            Event.VEHICLE_POSITION_UPDATE,
+            vehicle_id=str(vehicle.vehicle_id),
+            latitude=45.9,
+            longitude=4.9,
+            timestamp=(NOW + timedelta(seconds=5)).isoformat(),
+        )
+    )
+    assert snapshot.etag() != etag
+    # Deux instances (workers) ne partagent jamais un ETag
+    other = _snapshot(_Loader([vehicle]))
+    await other.load()
+    assert other.etag() != snapshot.etag()
+
+
+async def test_reconcile_reports_drift():
+    vehicle = _vehicle("AA-001")
+    loader = _Loader([vehicle])
+    snapshot = _snapshot(loader)
+    assert await snapshot.load() == 1
+
+    assert await snapshot.load() == 0
+    loader.full = QGVehiclesListRead(
+        vehicles=[_vehicle("AA-001", vehicle_id=vehicle.vehicle_id, status=ENGAGED)],
+        total=1,
+        version=11,
+    )
+    assert await snapshot.load() == 1
+
+
+async def test_events_reach_the_snapshot_through_the_sse_manager():
+    sse_manager = SSEManager()
+    vehicle = _vehicle("AA-001")
+    snapshot = _snapshot(_Loader([vehicle]), sse_manager)
+    await snapshot.start()
+    try:
+        await asyncio.sleep(0)
+        await sse_manager.notify(
+            Event.VEHICLE_ASSIGNMENT.value, {"vehicle_id": str(vehicle.vehicle_id)}
+        )
+        await asyncio.sleep(0)
+        assert snapshot.loaded
+        assert snapshot._refresh_requested.is_set()
+    finally:
+        await snapshot.stop()
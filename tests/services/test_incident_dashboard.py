@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.models import Incident, IncidentPhaseDependencyKind
+from app.services import incident_dashboard, incident_situation
+from app.services.incident_dashboard import (
+    _CASUALTY_ROWS,
+    _CASUALTY_TRANSPORT_ROWS,
+    _ENGAGEMENT_ROWS,
+    load_dashboard,
+)
+from app.services.incident_situation import (
+    _SITUATION_PHASE_ROWS,
+    _SITUATION_RESOURCE_ROWS,
+    load_incident_situations,
+)
+from tests.helpers import compiled_sql
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _incident(created_at: datetime) -> Incident:
+    return Incident(incident_id=uuid4(), created_at=created_at, updated_at=created_at)
+
+
+def _scalars(values):
+    result = MagicMock()
+    result.all.return_value = values
+    result.__iter__.return_value = iter(values)
+    return result
+
+
+async def test_situations_are_grouped_by_incident():
+    fire, flood = _incident(NOW), _incident(NOW)
+    phase_id, depends_on = uuid4(), uuid4()
+    type_id = uuid4()
+    session = AsyncMock()
+    session.scalars = AsyncMock(return_value=_scalars([fire, flood]))
+    session.execute = AsyncMock(
+        side_effect=[
+            [
+                (phase_id, fire.incident_id, uuid4(), "FEU", "Feu", 3, NOW, None),
+            ],
+            [(phase_id, depends_on, IncidentPhaseDependencyKind.CAUSE)],
+            [
+                (fire.incident_id, type_id, "VSAV", "Secours", 3, 2),
+                (fire.incident_id, None, None, None, 1, 1),
+                (flood.incident_id, uuid4(), "FPT", "Pompe", 1, 0),
+            ],
+            [(flood.incident_id, uuid4(), "Blessé", 2)],
+        ]
+    )
+
+    situations = await load_incident_situations(
+        session, [fire.incident_id, flood.incident_id]
+    )
+
+    assert session.scalars.await_count == 1
+    assert session.execute.await_count == 4
+    fire_situation = situations[fire.incident_id]
+    assert fire_situation.phases_active[0].dependencies[0].kind == "CAUSE"
+    assert fire_situation.resources.vehicles_assigned == 4
+    assert fire_situation.resources.vehicles_active == 3
+    assert [entry.count for entry in fire_situation.resources.by_type] == [2]
+    assert fire_situation.casualties.total == 0
+    flood_situation = situations[flood.incident_id]
+    assert flood_situation.phases_active == []
+    assert flood_situation.resources.by_type == []
+    assert flood_situation.casualties.total == 2
+
+
+async def test_dashboard_covers_ongoing_incidents_in_constant_queries():
+    older, newer = _incident(NOW - timedelta(hours=1)), _incident(NOW)
+    phase_id, vehicle_id, casualty_id, status_id = uuid4(), uuid4(), uuid4(), uuid4()
+    session = AsyncMock()
+    session.scalars = AsyncMock(
+        side_effect=[
+            _scalars([newer.incident_id, older.incident_id]),
+            _scalars([older, newer]),
+        ]
+    )
+    session.execute = AsyncMock(
+        side_effect=[
+            [],
+            [],
+            [],
+            [],
+            [
+                (older.incident_id, uuid4(), vehicle_id, phase_id, NOW)
+                + (None,) * 5
+                + ("AB-123-CD", uuid4(), "VSAV", "Secours", uuid4(), "FEU", "Feu"),
+            ],
+            [
+                (
+                    older.incident_id,
+                    casualty_id,
+                    phase_id,
+                    uuid4(),
+                    "UA",
+                    "Urgence absolue",
+                    status_id,
+                    "Transporté",
+                    NOW,
+                    None,
+                )
+            ],
+            [(casualty_id, uuid4(), None, NOW) + (None,) * 6],
+        ]
+    )
+
+    dashboard = await load_dashboard(session)
+
+    assert session.execute.await_count == 7
+    assert dashboard.total == 2
+    first, second = dashboard.incidents
+    assert first.situation.incident.incident_id == newer.incident_id
+    assert first.engagements.vehicle_assignments == []
+    assert first.casualties.stats.total == 0
+    assignment = second.engagements.vehicle_assignments[0]
+    assert assignment.vehicle.immatriculation == "AB-123-CD"
+    assert assignment.phase_type.code == "FEU"
+    casualty = second.casualties.casualties[0]
+    assert casualty.transports[0].picked_up_at == NOW
+    assert second.casualties.stats.by_status[0].count == 1
+
+
+async def test_dashboard_never_nests_parallel_reads(monkeypatch):
+    active, deepest = 0, 0
+    real_gather_reads = incident_situation.gather_reads
+
+    async def tracking_gather_reads(session, *queries):
+        nonlocal active, deepest
+        active += 1
+        deepest = max(deepest, active)
+        try:
+            return await real_gather_reads(session, *queries)
+        finally:
+            active -= 1
+
+    for module in (incident_situation, incident_dashboard):
+        monkeypatch.setattr(module, "gather_reads", tracking_gather_reads)
+    session = AsyncMock()
+    session.scalars = AsyncMock(return_value=_scalars([]))
+    session.execute = AsyncMock(return_value=[])
+
+    await load_dashboard(session, [uuid4()])
+
+    assert deepest == 1
+
+
+async def test_dashboard_without_incidents_runs_no_batch_query():
+    session = AsyncMock()
+    session.scalars = AsyncMock(return_value=_scalars([]))
+
+    dashboard = await load_dashboard(session)
+
+    assert dashboard.total == 0
+    session.execute.assert_not_awaited()
+
+
+def test_batch_statements_filter_on_the_incident_id_array():
+    for statement in (
+        _SITUATION_PHASE_ROWS,
+        _SITUATION_RESOURCE_ROWS,
+        _ENGAGEMENT_ROWS,
+        _CASUALTY_ROWS,
+        _CASUALTY_TRANSPORT_ROWS,
+    ):
+        sql = compiled_sql(statement)
+        assert "incident_phases.incident_id = ANY (%(incident_ids)s::UUID[])" in sql
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.services.incident_listing import (
+    incident_page_statement,
+    incident_rows_statement,
+    stream_incidents_json,
+)
+from tests.helpers import compiled_sql
+
+
+def test_rows_are_built_by_a_single_json_statement():
+    sql = compiled_sql(incident_rows_statement([uuid4()]))
+
+    assert sql.count("SELECT") == 3
+    assert "'incident_id', incidents.incident_id" in sql
+    assert "ORDER BY incident_phases.priority DESC" in sql
+    assert "ORDER BY vehicle_assignments.assigned_at" in sql
+    assert "'[]'::json" in sql
+
+
+def test_summary_rows_skip_the_phase_subqueries():
+    sql = compiled_sql(incident_rows_statement([uuid4()], "summary"))
+
+    assert sql.count("SELECT") == 1
+    assert "'description', incidents.description" in sql
+    assert "phases" not in sql
+
+
+def test_page_statement_applies_filters_and_fetches_one_extra_row():
+    since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    stmt = incident_page_statement("ONGOING", since, 50)
+    sql = compiled_sql(stmt)
+
+    assert "incidents.ended_at IS NULL" in sql
+    assert "incidents.created_at >= " in sql
+    assert "ORDER BY incidents.created_at DESC, incidents.incident_id DESC" in sql
+    assert stmt.compile().params["param_1"] == 51
+
+    assert "ended_at IS NOT NULL" in compiled_sql(
+        incident_page_statement("ENDED", None, 50)
+    )
+
+
+class _Rows:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def __aiter__(self):
+        for row in self._rows:
+            yield row
+
+
+async def _collect(iterator) -> str:
+    return "".join([chunk async for chunk in iterator])
+
+
+async def test_stream_joins_rows_into_a_json_array():
+    result = MagicMock()
+    result.scalars.return_value = _Rows(['{"a":1}', '{"a":2}'])
+    session = AsyncMock()
+    session.stream = AsyncMock(return_value=result)
+
+    assert await _collect(stream_incidents_json(session, [uuid4(), uuid4()])) == (
+        '[{"a":1},{"a":2}]'
+    )
+    assert await _collect(stream_incidents_json(session, [])) == "[]"
+    session.stream.assert_awaited_once()
@@ -0,0 +1,149 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+from app.schemas.qg.situation import (
+    QGCasualtiesSummary,
+    QGIncidentSituationRead,
+    QGIncidentSnapshot,
+    QGResourcesSummary,
+)
+from app.services.events import Event, SSEManager
+from app.services.incident_situation import (
+    IncidentSituationProjection,
+    event_incident_id,
+    situation_delta,
+)
+
+
+def _situation(incident_id: UUID, vehicles_active: int) -> QGIncidentSituationRead:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return QGIncidentSituationRead(
+        incident=QGIncidentSnapshot(
+            incident_id=incident_id, created_at=now, updated_at=now, status="ONGOING"
+        ),
+        phases_active=[],
+        resources=QGResourcesSummary(
+            vehicles_assigned=vehicles_active,
+            vehicles_active=vehicles_active,
+            by_type=[],
+        ),
+        casualties=QGCasualtiesSummary(total=0, by_status=[]),
+    )
+
+
+class _Loader:
+    def __init__(self):
+        self.vehicles_active = 1
+        self.calls = 0
+        self.sessions = []
+
+    async def __call__(self, session, incident_id):
+        self.calls += 1
+        self.sessions.append(session)
+        return _situation(incident_id, self.vehicles_active)
+
+
+def _projection(loader, sse_manager=None, max_age_seconds=30.0):
+    postgres = MagicMock()
+    postgres.sessionmaker.return_value = MagicMock()
+    return IncidentSituationProjection(
+        postgres,
+        sse_manager or SSEManager(),
+        max_age_seconds=max_age_seconds,
+        loader=loader,
+    )
+
+
+async def test_reads_are_served_from_the_projection():
+    loader = _Loader()
+    projection = _projection(loader)
+    incident_id = uuid4()
+
+    first = await projection.get(incident_id)
+    second = await projection.get(incident_id)
+
+    assert first is second
+    assert loader.calls == 1
+
+
+async def test_cache_misses_are_loaded_on_the_primary():
+    loader = _Loader()
+    projection = _projection(loader)
+
+    await projection.get(uuid4())
+
+    primary = projection._postgres.sessionmaker.return_value.return_value
+    assert loader.sessions == [primary.__aenter__.return_value]
+
+
+async def test_expired_entries_are_reloaded():
+    loader = _Loader()
+    projection = _projection(loader, max_age_seconds=0.0)
+    incident_id = uuid4()
+
+    await projection.get(incident_id)
+    await asyncio.sleep(0.001)
+    await projection.get(incident_id)
+
+    assert loader.calls == 2
+
+
+async def test_invalidation_pushes_only_changed_sections():
+    loader = _Loader()
+    sse_manager = SSEManager()
+    projection = _projection(loader, sse_manager)
+    incident_id = uuid4()
+    await projection.get(incident_id)
+
+    listener = sse_manager.listen([Event.INCIDENT_SITUATION_UPDATE.value])
+    next_message = asyncio.ensure_future(listener.__anext__())
+    await asyncio.sleep(0)
+
+    loader.vehicles_active = 2
+    projection.invalidate(incident_id)
+    await projection.refresh_pending()
+    message = await asyncio.wait_for(next_message, timeout=0.1)
+
+    assert message["data"]["incident_id"] == str(incident_id)
+    assert message["data"]["version"] == 2
+    assert set(message["data"]["changes"]) == {"resources"}
+    assert (await projection.get(incident_id)).resources.vehicles_active == 2
+    await listener.aclose()
+
+
+async def test_etag_changes_only_with_the_situation():
+    loader = _Loader()
+    projection = _projection(loader)
+    incident_id = uuid4()
+    assert projection.etag(incident_id) is None
+
+    await projection.get(incident_id)
+    etag = projection.etag(incident_id)
+    projection.invalidate(incident_id)
+    await projection.refresh_pending()
+    assert projection.etag(incident_id) == etag
+
+    loader.vehicles_active = 2
+    projection.invalidate(incident_id)
+    await projection.refresh_pending()
+    assert projection.etag(incident_id) not in (None, etag)
+
+
+def test_event_incident_id_reads_both_payload_shapes():
+    incident_id = uuid4()
+
+    assert event_incident_id({"data": {"incident_id": str(incident_id)}}) == incident_id
+    assert (
+        event_incident_id({"data": {"incident": {"incident_id": incident_id}}})
+        == incident_id
+    )
+    assert event_incident_id({"data": {"vehicle_id": "x"}}) is None
+
+
+def test_situation_delta_without_previous_is_complete():
+    current = {"incident": {}, "resources": {"vehicles_active": 1}}
+
+    assert situation_delta(None, current) == current
+    assert situation_delta(current, current) == {}
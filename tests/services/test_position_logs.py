@@ -0,0 +1,191 @@
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import DatabaseSettings
+from app.services.position_logs import (
+    DEFAULT_PARTITION,
+    PositionLogMaintenance,
+    partition_end,
+    partition_name,
+    partition_start,
+)
+from tests.helpers import requires_postgres
+
+
+def test_weekly_partitions_start_on_monday():
+    start = partition_start(date(2026, 10, 22), "week")
+
+    assert start == date(2026, 10, 19)
+    assert partition_name(start, "week") == "vehicle_position_logs_w20261019"
+
+
+def test_partition_end_is_decoded_from_name():
+    assert partition_end("vehicle_position_logs_d20261019") == date(2026, 10, 20)
+    assert partition_end("vehicle_position_logs_w20261019") == date(2026, 10, 26)
+    assert partition_end(DEFAULT_PARTITION) is None
+
+
+class _Result:
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+        self.rowcount = len(self._rows)
+
+    def scalars(self):
+        return iter(self._rows)
+
+
+class _Connection:
+    """Records statements; answers counts and catalog lookups from `engine`."""
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self._engine.statements.append(sql)
+        if any(marker in sql for marker in self._engine.failing):
+            raise DBAPIError(sql, params, Exception("relation is not a partition"))
+        if "FROM pg_inherits" in sql:
+            return _Result(self._engine.partitions)
+        return _Result()
+
+    async def scalar(self, statement, params=None):
+        sql = str(statement)
+        self._engine.statements.append(sql)
+        if "relkind" in sql:
+            return "p" if self._engine.partitioned else "r"
+        if "to_regclass" in sql:
+            return True
+        if "count(*)" in sql:
+            return self._engine.default_rows
+        return None
+
+
+class _Engine:
+    def __init__(self, partitions, default_rows=0, failing=(), partitioned=True):
+        self.partitions = partitions
+        self.partitioned = partitioned
+        self.default_rows = default_rows
+        self.failing = failing
+        self.statements: list[str] = []
+        self.transactions: list[list[str]] = []
+
+    @asynccontextmanager
+    async def connect(self):
+        yield _Connection(self)
+
+    @asynccontextmanager
+    async def begin(self):
+        started = len(self.statements)
+        yield _Connection(self)
+        self.transactions.append(self.statements[started:])
+
+
+def _maintenance(engine: _Engine) -> PositionLogMaintenance:
+    postgres = MagicMock()
+    postgres.engine.return_value = engine
+    return PositionLogMaintenance(
+        postgres,
+        DatabaseSettings(
+            position_logs_partitions_ahead=0, position_logs_retention_days=30
+        ),
+    )
+
+
+async def test_rows_in_default_partition_are_moved_into_the_new_partition():
+    engine = _Engine([DEFAULT_PARTITION], default_rows=12)
+
+    created = await _maintenance(engine)._ensure_partitions(date(2026, 10, 19))
+
+    assert created == 1
+    [transaction] = engine.transactions
+    assert transaction[0].startswith(f"LOCK TABLE {DEFAULT_PARTITION}")
+    assert "(LIKE vehicle_position_logs" in transaction[1]
+    assert f"DELETE FROM {DEFAULT_PARTITION}" in transaction[2]
+    assert "geog" not in transaction[2]
+    assert transaction[3] == (
+        "ALTER TABLE vehicle_position_logs ATTACH PARTITION "
+        "vehicle_position_logs_d20261019 FOR VALUES "
+        "FROM ('2026-10-19 00:00:00+00') TO ('2026-10-20 00:00:00+00')"
+    )
+
+
+async def test_partitions_are_created_directly_when_default_has_no_rows():
+    engine = _Engine([DEFAULT_PARTITION], default_rows=0)
+
+    await _maintenance(engine)._ensure_partitions(date(2026, 10, 19))
+
+    [[statement]] = engine.transactions
+    assert statement.startswith(
+        "CREATE TABLE IF NOT EXISTS vehicle_position_logs_d20261019 PARTITION OF"
+    )
+
+
+async def test_failed_drop_does_not_stop_the_other_drops_nor_the_run():
+    engine = _Engine(
+        [
+            DEFAULT_PARTITION,
+            "vehicle_position_logs_d20260801",
+            "vehicle_position_logs_d20260802",
+            "vehicle_position_logs_d20261019",
+        ],
+        failing=("DETACH PARTITION vehicle_position_logs_d20260801",),
+    )
+
+    await _maintenance(engine).run_once(
+        datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+    )
+
+    statements = "\n".join(engine.statements)
+    assert "DROP TABLE vehicle_position_logs_d20260802" in statements
+    assert "DROP TABLE vehicle_position_logs_d20260801" not in statements
+    assert "vehicle_position_logs_d20261019" not in statements
+    # Expired rows of the default partition and rollups are still pruned
+    assert (
+        f"DELETE FROM {DEFAULT_PARTITION} WHERE timestamp < '2026-09-19 00:00:00+00'"
+        in statements
+    )
+    assert "DELETE FROM vehicle_position_rollups" in statements
+
+
+async def test_heap_table_still_gets_rollups_but_no_partition_ddl():
+    engine = _Engine([], partitioned=False)
+
+    await _maintenance(engine).run_once(
+        datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+    )
+
+    statements = "\n".join(engine.statements)
+    assert "INSERT INTO vehicle_position_rollups" in statements
+    assert "DELETE FROM vehicle_position_rollups" in statements
+    assert "PARTITION" not in statements
+    assert f"DELETE FROM {DEFAULT_PARTITION}" not in statements
+
+
+@requires_postgres
+async def test_maintenance_partitions_a_real_table(postgres_engine):
+    postgres = MagicMock()
+    postgres.engine.return_value = postgres_engine
+    maintenance = PositionLogMaintenance(
+        postgres, DatabaseSettings(position_logs_partitions_ahead=1)
+    )
+
+    await maintenance.run_once()
+
+    async with postgres_engine.connect() as conn:
+        partitions = (
+            await conn.scalars(
+                text(
+                    "SELECT child.relname FROM pg_inherits "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "WHERE pg_inherits.inhparent = 'vehicle_position_logs'::regclass"
+                )
+            )
+        ).all()
+    today = partition_start(datetime.now(timezone.utc).date(), "day")
+    assert partition_name(today, "day") in partitions
+    assert len(partitions) == 3
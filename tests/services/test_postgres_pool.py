@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, select, update
+
+from app.core.config import DatabaseSettings
+from app.models import Vehicle
+from app.services.db.postgres import (
+    PoolMetrics,
+    PostgresManager,
+    ReplicaRoutingSession,
+    asyncpg_connect_args,
+    gather_reads,
+)
+
+
+def test_pool_metrics_track_wait_and_overflow():
+    metrics = PoolMetrics()
+
+    metrics.record_checkout(0.002, overflow=-3)
+    metrics.record_checkout(0.010, overflow=2)
+    metrics.record_timeout()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 2
+    assert snapshot["timeouts"] == 1
+    assert snapshot["overflow_checkouts"] == 1
+    assert snapshot["peak_overflow"] == 2
+    assert snapshot["wait_ms_avg"] == 6.0
+    assert snapshot["wait_ms_max"] == 10.0
+
+
+def test_pool_settings_are_applied_to_engine_pool():
+    manager = PostgresManager(
+        DatabaseSettings(pool_size=3, max_overflow=1, pool_timeout_seconds=2.5)
+    )
+
+    pool = manager.engine().pool
+
+    assert pool.size() == 3
+    assert pool._max_overflow == 1
+    assert pool._timeout == 2.5
+    assert pool.metrics is manager.pool_metrics
+    assert manager.pool_status()["checked_out"] == 0
+
+
+def test_statement_cache_settings_reach_the_engine():
+    manager = PostgresManager(
+        DatabaseSettings(query_cache_size=50, prepared_statement_cache_size=0)
+    )
+
+    engine = manager.engine()
+
+    assert engine.sync_engine._compiled_cache.capacity == 50
+    assert asyncpg_connect_args(DatabaseSettings(prepared_statement_cache_size=0)) == {
+        "prepared_statement_cache_size": 0
+    }
+
+
+def test_pgbouncer_mode_uses_unique_prepared_statement_names():
+    connect_args = asyncpg_connect_args(DatabaseSettings(pgbouncer=True))
+    name_func = connect_args["prepared_statement_name_func"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert name_func() != name_func()
+
+
+def test_replica_routing_session_is_sticky_to_primary_after_write():
+    primary = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+    session = ReplicaRoutingSession(bind=primary, info={"replica_bind": replica})
+
+    assert session.get_bind(clause=select(Vehicle)) is replica
+
+    assert session.get_bind(clause=update(Vehicle).values(energy_level=1.0)) is primary
+    assert session.get_bind(clause=select(Vehicle)) is primary
+
+
+def test_read_session_uses_primary_without_replica():
+    manager = PostgresManager(DatabaseSettings())
+
+    assert not manager.has_replica
+    assert manager.read_sessionmaker() is manager.sessionmaker()
+
+
+async def test_gather_reads_runs_queries_on_separate_sessions():
+    manager = PostgresManager(DatabaseSettings(pool_size=4))
+    session = manager.sessionmaker()()
+    running, peak = 0, 0
+
+    async def query(reader):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return reader
+
+    sessions = await gather_reads(session, query, query, query)
+
+    assert peak == 3
+    assert sessions[0] is session
+    assert len({id(reader) for reader in sessions}) == 3
+    assert all(reader.bind is session.bind for reader in sessions)
+
+
+async def test_gather_reads_runs_sequentially_without_spare_pool_slots():
+    manager = PostgresManager(DatabaseSettings(pool_size=1))
+    session = manager.sessionmaker()()
+
+    async def query(reader):
+        return reader
+
+    assert await gather_reads(session, query, query, query) == [session] * 3
+
+
+async def test_gather_reads_cancels_pending_queries_on_failure():
+    manager = PostgresManager(DatabaseSettings(pool_size=4))
+    cancelled = asyncio.Event()
+
+    async def failing(reader):
+        raise ValueError("boom")
+
+    async def slow(reader):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(ValueError):
+        await gather_reads(manager.sessionmaker()(), failing, slow)
+    assert cancelled.is_set()
@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+
+from app.api import middleware
+from app.api.dependencies import query_budget
+from app.api.middleware import QueryStatsMiddleware
+from app.services.db.query_stats import (
+    QueryBudgetExceeded,
+    instrument_engine,
+    set_query_budget,
+    track_queries,
+    untracked_queries,
+)
+
+
+def _engine(strict_budget: bool = False):
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, strict_budget=strict_budget)
+    return engine
+
+
+def test_statements_are_counted_per_context():
+    engine = _engine()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            for _ in range(3):
+                conn.execute(text("SELECT 2"))
+            with untracked_queries():
+                conn.execute(text("SELECT 3"))
+
+    assert stats.count == 3
+    assert stats.duration_seconds > 0
+    assert stats.repeated_statements(3) == [("SELECT 2", 3)]
+    assert stats.repeated_statements(4) == []
+
+
+def test_budget_is_reported_without_strict_mode():
+    engine = _engine()
+
+    with engine.connect() as conn, track_queries() as stats:
+        set_query_budget(1)
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+    assert stats.over_budget
+
+
+def test_strict_budget_rejects_extra_statement():
+    engine = _engine(strict_budget=True)
+
+    with engine.connect() as conn, track_queries() as stats:
+        set_query_budget(1)
+        conn.execute(text("SELECT 1"))
+        with pytest.raises(QueryBudgetExceeded):
+            conn.execute(text("SELECT 2"))
+
+    assert stats.count == 1
+
+
+async def test_responses_carry_server_timing_header(async_client):
+    response = await async_client.get("/health")
+
+    assert response.headers["server-timing"] == 'db;dur=0.0;desc="0 queries"'
+
+
+def _streaming_app(engine) -> FastAPI:
+    """Route with a budget of 1 whose statements run while the body streams."""
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/stream", dependencies=[Depends(query_budget(1))])
+    async def stream() -> StreamingResponse:
+        async def rows():
+            with engine.connect() as conn:
+                for value in (1, 2):
+                    yield f"{conn.execute(text(f'SELECT {value}')).scalar()}\n"
+
+        return StreamingResponse(rows(), media_type="text/plain")
+
+    return app
+
+
+async def test_strict_budget_applies_to_statements_run_while_streaming():
+    app = _streaming_app(_engine(strict_budget=True))
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        with pytest.raises(QueryBudgetExceeded):
+            await client.get("/stream")
+
+
+async def test_streamed_statements_are_checked_against_the_budget(monkeypatch):
+    log = MagicMock()
+    monkeypatch.setattr(middleware, "log", log)
+    app = _streaming_app(_engine())
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        response = await client.get("/stream")
+
+    assert response.text == "1\n2\n"
+    # L'en-tête part avant le corps : seules les requêtes déjà exécutées
+    assert response.headers["server-timing"].endswith('desc="0 queries"')
+    log.warning.assert_called_once_with(
+        "db.query_budget.exceeded", method="GET", budget=1
+    )
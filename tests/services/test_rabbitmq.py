@@ -0,0 +1,51 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from aio_pika.exceptions import DeliveryError
+
+from app.services.messaging.queues import Queue
+from app.services.messaging.rabbitmq import RabbitMQManager
+
+
+def _manager(channel) -> RabbitMQManager:
+    settings = MagicMock(dsn="amqp://localhost", connect_timeout_seconds=5.0)
+    manager = RabbitMQManager(settings)
+    manager.get_publisher_channel = AsyncMock(return_value=channel)
+    return manager
+
+
+async def test_publish_many_awaits_confirms_concurrently_and_reports_each():
+    in_flight, peak = 0, 0
+
+    async def publish(message, routing_key):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if message.body == b"nacked":
+            raise DeliveryError(None, None)
+
+    channel = MagicMock()
+    channel.declare_queue = AsyncMock()
+    channel.default_exchange.publish = publish
+    manager = _manager(channel)
+
+    results = await manager.publish_many(
+        Queue.VEHICLE_ASSIGNMENTS, [b"a", b"nacked", b"c"]
+    )
+    await manager.publish_many(Queue.VEHICLE_ASSIGNMENTS, [b"d"])
+
+    assert peak == 3
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], DeliveryError)
+    channel.declare_queue.assert_awaited_once()
+
+
+async def test_publish_many_reports_every_message_when_the_broker_is_down():
+    manager = _manager(None)
+    manager.get_publisher_channel = AsyncMock(side_effect=ConnectionError("down"))
+
+    results = await manager.publish_many(Queue.VEHICLE_ASSIGNMENTS, [b"a", b"b"])
+
+    assert [type(result) for result in results] == [ConnectionError] * 2
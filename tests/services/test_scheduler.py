@@ -0,0 +1,192 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Incident,
+    IncidentPhase,
+    PhaseCategory,
+    PhaseType,
+    Vehicle,
+    VehicleAssignment,
+    VehicleAssignmentProposal,
+    VehicleAssignmentProposalItem,
+    VehicleType,
+)
+from app.services import assignment_proposals
+from app.services.messaging import subscriptions
+from app.services.messaging.subscriptions import ApplicationSubscriptions
+from app.services.scheduler import (
+    _CLAIM_DUE_JOBS,
+    _DELETE_JOB,
+    JobScheduler,
+    schedule_job,
+)
+from tests.helpers import compiled_sql, requires_postgres
+
+
+def _postgres(claimed):
+    conn = MagicMock()
+    conn.execute = AsyncMock(
+        side_effect=lambda statement, params: MagicMock(
+            all=MagicMock(return_value=claimed)
+        )
+    )
+
+    @asynccontextmanager
+    async def begin():
+        yield conn
+
+    postgres = MagicMock()
+    postgres.engine.return_value.begin = begin
+    return postgres, conn
+
+
+def test_claim_skips_locked_jobs_and_takes_a_lease():
+    sql = compiled_sql(_CLAIM_DUE_JOBS)
+
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "scheduled_jobs.run_at <= now()" in sql
+    assert "SET run_at=(now() + %(lease)s)" in sql
+    assert "RETURNING scheduled_jobs.kind" in sql
+
+
+async def test_due_jobs_run_once_and_failures_are_retried_until_max_attempts():
+    done, retried, abandoned = uuid4(), uuid4(), uuid4()
+    postgres, conn = _postgres(
+        [("auto_accept", done, 1), ("auto_accept", retried, 1)]
+        + [("auto_accept", abandoned, 3)]
+    )
+    ran = []
+
+    async def handler(subject_id):
+        ran.append(subject_id)
+        if subject_id != done:
+            raise RuntimeError("broker down")
+
+    scheduler = JobScheduler(postgres, max_attempts=3)
+    scheduler.register("auto_accept", handler)
+
+    assert await scheduler.run_due() == 3
+
+    assert sorted(ran) == sorted([done, retried, abandoned])
+    claim, *deletes = conn.execute.await_args_list
+    assert claim.args[1]["kinds"] == ["auto_accept"]
+    assert all(call.args[0] is _DELETE_JOB for call in deletes)
+    # Le job en échec reste réservé : repris à la fin du bail
+    assert sorted(call.args[1]["subject_id"] for call in deletes) == sorted(
+        [done, abandoned]
+    )
+
+
+async def test_scheduling_is_idempotent():
+    session = AsyncMock()
+
+    await schedule_job(
+        session, "auto_accept", uuid4(), datetime(2026, 1, 1, tzinfo=timezone.utc)
+    )
+
+    assert "ON CONFLICT DO NOTHING" in compiled_sql(session.execute.await_args.args[0])
+
+
+async def test_failed_auto_accept_is_kept_for_retry(monkeypatch):
+    failing, gone = uuid4(), uuid4()
+    kind = ApplicationSubscriptions._AUTO_ACCEPT_JOB
+    postgres, conn = _postgres([(kind, failing, 1), (kind, gone, 1)])
+
+    async def validate(*, proposal_id, **_):
+        if proposal_id == failing:
+            raise RuntimeError("broker down")
+        raise HTTPException(status_code=404, detail="Proposal not found")
+
+    monkeypatch.setattr(subscriptions, "validate_assignment_proposal_service", validate)
+    scheduler = JobScheduler(postgres, max_attempts=3)
+    ApplicationSubscriptions(
+        MagicMock(), postgres, MagicMock(), MagicMock(), scheduler, queues=()
+    )
+
+    assert await scheduler.run_due() == 2
+
+    # Proposition introuvable : abandonnée ; erreur inattendue : relancée
+    _, *deletes = conn.execute.await_args_list
+    assert [call.args[1]["subject_id"] for call in deletes] == [gone]
+
+
+@requires_postgres
+async def test_replayed_auto_accept_creates_assignments_once(
+    postgres_engine, monkeypatch
+):
+    proposal_id = uuid4()
+    vehicle = Vehicle(
+        immatriculation="AB-123-CD",
+        vehicle_type=VehicleType(code="VSAV", label="Secours"),
+    )
+    incident = Incident(latitude=45.76, longitude=4.83)
+    phase = IncidentPhase(
+        incident=incident,
+        phase_type=PhaseType(
+            code="SAP",
+            default_criticity=1,
+            category=PhaseCategory(code="SECOURS"),
+        ),
+    )
+    proposal = VehicleAssignmentProposal(
+        proposal_id=proposal_id,
+        incident=incident,
+        generated_at=datetime.now(timezone.utc),
+    )
+    proposal.items.append(
+        VehicleAssignmentProposalItem(
+            incident_phase=phase,
+            vehicle=vehicle,
+            proposal_rank=1,
+            distance_km=1.0,
+            estimated_time_min=3,
+            route_geometry={"type": "LineString", "coordinates": []},
+            energy_level=1.0,
+            score=1.0,
+        )
+    )
+    async with AsyncSession(postgres_engine) as session:
+        session.add(proposal)
+        await session.commit()
+
+    async def engage_all(*, session, assignments, **_):
+        session.add_all(assignments)
+        await session.commit()
+        # L'envoi aux véhicules laisse l'autre exécution reprendre la main
+        await asyncio.sleep(0.05)
+        return list(assignments), []
+
+    monkeypatch.setattr(
+        assignment_proposals, "create_assignments_and_wait_for_ack", engage_all
+    )
+
+    async def auto_accept():
+        async with AsyncSession(postgres_engine) as session:
+            return await assignment_proposals.validate_assignment_proposal(
+                session=session,
+                rabbitmq=MagicMock(),
+                acks=MagicMock(),
+                sse_manager=MagicMock(notify=AsyncMock()),
+                proposal_id=proposal_id,
+                operator_email=None,
+            )
+
+    # Job rejoué par un second worker pendant la première exécution
+    results = await asyncio.gather(auto_accept(), auto_accept(), return_exceptions=True)
+
+    async with AsyncSession(postgres_engine) as session:
+        assignments = await session.scalar(
+            select(func.count()).select_from(VehicleAssignment)
+        )
+    assert assignments == 1
+    assert [
+        result.status_code for result in results if isinstance(result, HTTPException)
+    ] == [400]
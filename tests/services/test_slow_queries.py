@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.db.slow_queries import (
+    SlowQueryLog,
+    fingerprint,
+    fingerprint_id,
+    parameters_shape,
+)
+
+
+def _engine_returning_plan(plan) -> tuple[MagicMock, AsyncMock]:
+    result = MagicMock()
+    result.scalar.return_value = plan
+    conn = AsyncMock()
+    conn.exec_driver_sql = AsyncMock(return_value=result)
+    conn_cm = MagicMock()
+    conn_cm.__aenter__ = AsyncMock(return_value=conn)
+    conn_cm.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.connect.return_value = conn_cm
+    return engine, conn
+
+
+def test_fingerprint_ignores_values_and_whitespace():
+    first = fingerprint(
+        "SELECT * FROM vehicles\n WHERE vehicle_id IN ($1, $2, $3) AND code = 'VSAV'"
+    )
+    second = fingerprint(
+        "SELECT * FROM vehicles WHERE vehicle_id IN ($1) AND code = 'FPT'"
+    )
+
+    assert (
+        first
+        == second
+        == "SELECT * FROM vehicles WHERE vehicle_id IN (...) AND code = ?"
+    )
+    assert fingerprint("SELECT 1::INTEGER LIMIT 20") == "SELECT ?::INTEGER LIMIT ?"
+
+
+def test_parameters_shape_hides_values():
+    assert parameters_shape(("abc", 3, [1, 2])) == ["str", "int", "list[2]"]
+    assert parameters_shape({"vehicle_id": "x"}) == {"vehicle_id": "str"}
+    assert parameters_shape([("a",), ("b",)], executemany=True) == {
+        "rows": 2,
+        "row": ["str"],
+    }
+
+
+async def test_sampled_slow_select_captures_plan():
+    engine, conn = _engine_returning_plan([{"Plan": {"Node Type": "Seq Scan"}}])
+    slow_log = SlowQueryLog(threshold_ms=10, explain_sample_rate=1.0)
+    statement = "SELECT * FROM incidents WHERE city = $1"
+
+    slow_log.record(engine, statement, ("Lyon",), False, 42.0)
+    await asyncio.gather(*slow_log._tasks)
+
+    conn.exec_driver_sql.assert_awaited_once_with(
+        f"EXPLAIN (FORMAT JSON) {statement}", ("Lyon",)
+    )
+    [plan] = slow_log.plans()
+    assert plan["fingerprint_id"] == fingerprint_id(fingerprint(statement))
+    assert plan["plan"] == [{"Plan": {"Node Type": "Seq Scan"}}]
+    assert plan["duration_ms"] == 42.0
+
+
+async def test_unsampled_or_non_select_statements_are_not_explained():
+    engine, conn = _engine_returning_plan(None)
+
+    SlowQueryLog(threshold_ms=10, explain_sample_rate=0.0).record(
+        engine, "SELECT 1", (), False, 50.0
+    )
+    SlowQueryLog(threshold_ms=10, explain_sample_rate=1.0).record(
+        engine, "CREATE INDEX ix ON t (c)", (), False, 50.0
+    )
+    await asyncio.sleep(0)
+
+    conn.exec_driver_sql.assert_not_awaited()
@@ -0,0 +1,118 @@
+import warnings
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.models import Incident, InterestPoint, VehiclePositionLog
+from app.services.spatial import (
+    BoundingBox,
+    SpatialService,
+    nearest_first,
+    within_bbox,
+    within_radius,
+)
+from tests.helpers import compiled_sql, requires_postgres
+
+
+def test_location_columns_are_generated_and_gist_indexed():
+    for model in (Incident, InterestPoint, VehiclePositionLog):
+        ddl = compiled_sql(CreateTable(model.__table__))
+        assert "geog geography(POINT,4326) GENERATED ALWAYS AS" in ddl
+        assert "ST_MakePoint(longitude, latitude)" in ddl
+
+        index = next(i for i in model.__table__.indexes if i.name.endswith("_geog"))
+        assert "USING gist (geog)" in compiled_sql(CreateIndex(index))
+
+
+def test_location_column_is_not_loaded_by_default():
+    sql = compiled_sql(select(Incident))
+    assert "geog" not in sql
+
+
+def test_spatial_predicates_use_index_operators():
+    stmt = (
+        select(InterestPoint.interest_point_id)
+        .where(within_radius(InterestPoint.geog, 45.76, 4.83, 1500))
+        .where(within_bbox(InterestPoint.geog, BoundingBox(45.0, 4.0, 46.0, 5.0)))
+        .order_by(nearest_first(InterestPoint.geog, 45.76, 4.83))
+    )
+    sql = compiled_sql(stmt)
+
+    assert "ST_DWithin(interest_points.geog" in sql
+    assert "interest_points.geog && CAST(ST_MakeEnvelope(" in sql
+    assert "ORDER BY interest_points.geog <-> CAST(" in sql
+
+
+async def test_vehicles_within_radius_bounds_partitions_by_time():
+    result = MagicMock()
+    result.all.return_value = []
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert (
+            await SpatialService(session).vehicles_within_radius(45.7, 4.8, 500, since)
+            == []
+        )
+
+    sql = compiled_sql(session.execute.await_args.args[0])
+    latest, outer = sql.split(") AS anon_1")
+    assert "DISTINCT ON (vehicle_position_logs.vehicle_id)" in latest
+    assert "vehicle_position_logs.timestamp >=" in latest
+    # Rayon appliqué à la dernière position, pas avant DISTINCT ON
+    assert "ST_DWithin" not in latest
+    assert "ST_DWithin(anon_1.geog" in outer
+
+
+@requires_postgres
+async def test_vehicle_that_left_the_radius_is_not_reported(postgres_engine):
+    type_id, stayed, left = uuid4(), uuid4(), uuid4()
+    now = datetime.now(timezone.utc)
+    async with postgres_engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO vehicle_types (vehicle_type_id, code, label) "
+                "VALUES (:id, 'VSAV', 'Secours')"
+            ),
+            {"id": type_id},
+        )
+        for vehicle_id, plate in ((stayed, "AA-111-AA"), (left, "BB-222-BB")):
+            await conn.execute(
+                text(
+                    "INSERT INTO vehicles (vehicle_id, vehicle_type_id, immatriculation) "
+                    "VALUES (:id, :type_id, :plate)"
+                ),
+                {"id": vehicle_id, "type_id": type_id, "plate": plate},
+            )
+        # `left` était au centre il y a 10 min, à ~20 km depuis 1 min
+        for vehicle_id, latitude, minutes_ago in (
+            (stayed, 45.7601, 5),
+            (left, 45.7600, 10),
+            (left, 45.9400, 1),
+        ):
+            await conn.execute(
+                text(
+                    "INSERT INTO vehicle_position_logs "
+                    "(vehicle_position_id, vehicle_id, latitude, longitude, timestamp) "
+                    "VALUES (gen_random_uuid(), :id, :latitude, 4.8300, :timestamp)"
+                ),
+                {
+                    "id": vehicle_id,
+                    "latitude": latitude,
+                    "timestamp": now - timedelta(minutes=minutes_ago),
+                },
+            )
+
+    async with AsyncSession(postgres_engine) as session:
+        nearby = await SpatialService(session).vehicles_within_radius(
+            45.7600, 4.8300, 1000, now - timedelta(minutes=30)
+        )
+
+    assert [position.vehicle_id for position, _ in nearby] == [stayed]
+    assert nearby[0][1] < 50
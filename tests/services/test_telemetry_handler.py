@@ -0,0 +1,282 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.services.events import Event
+from app.services.messaging.subscriber import QueueEvent
+from app.services.messaging.telemetry_handler import TelemetryHandler
+from tests.helpers import requires_postgres
+
+
+def _build_postgres(session: AsyncMock) -> MagicMock:
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    postgres = MagicMock()
+    postgres.sessionmaker.return_value = MagicMock(return_value=session_cm)
+    return postgres
+
+
+def _status_event(label: str) -> QueueEvent:
+    payload = {
+        "immatriculation": "AB-123-CD",
+        "status_label": label,
+        "timestamp": "2026-01-01T12:00:00+00:00",
+    }
+    return QueueEvent(
+        event=Event.VEHICLE_STATUS_UPDATE.value,
+        payload=payload,
+        queue="vehicle_telemetry",
+        raw={"payload": payload},
+    )
+
+
+def _rows_result(row):
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    return result
+
+
+def _status_result(vehicle_known=True, status_known=True, changed=False):
+    result = MagicMock()
+    result.one.return_value = (vehicle_known, status_known, changed)
+    return result
+
+
+def _returning_result(value):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = value
+    return result
+
+
+@pytest.mark.asyncio
+async def test_status_update_skips_unchanged_status_without_write():
+    session = AsyncMock()
+    session.scalar = AsyncMock(side_effect=[uuid.uuid4(), uuid.uuid4()])
+    session.execute = AsyncMock(return_value=_status_result())
+    sse_manager = MagicMock()
+    sse_manager.notify = AsyncMock()
+    handler = TelemetryHandler(_build_postgres(session), sse_manager)
+
+    await handler.handle_vehicle_status_update(_status_event("Disponible"))
+    await handler.handle_vehicle_status_update(_status_event("Disponible"))
+
+    # Ids are looked up once; each heartbeat costs one conditional UPDATE
+    # matching no row, without commit nor broadcast
+    assert session.scalar.await_count == 2
+    assert session.execute.await_count == 2
+    session.commit.assert_not_awaited()
+    sse_manager.notify.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_status_update_writes_and_notifies_on_change():
+    vehicle_id = uuid.uuid4()
+    session = AsyncMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _status_result(changed=True),
+            _returning_result(uuid.uuid4()),
+        ]
+    )
+    session.scalar = AsyncMock(side_effect=[vehicle_id, uuid.uuid4()])
+    sse_manager = MagicMock()
+    sse_manager.notify = AsyncMock()
+    handler = TelemetryHandler(_build_postgres(session), sse_manager)
+
+    await handler.handle_vehicle_status_update(_status_event("Sur intervention"))
+
+    # Conditional status update, then arrival update
+    assert session.execute.await_count == 2
+    session.commit.assert_awaited_once()
+    sse_manager.notify.assert_awaited_once()
+    event_name, payload = sse_manager.notify.await_args.args
+    assert event_name == Event.VEHICLE_STATUS_UPDATE.value
+    assert payload["vehicle_id"] == str(vehicle_id)
+    assert payload["status_label"] == "Sur intervention"
+
+
+@pytest.mark.asyncio
+async def test_status_update_compares_against_the_database_not_the_last_message():
+    vehicle_id = uuid.uuid4()
+    session = AsyncMock()
+    session.scalar = AsyncMock(side_effect=[vehicle_id, uuid.uuid4()])
+    # The vehicle is engaged, set back to "Disponible" through the API, then
+    # the gateway reports "Engagé" again: the database differs, so it is a
+    # real transition even though the label matches the previous message
+    session.execute = AsyncMock(
+        side_effect=[_status_result(changed=True), _status_result(changed=True)]
+    )
+    sse_manager = MagicMock()
+    sse_manager.notify = AsyncMock()
+    handler = TelemetryHandler(_build_postgres(session), sse_manager)
+
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+
+    assert session.commit.await_count == 2
+    assert sse_manager.notify.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_status_update_resolves_again_a_stale_cached_vehicle_id():
+    old_vehicle_id, new_vehicle_id, status_id = (uuid.uuid4() for _ in range(3))
+    session = AsyncMock()
+    session.scalar = AsyncMock(side_effect=[old_vehicle_id, status_id, new_vehicle_id])
+    # The vehicle was deleted then recreated under the same immatriculation:
+    # the cached id no longer maps to it, the UPDATE matches no row
+    session.execute = AsyncMock(
+        side_effect=[
+            _status_result(),
+            _status_result(vehicle_known=False),
+            _status_result(changed=True),
+            _status_result(),
+        ]
+    )
+    sse_manager = MagicMock()
+    sse_manager.notify = AsyncMock()
+    handler = TelemetryHandler(_build_postgres(session), sse_manager)
+
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+
+    # Only the vehicle id is read again; the fresh id is cached
+    assert session.scalar.await_count == 3
+    assert (
+        session.execute.await_args_list[2].args[1]["cached_vehicle_id"]
+        == new_vehicle_id
+    )
+    assert (
+        session.execute.await_args_list[3].args[1]["cached_vehicle_id"]
+        == new_vehicle_id
+    )
+    session.commit.assert_awaited_once()
+    _, payload = sse_manager.notify.await_args.args
+    assert payload["vehicle_id"] == str(new_vehicle_id)
+
+
+@pytest.mark.asyncio
+async def test_status_update_gives_up_when_the_vehicle_is_gone():
+    session = AsyncMock()
+    session.scalar = AsyncMock(side_effect=[uuid.uuid4(), uuid.uuid4(), None])
+    session.execute = AsyncMock(return_value=_status_result(vehicle_known=False))
+    sse_manager = MagicMock()
+    sse_manager.notify = AsyncMock()
+    handler = TelemetryHandler(_build_postgres(session), sse_manager)
+
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+
+    assert handler._vehicle_ids == {}
+    session.commit.assert_not_awaited()
+    sse_manager.notify.assert_not_awaited()
+
+
+@requires_postgres
+async def test_status_update_follows_a_recreated_vehicle(postgres_engine):
+    type_id, old_vehicle_id, new_vehicle_id = (uuid.uuid4() for _ in range(3))
+    insert_vehicle = text(
+        "INSERT INTO vehicles (vehicle_id, vehicle_type_id, immatriculation) "
+        "VALUES (:id, :type_id, 'AB-123-CD')"
+    )
+    async with postgres_engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO vehicle_types (vehicle_type_id, code, label) "
+                "VALUES (:id, 'VSAV', 'Secours')"
+            ),
+            {"id": type_id},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO vehicle_status (vehicle_status_id, label) "
+                "VALUES (gen_random_uuid(), 'Engagé')"
+            )
+        )
+        await conn.execute(insert_vehicle, {"id": old_vehicle_id, "type_id": type_id})
+    postgres = MagicMock()
+    postgres.sessionmaker.return_value = async_sessionmaker(postgres_engine)
+    sse_manager = MagicMock()
+    sse_manager.notify = AsyncMock()
+    handler = TelemetryHandler(postgres, sse_manager)
+
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+
+    # Supprimé puis recréé sous la même immatriculation sur un autre worker
+    async with postgres_engine.begin() as conn:
+        await conn.execute(
+            text("DELETE FROM vehicles WHERE vehicle_id = :id"),
+            {"id": old_vehicle_id},
+        )
+        await conn.execute(insert_vehicle, {"id": new_vehicle_id, "type_id": type_id})
+
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+    await handler.handle_vehicle_status_update(_status_event("Engagé"))
+
+    async with postgres_engine.begin() as conn:
+        status_label = await conn.scalar(
+            text(
+                "SELECT label FROM vehicles JOIN vehicle_status "
+                "ON vehicle_status_id = status_id WHERE vehicle_id = :id"
+            ),
+            {"id": new_vehicle_id},
+        )
+    assert status_label == "Engagé"
+    assert [
+        call.args[1]["vehicle_id"] for call in sse_manager.notify.await_args_list
+    ] == [
+        str(old_vehicle_id),
+        str(new_vehicle_id),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incident_phase_end_builds_payload_from_returning_rows():
+    vehicle_id = uuid.uuid4()
+    other_vehicle_id = uuid.uuid4()
+    incident_id = uuid.uuid4()
+    incident_phase_id = uuid.uuid4()
+
+    unassigned_result = MagicMock()
+    unassigned_result.scalars.return_value = [vehicle_id, other_vehicle_id]
+
+    session = AsyncMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _rows_result((vehicle_id, uuid.uuid4(), incident_phase_id, incident_id)),
+            MagicMock(),
+            unassigned_result,
+            _returning_result(incident_id),
+        ]
+    )
+    sse_manager = MagicMock()
+    sse_manager.notify = AsyncMock()
+    handler = TelemetryHandler(_build_postgres(session), sse_manager)
+
+    payload = {
+        "immatriculation": "AB-123-CD",
+        "status": 1,
+        "timestamp": "2026-01-01T12:00:00+00:00",
+    }
+    await handler.handle_incident_status_update(
+        QueueEvent(
+            event=Event.INCIDENT_STATUS_UPDATE.value,
+            payload=payload,
+            queue="incident_telemetry",
+            raw={"payload": payload},
+        )
+    )
+
+    assert session.execute.await_count == 4
+    session.commit.assert_awaited_once()
+    event_name, status_payload = sse_manager.notify.await_args_list[0].args
+    assert event_name == Event.INCIDENT_STATUS_UPDATE.value
+    assert status_payload["incident_id"] == str(incident_id)
+    assert status_payload["unassigned_vehicle_ids"] == [
+        str(vehicle_id),
+        str(other_vehicle_id),
+    ]
+    assert status_payload["incident_ended"] is True
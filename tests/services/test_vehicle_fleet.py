@@ -0,0 +1,269 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Vehicle
+from app.models.change_versions import CHANGE_VERSION_DDL
+from app.services.vehicles import (
+    _CHANGED_FLEET_RELATION_ROWS,
+    _FLEET_ASSIGNMENT_ROWS,
+    _FLEET_CHANGED_VEHICLE_ROWS,
+    _FLEET_SUMMARY_ROWS,
+    VehicleService,
+)
+from tests.helpers import compiled_sql, requires_postgres
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+async def test_fleet_is_built_from_core_rows():
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    vehicle_id, idle_vehicle_id = uuid4(), uuid4()
+    type_id, energy_id, status_id, base_id = uuid4(), uuid4(), uuid4(), uuid4()
+    consumable_type_id, assignment_id = uuid4(), uuid4()
+
+    vehicle_rows = [
+        (
+            vehicle_id,
+            "AB-123-CD",
+            0.8,
+            type_id,
+            "VSAV",
+            "Secours",
+            energy_id,
+            "Diesel",
+            status_id,
+            "Engagé",
+            base_id,
+            "Caserne",
+            None,
+            None,
+            "Lyon",
+            45.7,
+            4.8,
+            812,
+        ),
+        (idle_vehicle_id, "EF-456-GH", None, type_id, "VSAV", "Secours")
+        + (None,) * 11
+        + (790,),
+    ]
+    session = AsyncMock()
+    session.scalar = AsyncMock(return_value=815)
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(vehicle_rows),
+            [(vehicle_id, consumable_type_id, "Eau", "L", Decimal("300"), now)],
+            [(vehicle_id, assignment_id, None, now, None, None)],
+            [(vehicle_id, 45.75, 4.85, now)],
+        ]
+    )
+    session.scalars = AsyncMock(return_value=_result([vehicle_id]))
+
+    fleet = await VehicleService(session).fetch_fleet()
+
+    assert fleet.total == 2
+    assert fleet.version == 815
+    assert fleet.deleted_vehicle_ids == []
+    engaged, idle = fleet.vehicles
+    assert engaged.energy.label == "Diesel"
+    assert engaged.status.label == "Engagé"
+    assert engaged.base_interest_point.city == "Lyon"
+    assert engaged.consumable_stocks[0].consumable_type.label == "Eau"
+    assert engaged.active_assignment.vehicle_assignment_id == assignment_id
+    assert engaged.current_position.latitude == 45.75
+    assert engaged.referenced_in_pending_proposal is True
+    assert engaged.change_version == 812
+
+    assert idle.energy is None and idle.status is None
+    assert idle.base_interest_point is None
+    assert idle.consumable_stocks == []
+    assert idle.active_assignment is None
+    assert idle.current_position is None
+    assert idle.referenced_in_pending_proposal is False
+    assert session.execute.await_count == 4
+
+
+def test_only_active_assignments_are_loaded():
+    sql = compiled_sql(_FLEET_ASSIGNMENT_ROWS)
+    assert "WHERE vehicle_assignments.unassigned_at IS NULL" in sql
+
+    primaryjoin = compiled_sql(Vehicle.active_assignment.property.primaryjoin)
+    assert "vehicle_assignments.unassigned_at IS NULL" in primaryjoin
+
+
+async def test_delta_returns_changed_vehicles_and_tombstones():
+    vehicle_id, deleted_id, type_id = uuid4(), uuid4(), uuid4()
+    session = AsyncMock()
+    session.scalar = AsyncMock(return_value=900)
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(
+                [
+                    (vehicle_id, "AB-123-CD", None, type_id, "VSAV", "Secours")
+                    + (None,) * 11
+                    + (870,)
+                ]
+            ),
+            [],
+            [],
+            [],
+        ]
+    )
+    session.scalars = AsyncMock(
+        side_effect=[_result([deleted_id]), _result([])],
+    )
+
+    fleet = await VehicleService(session).fetch_fleet(since=850)
+
+    assert [vehicle.vehicle_id for vehicle in fleet.vehicles] == [vehicle_id]
+    assert fleet.deleted_vehicle_ids == [deleted_id]
+    assert fleet.version == 900
+    changed_vehicles, params = session.execute.await_args_list[0].args
+    assert changed_vehicles is _FLEET_CHANGED_VEHICLE_ROWS
+    assert params == {"since": 850}
+    for call in session.execute.await_args_list[1:]:
+        assert call.args[1] == {"vehicle_ids": [vehicle_id]}
+
+
+async def test_delta_without_changes_skips_relation_queries():
+    session = AsyncMock()
+    session.scalar = AsyncMock(return_value=900)
+    session.execute = AsyncMock(return_value=_result([]))
+    session.scalars = AsyncMock(return_value=_result([]))
+
+    fleet = await VehicleService(session).fetch_fleet(since=900)
+
+    assert fleet.vehicles == [] and fleet.deleted_vehicle_ids == []
+    assert session.execute.await_count == 1
+
+
+def test_delta_statements_filter_on_versions_and_ids():
+    sql = compiled_sql(_FLEET_CHANGED_VEHICLE_ROWS)
+    assert "vehicles.change_version >= %(since)s" in sql
+    # Positions bornées par leur transaction d'insertion, pas par horodatage
+    assert "vehicle_position_logs.received_version >= %(since)s" in sql
+    assert "vehicle_position_logs.timestamp" not in sql
+    for statement in _CHANGED_FLEET_RELATION_ROWS:
+        assert "= ANY (%(vehicle_ids)s::UUID[])" in compiled_sql(statement)
+
+
+def test_change_version_triggers_cover_the_fleet_view():
+    statements = "\n".join(str(ddl.statement) for ddl in CHANGE_VERSION_DDL)
+    for table in (
+        "vehicle_consumables_stock",
+        "vehicle_assignments",
+        "vehicle_assignment_proposal_items",
+        "vehicle_assignment_proposals",
+        "interest_points",
+    ):
+        assert f"ON {table}" in statements
+    assert "INSERT INTO vehicle_tombstones" in statements
+    # Les positions bornent le delta par `received_version`, sans toucher `vehicles`
+    assert "CREATE OR REPLACE TRIGGER vehicle_position_logs" not in statements
+
+
+async def test_summary_view_reads_only_vehicles_and_positions():
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    vehicle_id, type_id, status_id = uuid4(), uuid4(), uuid4()
+    session = AsyncMock()
+    session.scalar = AsyncMock(return_value=815)
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(
+                [
+                    (vehicle_id, "AB-123-CD", type_id, "VSAV", "Secours")
+                    + (status_id, "Engagé", 812)
+                ]
+            ),
+            [(vehicle_id, 45.75, 4.85, now)],
+        ]
+    )
+
+    fleet = await VehicleService(session).fetch_fleet_summary()
+
+    assert session.execute.await_count == 2
+    session.scalars.assert_not_awaited()
+    (vehicle,) = fleet.vehicles
+    assert vehicle.status.label == "Engagé"
+    assert vehicle.current_position.latitude == 45.75
+    assert fleet.version == 815
+
+    sql = compiled_sql(_FLEET_SUMMARY_ROWS)
+    assert "interest_points" not in sql and "energies" not in sql
+
+
+async def test_delta_returns_moved_vehicles_with_their_latest_position():
+    moved_at = datetime(2026, 1, 1, 0, 5, tzinfo=timezone.utc)
+    moved_id, type_id = uuid4(), uuid4()
+    session = AsyncMock()
+    session.scalar = AsyncMock(return_value=900)
+    session.execute = AsyncMock(
+        side_effect=[
+            _result(
+                [(moved_id, "AB-123-CD", type_id, "VSAV", "Secours", None, None, 12)]
+            ),
+            [(moved_id, 45.75, 4.85, moved_at)],
+        ]
+    )
+    session.scalars = AsyncMock(return_value=_result([]))
+
+    fleet = await VehicleService(session).fetch_fleet_summary(since=900)
+
+    assert [vehicle.vehicle_id for vehicle in fleet.vehicles] == [moved_id]
+    assert fleet.vehicles[0].current_position.timestamp == moved_at
+    assert fleet.version == 900
+    assert session.execute.await_args_list[0].args[1] == {"since": 900}
+
+
+@requires_postgres
+async def test_delta_returns_positions_committed_late_with_older_timestamps(
+    postgres_engine,
+):
+    type_id, ahead, late = uuid4(), uuid4(), uuid4()
+    now = datetime.now(timezone.utc)
+
+    async def insert_position(vehicle_id, timestamp):
+        async with postgres_engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO vehicle_position_logs "
+                    "(vehicle_position_id, vehicle_id, latitude, longitude, timestamp) "
+                    "VALUES (gen_random_uuid(), :id, 45.76, 4.83, :timestamp)"
+                ),
+                {"id": vehicle_id, "timestamp": timestamp},
+            )
+
+    async with postgres_engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO vehicle_types (vehicle_type_id, code, label) "
+                "VALUES (:id, 'VSAV', 'Secours')"
+            ),
+            {"id": type_id},
+        )
+        for vehicle_id, plate in ((ahead, "AA-111-AA"), (late, "BB-222-BB")):
+            await conn.execute(
+                text(
+                    "INSERT INTO vehicles (vehicle_id, vehicle_type_id, immatriculation) "
+                    "VALUES (:id, :type_id, :plate)"
+                ),
+                {"id": vehicle_id, "type_id": type_id, "plate": plate},
+            )
+    await insert_position(ahead, now)
+    async with AsyncSession(postgres_engine) as session:
+        version = (await VehicleService(session).fetch_fleet_summary()).version
+
+    # Reçue après la lecture, horodatée avant la position la plus récente lue
+    await insert_position(late, now - timedelta(minutes=10))
+    async with AsyncSession(postgres_engine) as session:
+        delta = await VehicleService(session).fetch_fleet_summary(since=version)
+
+    assert [vehicle.vehicle_id for vehicle in delta.vehicles] == [late]